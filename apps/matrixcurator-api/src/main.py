@@ -1,9 +1,13 @@
+import asyncio
 import logging
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from apps.fastapi.src.routers.document import router as document_router
 from apps.fastapi.src.routers.agent import router as agent_router
+from apps.fastapi.src.routers.jobs import router as jobs_router
 from matrixcurator import settings
+from matrixcurator.modules.jobs.services import JobWorkerPool
+from matrixcurator.modules.tools.docling import get_converter_pool
 from apps.fastapi.src.dependencies import client
 
 logger = logging.getLogger(__name__)
@@ -26,10 +30,27 @@ app.add_middleware(
 # Include routers
 app.include_router(document_router)
 app.include_router(agent_router)
+app.include_router(jobs_router)
+
+# Background workers for queued extraction jobs
+job_pool = JobWorkerPool(client)
+
+async def warm_docling_converters():
+    # Loads the Docling models in the background so the first parse request doesn't pay for it
+    try:
+        await asyncio.to_thread(get_converter_pool().warm)
+    except Exception as e:
+        logger.warning(f"Failed to warm Docling converters: {str(e)}")
 
 @app.on_event("startup")
 async def startup_event():
     logger.info("Starting MatrixCurator API")
+    await job_pool.start()
+    app.state.docling_warmup = asyncio.create_task(warm_docling_converters())
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    await job_pool.stop()
 
 @app.get("/health")
 async def health_check():
@@ -1,5 +1,6 @@
 from fastapi import APIRouter, HTTPException, Depends
-from matrixcurator import MatrixCuratorClient, ExtractRequest, ExtractResponse
+from fastapi.responses import StreamingResponse
+from matrixcurator import MatrixCuratorClient, ExtractRequest, ExtractResponse, ExtractStreamEvent
 from apps.fastapi.src.dependencies import get_client
 
 router = APIRouter(prefix="/api/v1/agent", tags=["agent"])
@@ -20,3 +21,16 @@ async def extract_data(request: ExtractRequest, client: MatrixCuratorClient = De
         )
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
+
+@router.post("/extract/stream")
+async def stream_extract_data(request: ExtractRequest, client: MatrixCuratorClient = Depends(get_client)):
+    """Streams one NDJSON line per character as soon as its extraction finishes."""
+    async def event_stream():
+        async for event in client.stream_characters(
+            context=request.context,
+            character_indices=request.character_indices,
+            user_id=request.user_id
+        ):
+            yield ExtractStreamEvent(**event).model_dump_json() + "\n"
+
+    return StreamingResponse(event_stream(), media_type="application/x-ndjson")
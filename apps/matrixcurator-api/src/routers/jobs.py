@@ -0,0 +1,30 @@
+from fastapi import APIRouter, HTTPException
+from matrixcurator import ExtractRequest
+from matrixcurator.modules.jobs.schemas import (
+    JobStatus,
+    JobSubmitResponse,
+    JobStatusResponse,
+    JobResultsResponse,
+)
+from matrixcurator.modules.jobs.services import submit_job, get_job_status, get_job_results
+
+router = APIRouter(prefix="/api/v1/jobs", tags=["jobs"])
+
+@router.post("", response_model=JobSubmitResponse, status_code=202)
+async def submit_extraction_job(request: ExtractRequest):
+    job_id = submit_job(request)
+    return JobSubmitResponse(job_id=job_id, status=JobStatus.QUEUED)
+
+@router.get("/{job_id}", response_model=JobStatusResponse)
+async def get_extraction_job(job_id: str):
+    status = get_job_status(job_id)
+    if status is None:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+    return status
+
+@router.get("/{job_id}/results", response_model=JobResultsResponse)
+async def get_extraction_job_results(job_id: str):
+    results = get_job_results(job_id)
+    if results is None:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+    return results
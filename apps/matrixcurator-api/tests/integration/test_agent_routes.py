@@ -1,3 +1,4 @@
+import json
 import pytest
 from fastapi.testclient import TestClient
 from unittest.mock import AsyncMock, MagicMock
@@ -67,3 +68,30 @@ def test_extract_data_validation_error():
     response = client.post("/api/v1/agent/extract", json=payload)
     
     assert response.status_code == 422 # Unprocessable Entity
+
+def test_stream_extract_data_success():
+    mock_client = MagicMock()
+    app.dependency_overrides[get_client] = lambda: mock_client
+
+    # Arrange
+    async def fake_stream(**kwargs):
+        yield {"character_index": 2, "extracted_data": {"character_index": 2, "character_name": "Tail"}, "evaluation_score": 10, "errors": []}
+        yield {"character_index": 1, "extracted_data": None, "evaluation_score": 0, "errors": ["Failed to extract character 1: boom"]}
+
+    mock_client.stream_characters = fake_stream
+
+    payload = {
+        "context": "Eye color is blue (0).",
+        "character_indices": [1, 2]
+    }
+
+    # Act
+    response = client.post("/api/v1/agent/extract/stream", json=payload)
+
+    # Assert
+    assert response.status_code == 200, response.text
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    events = [json.loads(line) for line in response.text.splitlines() if line]
+    assert [e["character_index"] for e in events] == [2, 1]
+    assert events[0]["extracted_data"]["character_name"] == "Tail"
+    assert events[1]["errors"] == ["Failed to extract character 1: boom"]
@@ -0,0 +1,48 @@
+import pytest
+from fastapi.testclient import TestClient
+from unittest.mock import patch
+from apps.fastapi.src.main import app
+from matrixcurator.modules.jobs.schemas import JobStatus, JobStatusResponse
+
+client = TestClient(app)
+
+@patch("apps.fastapi.src.routers.jobs.submit_job")
+def test_submit_extraction_job(mock_submit):
+    # Arrange
+    mock_submit.return_value = "job-123"
+    payload = {
+        "context": "Eye color is blue (0).",
+        "character_indices": [1, 2]
+    }
+
+    # Act
+    response = client.post("/api/v1/jobs", json=payload)
+
+    # Assert
+    assert response.status_code == 202, response.text
+    assert response.json() == {"job_id": "job-123", "status": "queued"}
+
+@patch("apps.fastapi.src.routers.jobs.get_job_status")
+def test_get_extraction_job_progress(mock_status):
+    # Arrange
+    mock_status.return_value = JobStatusResponse(
+        job_id="job-123", status=JobStatus.RUNNING, completed=1, total=2, created_at=0.0, updated_at=1.0
+    )
+
+    # Act
+    response = client.get("/api/v1/jobs/job-123")
+
+    # Assert
+    assert response.status_code == 200, response.text
+    data = response.json()
+    assert data["status"] == "running"
+    assert data["completed"] == 1
+    assert data["total"] == 2
+
+@patch("apps.fastapi.src.routers.jobs.get_job_results")
+def test_get_extraction_job_results_not_found(mock_results):
+    mock_results.return_value = None
+
+    response = client.get("/api/v1/jobs/missing/results")
+
+    assert response.status_code == 404
@@ -119,70 +119,49 @@ async def preparse_documents(
                 needs_save = False
                 continue
 
-            pymupdf_pages = []
-            docling_pages = []
-            doc_needs_update = False
-
-            async def process_page(page_num: int):
-                pymupdf_content = get_existing_page_content("pymupdf", page_num)
-                docling_content = get_existing_page_content("docling", page_num)
-                
-                pymupdf_text = pymupdf_content
-                docling_text = docling_content
-                
-                pymupdf_task = None
-                docling_task = None
-                
-                if pymupdf_content is None:
-                    pymupdf_task = parse_with_pymupdf.ainvoke({
-                        "file_content": file_bytes,
-                        "filename": filename,
-                        "pages": [page_num],
-                    })
-                
-                if docling_content is None:
-                    docling_task = parse_with_docling.ainvoke({
+            # Parse only the pages each parser is still missing, in one call per parser
+            parsed_by_parser: dict[str, dict[int, str]] = {"pymupdf": {}, "docling": {}}
+            missing_by_parser: dict[str, list[int]] = {"pymupdf": [], "docling": []}
+            for page_num in range(1, total_pages + 1):
+                for parser_name in parsed_by_parser:
+                    content = get_existing_page_content(parser_name, page_num)
+                    if content is None:
+                        missing_by_parser[parser_name].append(page_num)
+                    else:
+                        parsed_by_parser[parser_name][page_num] = content
+
+            async def parse_missing(parser_name: str, parse_tool: Any) -> None:
+                missing_pages = missing_by_parser[parser_name]
+                if not missing_pages:
+                    return
+                try:
+                    parsed = await parse_tool.ainvoke({
                         "file_content": file_bytes,
                         "filename": filename,
-                        "pages": [page_num],
+                        "pages": missing_pages,
+                        "by_page": True,
                     })
-
-                if pymupdf_task or docling_task:
-                    results = await asyncio.gather(
-                        pymupdf_task if pymupdf_task else asyncio.sleep(0),
-                        docling_task if docling_task else asyncio.sleep(0),
-                        return_exceptions=True
-                    )
-                    
-                    if pymupdf_task:
-                        res = results[0]
-                        if isinstance(res, Exception):
-                            logger.exception("PyMuPDF failed on %s page %s", document_id, page_num)
-                            pymupdf_text = f"Error: {str(res)}"
-                        else:
-                            pymupdf_text = res
-                            
-                    if docling_task:
-                        res = results[1]
-                        if isinstance(res, Exception):
-                            logger.exception("Docling failed on %s page %s", document_id, page_num)
-                            docling_text = f"Error: {str(res)}"
-                        else:
-                            docling_text = res
-
-                return (page_num, pymupdf_text, docling_text, pymupdf_content is None or docling_content is None)
-
-            tasks = [process_page(page_num) for page_num in range(1, total_pages + 1)]
-            results = await asyncio.gather(*tasks)
-
-            for page_num, pymupdf_text, docling_text, was_updated in results:
-                pymupdf_pages.append({"page": page_num, "content": pymupdf_text})
-                docling_pages.append({"page": page_num, "content": docling_text})
-                if was_updated:
-                    doc_needs_update = True
-
-            pymupdf_pages.sort(key=lambda x: x["page"])
-            docling_pages.sort(key=lambda x: x["page"])
+                    contents = {pg["page"]: pg["content"] for pg in parsed["pages"]}
+                except Exception as e:
+                    logger.exception("%s failed on %s pages %s", parser_name, document_id, missing_pages)
+                    contents = {page_num: f"Error: {str(e)}" for page_num in missing_pages}
+                for page_num in missing_pages:
+                    parsed_by_parser[parser_name][page_num] = contents.get(page_num, "")
+
+            await asyncio.gather(
+                parse_missing("pymupdf", parse_with_pymupdf),
+                parse_missing("docling", parse_with_docling),
+            )
+
+            doc_needs_update = any(missing_by_parser.values())
+            pymupdf_pages = [
+                {"page": page_num, "content": content}
+                for page_num, content in sorted(parsed_by_parser["pymupdf"].items())
+            ]
+            docling_pages = [
+                {"page": page_num, "content": content}
+                for page_num, content in sorted(parsed_by_parser["docling"].items())
+            ]
 
             if not doc_needs_update and existing_parses:
                 updated_parses = existing_parses
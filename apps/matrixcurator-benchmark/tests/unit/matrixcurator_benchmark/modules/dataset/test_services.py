@@ -153,6 +153,48 @@ async def test_preparse_documents_limit_preserves_dataset(mock_exists, mock_make
             # Only the first document should have been parsed
             assert result[0]["text"] == [{"parser": "txt", "pages": [{"page": 1, "content": "parsed text"}]}]
 
+@pytest.mark.asyncio
+@patch("matrixcurator_benchmark.modules.dataset.services.fitz.open")
+@patch("matrixcurator_benchmark.modules.dataset.services.os.path.exists")
+async def test_preparse_documents_pdf_parses_missing_pages_in_one_call(mock_exists, mock_fitz_open):
+    mock_exists.return_value = True
+    mock_fitz_open.return_value.page_count = 3
+
+    existing = [
+        {"parser": "pymupdf", "pages": [{"page": 1, "content": "cached 1"}, {"page": 2, "content": "Error: boom"}]},
+        {"parser": "docling", "pages": [{"page": 1, "content": "cached 1"}, {"page": 2, "content": "cached 2"}]},
+    ]
+    records = [{"id": "doc1", "mime_type": "application/pdf", "filename": "a.pdf", "file_bytes": b"pdf", "text": existing}]
+    mock_repository = MagicMock()
+    mock_repository.read_documents.return_value = records
+
+    def by_page(parser_name):
+        async def _ainvoke(args):
+            return {"parser": parser_name, "pages": [{"page": p, "content": f"{parser_name} {p}"} for p in args["pages"]]}
+        return _ainvoke
+
+    pymupdf_tool, docling_tool = MagicMock(), MagicMock()
+    pymupdf_tool.ainvoke = AsyncMock(side_effect=by_page("pymupdf"))
+    docling_tool.ainvoke = AsyncMock(side_effect=by_page("docling"))
+
+    with patch("matrixcurator_benchmark.modules.dataset.services.parse_with_pymupdf", pymupdf_tool), \
+         patch("matrixcurator_benchmark.modules.dataset.services.parse_with_docling", docling_tool):
+        result = await preparse_documents(mock_repository, "dummy_path")
+
+    pymupdf_tool.ainvoke.assert_awaited_once()
+    assert pymupdf_tool.ainvoke.call_args.args[0]["pages"] == [2, 3]
+    docling_tool.ainvoke.assert_awaited_once()
+    assert docling_tool.ainvoke.call_args.args[0]["pages"] == [3]
+
+    assert result[0]["text"] == [
+        {"parser": "pymupdf", "pages": [
+            {"page": 1, "content": "cached 1"}, {"page": 2, "content": "pymupdf 2"}, {"page": 3, "content": "pymupdf 3"},
+        ]},
+        {"parser": "docling", "pages": [
+            {"page": 1, "content": "cached 1"}, {"page": 2, "content": "cached 2"}, {"page": 3, "content": "docling 3"},
+        ]},
+    ]
+
 @pytest.mark.asyncio
 async def test_sync_datasets_filters_character_states_by_document():
     mock_parquet_repository = MagicMock()
@@ -0,0 +1,73 @@
+"""
+Measures cold-start cost of importing matrixcurator entry points.
+
+Each statement runs in a fresh interpreter, so nothing is shared between runs;
+the table reports median wall time, peak RSS and how many modules were loaded:
+
+    python benchmarks/bench_import_time.py --repeat 5
+    python benchmarks/bench_import_time.py --statement "from matrixcurator import parse_with_pymupdf"
+
+Set EAGER_IMPORT=1 to load every lazy attribute up front and compare against the
+old eager package imports.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+DEFAULT_STATEMENTS = [
+    "import matrixcurator",
+    "from matrixcurator import settings",
+    "from matrixcurator import parse_with_pymupdf",
+    "from matrixcurator import MatrixCuratorClient",
+    "from matrixcurator import agent_graph",
+]
+
+_PROBE = """
+import json, resource, sys, time
+start = time.perf_counter()
+exec({statement!r})
+elapsed = time.perf_counter() - start
+print(json.dumps({{
+    "seconds": elapsed,
+    "modules": len(sys.modules),
+    "max_rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+}}))
+"""
+
+
+def measure(statement: str, env: dict) -> dict:
+    result = subprocess.run(
+        [sys.executable, "-c", _PROBE.format(statement=statement)],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--statement", action="append", dest="statements")
+    args = parser.parse_args()
+
+    env = dict(os.environ)
+    # Keep the checkpoint databases out of the working directory
+    env.setdefault("CHECKPOINT_BACKEND", "memory")
+
+    for statement in args.statements or DEFAULT_STATEMENTS:
+        runs = [measure(statement, env) for _ in range(args.repeat)]
+        seconds = statistics.median(run["seconds"] for run in runs)
+        rss_mb = max(run["max_rss_kb"] for run in runs) / 1024
+        print(
+            f"{statement:<48} {seconds * 1000:9.1f} ms"
+            f"  {rss_mb:8.1f} MB  {runs[-1]['modules']:6d} modules"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Compares single-process PyMuPDF text extraction against the page-parallel mode.
+
+    python benchmarks/bench_pdf_parsing.py --pages 300 --workers 4
+    python benchmarks/bench_pdf_parsing.py --file monograph.pdf --workers 8
+"""
+import argparse
+import os
+import time
+
+import fitz  # PyMuPDF
+
+from matrixcurator.modules.document.repositories.pdf import get_pool, read_pdf_pages
+
+
+def make_pdf(pages: int) -> bytes:
+    doc = fitz.open()
+    paragraph = "Character 12: dorsal fin spines (0) absent; (1) present. " * 40
+    for i in range(pages):
+        page = doc.new_page()
+        page.insert_textbox(fitz.Rect(36, 36, 559, 806), f"Page {i + 1}\n{paragraph}", fontsize=8)
+    content = doc.tobytes()
+    doc.close()
+    return content
+
+
+def concat_baseline(file_content: bytes) -> str:
+    # The previous implementation: one process, `+=` per page
+    doc = fitz.open(stream=file_content, filetype="pdf")
+    text = ""
+    for page in doc:
+        text += page.get_text()
+    return text
+
+
+def timed(label: str, fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    print(f"{label:<28} {best * 1000:9.1f} ms")
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--file", help="PDF to parse instead of a generated one")
+    parser.add_argument("--pages", type=int, default=300)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 2)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    if args.file:
+        with open(args.file, "rb") as f:
+            content = f.read()
+    else:
+        content = make_pdf(args.pages)
+
+    # Start the pool outside the timed region, as a long-lived worker would
+    pool = get_pool(args.workers)
+    pool.submit(int).result()
+
+    baseline = timed("single process, +=", lambda: concat_baseline(content), args.repeat)
+    timed("single process, join", lambda: read_pdf_pages(content, workers=1), args.repeat)
+    parallel = timed(
+        f"process pool ({args.workers} workers)",
+        lambda: read_pdf_pages(content, workers=args.workers),
+        args.repeat,
+    )
+    print(f"speedup vs baseline: {baseline / parallel:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
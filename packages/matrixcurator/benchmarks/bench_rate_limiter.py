@@ -0,0 +1,88 @@
+"""
+Measures AsyncRateLimiter.acquire throughput against the previous list-scan limiter.
+
+Limits are set high enough that no call has to sleep, so the numbers are pure
+bookkeeping cost per acquire:
+
+    python benchmarks/bench_rate_limiter.py --calls 20000
+    python benchmarks/bench_rate_limiter.py --calls 50000 --per-hour 1000000
+"""
+import argparse
+import asyncio
+import time
+from typing import Optional
+
+from matrixcurator.utils.concurrency import AsyncRateLimiter, RateLimitConfig
+
+
+class ListScanRateLimiter:
+    # The previous implementation: rescans every call in the window on each acquire
+    def __init__(self, settings: RateLimitConfig) -> None:
+        self.limits = [
+            (limit, period)
+            for limit, period in (
+                (settings.per_second, 1.0),
+                (settings.per_minute, 60.0),
+                (settings.per_hour, 3600.0),
+            )
+            if limit
+        ]
+        self.calls: list[float] = []
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                max_sleep = 0.0
+                for max_calls, time_period in self.limits:
+                    recent_calls = [t for t in self.calls if t > now - time_period]
+                    if len(recent_calls) >= max_calls:
+                        max_sleep = max(max_sleep, time_period - (now - recent_calls[0]))
+                if max_sleep > 0:
+                    await asyncio.sleep(max_sleep)
+                else:
+                    break
+            now = time.monotonic()
+            self.calls.append(now)
+            max_period = max(limit[1] for limit in self.limits)
+            self.calls = [t for t in self.calls if now - t <= max_period]
+
+
+async def measure(limiter, calls: int, concurrency: Optional[int]) -> float:
+    start = time.perf_counter()
+    if concurrency:
+        async def worker(n: int) -> None:
+            for _ in range(n):
+                await limiter.acquire()
+
+        await asyncio.gather(*(worker(calls // concurrency) for _ in range(concurrency)))
+    else:
+        for _ in range(calls):
+            await limiter.acquire()
+    return calls / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--calls", type=int, default=20000)
+    parser.add_argument("--per-second", type=int, default=100000)
+    parser.add_argument("--per-hour", type=int, default=10000000)
+    parser.add_argument("--concurrency", type=int, default=100)
+    args = parser.parse_args()
+
+    config = RateLimitConfig(per_second=args.per_second, per_hour=args.per_hour)
+    for label, factory in [
+        ("list scan (previous)", ListScanRateLimiter),
+        ("deque slots", lambda settings: AsyncRateLimiter(settings=settings)),
+    ]:
+        sequential = asyncio.run(measure(factory(config), args.calls, None))
+        concurrent = asyncio.run(measure(factory(config), args.calls, args.concurrency))
+        print(
+            f"{label:<22} {sequential:12,.0f} acquires/s sequential"
+            f"  {concurrent:12,.0f} acquires/s with {args.concurrency} tasks"
+        )
+
+
+if __name__ == "__main__":
+    main()
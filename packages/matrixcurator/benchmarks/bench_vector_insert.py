@@ -0,0 +1,98 @@
+"""
+Measures SQLite vector store ingest throughput against the previous per-row path.
+
+Needs a Python whose sqlite3 module can load extensions (for sqlite-vec). Each
+run writes into a fresh database in a temporary directory:
+
+    python benchmarks/bench_vector_insert.py --rows 5000
+    python benchmarks/bench_vector_insert.py --rows 20000 --dim 768 --batch-size 2000
+"""
+import argparse
+import json
+import random
+import tempfile
+import time
+from pathlib import Path
+from typing import List
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from matrixcurator.config.main import settings
+from matrixcurator.modules.retrieval.repositories import sqlite as sqlite_repository
+from matrixcurator.modules.retrieval.schemas import DocumentChunk
+
+
+def per_row_insert(chunks: List[DocumentChunk]) -> None:
+    # The previous implementation: ORM merge plus a JSON-encoded vector per row
+    engine = sqlite_repository.get_engine()
+    vec_table = sqlite_repository.get_vec_table()
+    with Session(engine) as session:
+        for chunk in chunks:
+            session.merge(
+                sqlite_repository.DocumentChunkMeta(
+                    id=chunk["id"],
+                    document_id=chunk["document_id"],
+                    parser_name=chunk["metadata"].get("parser_name"),
+                    content=chunk["content"],
+                    metadata_json=json.dumps(chunk["metadata"]),
+                )
+            )
+            session.execute(
+                text(f"INSERT INTO {vec_table} (id, embedding) VALUES (:id, :emb)"),
+                {"id": chunk["id"], "emb": json.dumps(chunk["embedding"])},
+            )
+        session.commit()
+
+
+def make_chunks(rows: int, dim: int) -> List[DocumentChunk]:
+    rng = random.Random(0)
+    return [
+        {
+            "id": f"chunk_{i}",
+            "document_id": f"doc_{i // 100}",
+            "content": f"Chunk {i} " + "lorem ipsum " * 40,
+            "metadata": {"parser_name": "docling", "page": i % 50},
+            "embedding": [rng.uniform(-1, 1) for _ in range(dim)],
+        }
+        for i in range(rows)
+    ]
+
+
+def measure(insert, chunks: List[DocumentChunk], db_path: Path) -> float:
+    settings.sqlite_db_path = str(db_path)
+    sqlite_repository._engine = None
+    sqlite_repository.get_vec_table()
+
+    start = time.perf_counter()
+    insert(chunks)
+    elapsed = time.perf_counter() - start
+
+    sqlite_repository.get_engine().dispose()
+    return len(chunks) / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=5000)
+    parser.add_argument("--dim", type=int, default=3072)
+    parser.add_argument("--batch-size", type=int, default=settings.sqlite_insert_batch_size)
+    args = parser.parse_args()
+
+    settings.embedding_dimension = args.dim
+    chunks = make_chunks(args.rows, args.dim)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for label, insert in [
+            ("per-row merge + JSON (previous)", per_row_insert),
+            (
+                "bulk executemany + float32",
+                lambda batch: sqlite_repository.insert_chunks(batch, batch_size=args.batch_size),
+            ),
+        ]:
+            rows_per_second = measure(insert, chunks, Path(tmp) / f"{len(label)}.sqlite")
+            print(f"{label:<34} {rows_per_second:12,.0f} rows/s  ({args.rows} rows, dim {args.dim})")
+
+
+if __name__ == "__main__":
+    main()
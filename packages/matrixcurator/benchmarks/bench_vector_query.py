@@ -0,0 +1,131 @@
+"""
+Measures query_similar_chunks latency as the SQLite vector store grows, against
+the previous full-scan query (vec_distance_cosine over a JOIN, ORDER BY/LIMIT).
+
+Needs a Python whose sqlite3 module can load extensions (for sqlite-vec). Each
+size is loaded into a fresh database in a temporary directory:
+
+    python benchmarks/bench_vector_query.py --sizes 10000 50000 200000
+    python benchmarks/bench_vector_query.py --sizes 100000 --dim 768 --chunks-per-document 200
+"""
+import argparse
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+from sqlalchemy import text
+
+from matrixcurator.config.main import settings
+from matrixcurator.modules.retrieval.repositories import sqlite as sqlite_repository
+
+_FULL_SCAN_SQL = """
+    SELECT m.id, m.document_id, m.content, m.metadata_json
+    FROM {table} v
+    JOIN document_chunks_meta m ON v.id = m.id
+    WHERE vec_distance_cosine(v.embedding, :query_emb) <= :threshold{filters}
+    ORDER BY vec_distance_cosine(v.embedding, :query_emb) LIMIT :limit
+"""
+
+
+def load(rows: int, dim: int, chunks_per_document: int) -> str:
+    """Fills the store and returns a copy of the vectors in the previous table layout."""
+    rng = np.random.default_rng(0)
+    for start in range(0, rows, 10000):
+        count = min(10000, rows - start)
+        embeddings = rng.standard_normal((count, dim), dtype=np.float32)
+        sqlite_repository.insert_chunks(
+            [
+                {
+                    "id": f"chunk_{start + i}",
+                    "document_id": f"doc_{(start + i) // chunks_per_document}",
+                    "content": f"chunk {start + i}",
+                    "metadata": {"parser_name": "docling"},
+                    "embedding": embeddings[i],
+                }
+                for i in range(count)
+            ]
+        )
+
+    full_scan_table = "document_chunks_vec_full_scan"
+    with sqlite_repository.get_engine().begin() as conn:
+        conn.execute(
+            text(f"CREATE VIRTUAL TABLE {full_scan_table} USING vec0(id TEXT PRIMARY KEY, embedding FLOAT[{dim}])")
+        )
+        conn.execute(
+            text(
+                f"INSERT INTO {full_scan_table} (id, embedding) "
+                f"SELECT id, embedding FROM {sqlite_repository.get_vec_table()}"
+            )
+        )
+    return full_scan_table
+
+
+def median_ms(query, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        query()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 50000])
+    parser.add_argument("--dim", type=int, default=256)
+    parser.add_argument("--chunks-per-document", type=int, default=50)
+    parser.add_argument("--match-count", type=int, default=5)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    settings.embedding_dimension = args.dim
+    query = np.random.default_rng(1).standard_normal(args.dim, dtype=np.float32)
+
+    print(
+        f"{'chunks':>10} {'full scan + doc':>16} {'knn + doc':>12}"
+        f" {'full scan all':>16} {'knn all':>12}"
+    )
+    with tempfile.TemporaryDirectory() as tmp:
+        for rows in args.sizes:
+            settings.sqlite_db_path = str(Path(tmp) / f"{rows}.sqlite")
+            sqlite_repository._engine = None
+            full_scan_table = load(rows, args.dim, args.chunks_per_document)
+            document_id = f"doc_{(rows // args.chunks_per_document) // 2}"
+
+            def full_scan(by_document: bool):
+                filters = " AND m.document_id = :doc_id" if by_document else ""
+                sql = text(_FULL_SCAN_SQL.format(table=full_scan_table, filters=filters))
+
+                def run():
+                    with sqlite_repository.get_engine().connect() as conn:
+                        conn.execute(
+                            sql,
+                            {
+                                "query_emb": query.tobytes(),
+                                "threshold": 2.0,
+                                "doc_id": document_id,
+                                "limit": args.match_count,
+                            },
+                        ).fetchall()
+
+                return run
+
+            def knn(**filters):
+                return lambda: sqlite_repository.query_similar_chunks(
+                    query, match_threshold=-1.0, match_count=args.match_count, **filters
+                )
+
+            print(
+                f"{rows:>10,}"
+                f" {median_ms(full_scan(True), args.repeat):>13.2f} ms"
+                f" {median_ms(knn(document_id=document_id), args.repeat):>9.2f} ms"
+                f" {median_ms(full_scan(False), args.repeat):>13.2f} ms"
+                f" {median_ms(knn(), args.repeat):>9.2f} ms"
+            )
+            sqlite_repository.get_engine().dispose()
+
+
+if __name__ == "__main__":
+    main()
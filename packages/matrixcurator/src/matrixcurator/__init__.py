@@ -1,79 +1,154 @@
-from matrixcurator.client import (
-    MatrixCuratorClient,
-)
-from matrixcurator.config import (
-    ContextStrategy,
-    IntelligenceStrategy,
-    OrchestrationStrategy,
-    Settings,
-    main,
-    settings,
-)
-from matrixcurator.exceptions import (
-    ContextLengthExceededError,
-    DocumentParseError,
-    LLMServiceError,
-    MatrixCuratorError,
-    NexusFormatError,
-)
-from matrixcurator.integrations import (
-    CharacterExtraction,
-    EvaluationModule,
-    ExtractionEvaluation,
-    ExtractionModule,
-    MCPAwareLM,
-    MCPSamplingError,
-    McpVlmConvertModel,
-    McpVlmEngine,
-    McpVlmPipeline,
-    acompletion,
-    completion,
-    configure_dspy,
-    logger,
-    mcp_session_var,
-    sample_message,
-)
-from matrixcurator.modules import (
-    AgentState,
-    CharacterStateOutput,
-    ContextSchema,
-    ExtractRequest,
-    ExtractResponse,
-    agent_graph,
-    build_graph,
-    docling,
-    docx,
-    evaluator_agent,
-    extractor_agent,
-    generate_with_re,
-    get_store,
-    llm_error_handler,
-    parse_with_docling,
-    parse_with_docx,
-    parse_with_pymupdf,
-    parse_with_txt,
-    pymupdf,
-    re,
-    store,
-    supervisor_node,
-    txt,
-)
-from matrixcurator.utils import (
-    get_available_models,
-    models,
+def lazy_import(module_name, submodules, submod_attrs, eager="auto"):
+    import importlib
+    import os
+
+    name_to_submod = {
+        func: mod for mod, funcs in submod_attrs.items() for func in funcs
+    }
+
+    def __getattr__(name):
+        if name in submodules:
+            attr = importlib.import_module(
+                "{module_name}.{name}".format(module_name=module_name, name=name)
+            )
+        elif name in name_to_submod:
+            submodname = name_to_submod[name]
+            module = importlib.import_module(f"{module_name}.{submodname}")
+            attr = getattr(module, name)
+        else:
+            raise AttributeError(f"Module {module_name!r} has no attribute {name!r}")
+        globals()[name] = attr
+        return attr
+
+    eager_import_flag = False
+    if eager == "auto":
+        eager_import_text = os.environ.get("EAGER_IMPORT", "")
+        if eager_import_text:
+            eager_import_text_ = eager_import_text.lower()
+            if eager_import_text_ in {"true", "1", "on", "yes"}:
+                eager_import_flag = True
+
+        eager_import_module_text = os.environ.get("EAGER_IMPORT_MODULES", "")
+        if eager_import_module_text:
+            if eager_import_module_text.lower() in __name__.lower():
+                eager_import_flag = True
+    else:
+        eager_import_flag = eager
+    if eager_import_flag:
+        for name in submodules:
+            __getattr__(name)
+
+        for attrs in submod_attrs.values():
+            for attr in attrs:
+                __getattr__(attr)
+    return __getattr__
+
+
+__getattr__ = lazy_import(
+    __name__,
+    submodules={},
+    submod_attrs={
+        "client": [
+            "MatrixCuratorClient",
+        ],
+        "config": [
+            "ContextStrategy",
+            "IntelligenceStrategy",
+            "OrchestrationStrategy",
+            "Settings",
+            "main",
+            "settings",
+        ],
+        "exceptions": [
+            "ContextLengthExceededError",
+            "DocumentNotFoundError",
+            "DocumentParseError",
+            "LLMServiceError",
+            "MatrixCuratorError",
+            "NexusFormatError",
+        ],
+        "integrations": [
+            "CharacterExtraction",
+            "ContextCacheRegistry",
+            "EvaluationModule",
+            "ExtractionEvaluation",
+            "ExtractionModule",
+            "MCPAwareLM",
+            "MCPSamplingError",
+            "McpVlmConvertModel",
+            "McpVlmEngine",
+            "McpVlmPipeline",
+            "acompletion",
+            "acompletion_with_context",
+            "build_context_messages",
+            "completion",
+            "configure_dspy",
+            "context_cache_registry",
+            "document_hash",
+            "get_response_cache",
+            "logger",
+            "mcp_loop_var",
+            "mcp_session_var",
+            "sample_message",
+            "supports_context_caching",
+        ],
+        "modules": [
+            "AgentState",
+            "CharacterStateOutput",
+            "ContextSchema",
+            "ExtractRequest",
+            "ExtractResponse",
+            "ExtractStreamEvent",
+            "agent_graph",
+            "build_graph",
+            "checkpointer",
+            "docling",
+            "docx",
+            "evaluator_agent",
+            "extractor_agent",
+            "generate_with_re",
+            "get_checkpointer",
+            "get_store",
+            "hybrid",
+            "llm_error_handler",
+            "parse_with_docling",
+            "parse_with_docx",
+            "parse_with_hybrid",
+            "parse_with_pymupdf",
+            "parse_with_txt",
+            "prune_expired",
+            "pymupdf",
+            "re",
+            "store",
+            "supervisor_node",
+            "txt",
+        ],
+        "utils": [
+            "get_available_models",
+            "models",
+        ],
+    },
 )
 
+
+def __dir__():
+    return __all__
+
+
 __all__ = [
     "AgentState",
     "CharacterExtraction",
     "CharacterStateOutput",
+    "ContextCacheRegistry",
     "ContextLengthExceededError",
     "ContextSchema",
     "ContextStrategy",
+    "DocumentNotFoundError",
     "DocumentParseError",
     "EvaluationModule",
     "ExtractRequest",
     "ExtractResponse",
+    "ExtractStreamEvent",
     "ExtractionEvaluation",
     "ExtractionModule",
     "IntelligenceStrategy",
@@ -89,31 +164,43 @@ __all__ = [
     "OrchestrationStrategy",
     "Settings",
     "acompletion",
+    "acompletion_with_context",
     "agent_graph",
+    "build_context_messages",
     "build_graph",
+    "checkpointer",
     "completion",
     "configure_dspy",
+    "context_cache_registry",
     "docling",
+    "document_hash",
     "docx",
     "evaluator_agent",
     "extractor_agent",
     "generate_with_re",
     "get_available_models",
+    "get_checkpointer",
+    "get_response_cache",
     "get_store",
+    "hybrid",
     "llm_error_handler",
     "logger",
     "main",
+    "mcp_loop_var",
     "mcp_session_var",
     "models",
     "parse_with_docling",
     "parse_with_docx",
+    "parse_with_hybrid",
     "parse_with_pymupdf",
     "parse_with_txt",
+    "prune_expired",
     "pymupdf",
     "re",
     "sample_message",
     "settings",
     "store",
     "supervisor_node",
+    "supports_context_caching",
     "txt",
 ]
@@ -1,8 +1,11 @@
-from typing import List, Dict, Any, Optional
+from typing import AsyncIterator, List, Dict, Any, Optional
 from matrixcurator.modules.document.services import parse_document, generate_document
-from matrixcurator.modules.agent.graph import agent_graph
+from matrixcurator.modules.document.registry import document_registry
+from matrixcurator.modules.agent.graph import get_agent_graph, get_batch_agent_graph
 from matrixcurator.config.main import Settings, settings as global_settings
+from matrixcurator.utils.concurrency import AsyncConcurrencyManager
 from lume import structlog, posthog
+import asyncio
 import uuid
 
 __all__ = ["MatrixCuratorClient"]
@@ -25,59 +28,267 @@ class MatrixCuratorClient:
         posthog.capture("anonymous_user", "document_parsed", properties={"filename": filename})
         return text
 
+    async def _extract_character(
+        self,
+        idx: int,
+        document_id: str,
+        starting_tier: int,
+        user_id: Optional[str],
+    ) -> Dict[str, Any]:
+        """Runs the agent graph for a single character index."""
+        thread_id = str(uuid.uuid4())
+        config = {
+            "configurable": {
+                "thread_id": thread_id,
+                "starting_tier": starting_tier,
+                "user_id": user_id,
+            }
+        }
+
+        initial_state = {
+            "character_index": idx,
+            "document_id": document_id,
+            "current_tier": starting_tier,
+            "attempts": 0,
+            "errors": [],
+        }
+
+        try:
+            result = await get_agent_graph().ainvoke(initial_state, config)
+            return {
+                "extracted_data": result.get("extracted_data"),
+                "errors": result.get("errors") or [],
+            }
+        except Exception as e:
+            error_msg = f"Failed to extract character {idx}: {str(e)}"
+            self.logger.error(error_msg)
+            return {"extracted_data": None, "errors": [error_msg]}
+
+    async def _extract_block(
+        self,
+        block: List[int],
+        document_id: str,
+        starting_tier: int,
+        user_id: Optional[str],
+    ) -> Dict[int, Dict[str, Any]]:
+        """
+        Runs the batch graph for a block of character indices.
+        Returns the accepted results keyed by character index; indices that are
+        missing or scored too low are left out so the caller can retry them.
+        """
+        thread_id = str(uuid.uuid4())
+        config = {
+            "configurable": {
+                "thread_id": thread_id,
+                "starting_tier": starting_tier,
+                "user_id": user_id,
+            }
+        }
+
+        initial_state = {
+            "character_indices": block,
+            "document_id": document_id,
+            "errors": [],
+        }
+
+        try:
+            result = await get_batch_agent_graph().ainvoke(initial_state, config)
+        except Exception as e:
+            self.logger.warning(
+                f"Batch extraction failed for characters {block}, retrying individually: {str(e)}"
+            )
+            return {}
+
+        return {
+            data["character_index"]: {"extracted_data": data, "errors": []}
+            for data in result.get("accepted") or []
+        }
+
     async def extract_characters(
         self,
         context: str,
         character_indices: List[int],
         starting_tier: int = 2,
         user_id: Optional[str] = None,
+        max_concurrency: Optional[int] = None,
+        batch_size: Optional[int] = None,
     ) -> Dict[str, Any]:
-        """Extracts character states from the given context."""
+        """
+        Extracts character states from the given context.
+
+        Characters are extracted concurrently, with at most ``max_concurrency``
+        graph runs in flight (defaults to ``settings.extraction_max_concurrency``).
+        When ``batch_size`` (defaults to ``settings.extraction_batch_size``) is
+        greater than 1, contiguous blocks of indices are requested in a single
+        LLM call and only the missing or low-scoring indices are retried one by one.
+        Results and errors are returned in the order of ``character_indices``.
+        """
         extracted_states = []
         all_errors = []
 
+        max_concurrency = max_concurrency or global_settings.extraction_max_concurrency
+        batch_size = batch_size or global_settings.extraction_batch_size
+        manager = AsyncConcurrencyManager(max_concurrent=max_concurrency)
+        # The document is stored once; every graph run only carries its id
+        document_id = await document_registry.register(context)
+
         self.logger.info(
-            f"Extracting characters: {character_indices} starting at tier {starting_tier}"
+            f"Extracting characters: {character_indices} starting at tier {starting_tier} "
+            f"with max concurrency {max_concurrency} and batch size {batch_size}"
         )
 
-        for idx in character_indices:
-            thread_id = str(uuid.uuid4())
-            config = {
-                "configurable": {
-                    "thread_id": thread_id,
-                    "starting_tier": starting_tier,
-                    "user_id": user_id,
-                }
-            }
+        async def _bounded_extract(idx: int) -> Dict[str, Any]:
+            async with manager:
+                return await self._extract_character(
+                    idx, document_id, starting_tier, user_id
+                )
 
-            initial_state = {
-                "character_index": idx,
-                "context": context,
-                "current_tier": starting_tier,
-                "attempts": 0,
-                "errors": [],
-            }
+        async def _bounded_extract_block(block: List[int]) -> List[Dict[str, Any]]:
+            async with manager:
+                outcomes = await self._extract_block(
+                    block, document_id, starting_tier, user_id
+                )
 
-            try:
-                result = await agent_graph.ainvoke(initial_state, config)
+            # Fall back to the per-character graph for anything the batch missed
+            missing = [idx for idx in block if idx not in outcomes]
+            fallbacks = await asyncio.gather(*(_bounded_extract(idx) for idx in missing))
+            outcomes.update(zip(missing, fallbacks))
+            return [outcomes[idx] for idx in block]
 
-                if result.get("extracted_data"):
-                    extracted_states.append(result["extracted_data"])
-                if result.get("errors"):
-                    all_errors.extend(result["errors"])
+        if batch_size > 1:
+            blocks = [
+                character_indices[i : i + batch_size]
+                for i in range(0, len(character_indices), batch_size)
+            ]
+            block_results = await asyncio.gather(
+                *(_bounded_extract_block(block) for block in blocks)
+            )
+            results = [result for block in block_results for result in block]
+        else:
+            results = await asyncio.gather(
+                *(_bounded_extract(idx) for idx in character_indices)
+            )
 
-            except Exception as e:
-                error_msg = f"Failed to extract character {idx}: {str(e)}"
-                self.logger.error(error_msg)
-                all_errors.append(error_msg)
+        for result in results:
+            if result["extracted_data"]:
+                extracted_states.append(result["extracted_data"])
+            all_errors.extend(result["errors"])
 
         posthog.capture(
             "anonymous_user",
             "characters_extracted",
-            properties={"num_indices": len(character_indices), "starting_tier": starting_tier},
+            properties={
+                "num_indices": len(character_indices),
+                "starting_tier": starting_tier,
+                "max_concurrency": max_concurrency,
+                "batch_size": batch_size,
+            },
         )
         return {"extracted_states": extracted_states, "errors": all_errors}
 
+    async def _stream_character(
+        self,
+        idx: int,
+        document_id: str,
+        starting_tier: int,
+        user_id: Optional[str],
+        thread_id: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Streams the agent graph for a single character and returns its final state as an event.
+        If `thread_id` already has a checkpoint, the run resumes from it, and a run that
+        had already finished returns its final state without calling the graph again.
+        """
+        config = {
+            "configurable": {
+                "thread_id": thread_id or str(uuid.uuid4()),
+                "starting_tier": starting_tier,
+                "user_id": user_id,
+            }
+        }
+
+        graph_input: Optional[Dict[str, Any]] = {
+            "character_index": idx,
+            "document_id": document_id,
+            "current_tier": starting_tier,
+            "attempts": 0,
+            "errors": [],
+        }
+
+        final_state: Dict[str, Any] = {}
+        try:
+            pending = True
+            if thread_id is not None:
+                snapshot = await get_agent_graph().aget_state(config)
+                if snapshot.values:
+                    self.logger.info(f"Resuming character {idx} from checkpoint {thread_id}")
+                    graph_input = None
+                    final_state = snapshot.values
+                    pending = bool(snapshot.next)
+
+            if pending:
+                async for state in get_agent_graph().astream(
+                    graph_input, config, stream_mode="values"
+                ):
+                    final_state = state
+        except Exception as e:
+            error_msg = f"Failed to extract character {idx}: {str(e)}"
+            self.logger.error(error_msg)
+            final_state = {"errors": final_state.get("errors", []) + [error_msg]}
+
+        return {
+            "character_index": idx,
+            "extracted_data": final_state.get("extracted_data"),
+            "evaluation_score": final_state.get("evaluation_score"),
+            "errors": final_state.get("errors") or [],
+        }
+
+    async def stream_characters(
+        self,
+        context: str,
+        character_indices: List[int],
+        starting_tier: int = 2,
+        user_id: Optional[str] = None,
+        max_concurrency: Optional[int] = None,
+        job_id: Optional[str] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Extracts character states and yields one event per character as soon as
+        its graph run finishes, in completion order rather than index order.
+        When `job_id` is given, each character runs on the deterministic thread
+        `{job_id}:{index}` so an interrupted job can resume from its checkpoints.
+        """
+        max_concurrency = max_concurrency or global_settings.extraction_max_concurrency
+        manager = AsyncConcurrencyManager(max_concurrent=max_concurrency)
+        document_id = await document_registry.register(context)
+
+        self.logger.info(
+            f"Streaming characters: {character_indices} starting at tier {starting_tier} "
+            f"with max concurrency {max_concurrency}"
+        )
+
+        async def _bounded_stream(idx: int) -> Dict[str, Any]:
+            async with manager:
+                thread_id = f"{job_id}:{idx}" if job_id else None
+                return await self._stream_character(
+                    idx, document_id, starting_tier, user_id, thread_id
+                )
+
+        tasks = [asyncio.create_task(_bounded_stream(idx)) for idx in character_indices]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            # Stop outstanding graph runs if the consumer goes away early
+            for task in tasks:
+                task.cancel()
+
+        posthog.capture(
+            "anonymous_user",
+            "characters_streamed",
+            properties={"num_indices": len(character_indices), "starting_tier": starting_tier},
+        )
+
     def generate_nexus(
         self, original_nexus: str, extracted_states: List[Dict[str, Any]]
     ) -> bytes:
@@ -2,7 +2,7 @@
 from enum import Enum
 from pydantic_settings import SettingsConfigDict
 from pydantic import Field
-from typing import Optional
+from typing import Literal, Optional
 from lume import LoggingSettings
 from contextvars import ContextVar
 
@@ -63,12 +63,54 @@ class Settings(LoggingSettings):
     # App Settings
     debug: bool = False
     sqlite_db_path: str = "sqlite.db"
+    # Chunks written per transaction by the SQLite vector store
+    sqlite_insert_batch_size: int = 1000
+    # Vectors per vec0 storage chunk (a multiple of 8); each document's partition
+    # preallocates whole chunks, so keep this near the typical chunks per document
+    sqlite_vec_chunk_size: int = 64
     retrieval_backend: str = "sqlite"
     embedding_model: str = "gemini/gemini-embedding-2"
+    # Required for embedding models missing from the built-in dimension registry
+    embedding_dimension: Optional[int] = None
+
+    # Provider Context Caching
+    context_cache_enabled: bool = True
+    context_cache_ttl_seconds: int = 3600
+    context_cache_min_chars: int = 8192
+
+    # LLM Response Cache
+    llm_cache_enabled: bool = False
+    llm_cache_path: str = ".cache/llm_responses.sqlite"
+    llm_cache_max_bytes: int = 512 * 1024 * 1024
+
+    # Parse Cache
+    # Parsed pages keyed by file hash, parser, parser version/options and page
+    parse_cache_enabled: bool = False
+    parse_cache_path: str = ".cache/parses.sqlite"
+    parse_cache_max_bytes: int = 1024 * 1024 * 1024
 
     # VLM Models
     vlm_model: str = "gemini/gemini-3.1-flash-lite"
 
+    # VLM Engine
+    # "async" schedules page requests on the MCP session's loop (or one shared
+    # background loop); "threads" runs them on a shared pool of worker threads.
+    # `vlm_max_concurrency` bounds requests in flight and is halved on 429s until
+    # requests succeed again; the rate limits below pace calls to `vlm_model`
+    vlm_engine_mode: Literal["async", "threads"] = "async"
+    vlm_max_concurrency: int = Field(default=8, ge=1)
+    vlm_rate_limit: RateLimitConfig = Field(default_factory=RateLimitConfig)
+    vlm_tokens_per_minute: Optional[int] = None
+    vlm_max_retries: int = Field(default=3, ge=0)
+
+    # VLM Page Images
+    # Pages are rendered at no more than `vlm_image_max_dpi`; grayscale sends
+    # pages without color content as single-channel images
+    vlm_image_format: Literal["JPEG", "WEBP", "PNG"] = "JPEG"
+    vlm_image_quality: int = Field(default=85, ge=1, le=100)
+    vlm_image_max_dpi: int = Field(default=144, ge=36)
+    vlm_image_grayscale: bool = False
+
     # Model Tiers
     model_tier_1: Optional[str] = None
     model_tier_2: Optional[str] = None
@@ -88,6 +130,45 @@ class Settings(LoggingSettings):
     docling_rate_limit: RateLimitConfig = Field(default_factory=lambda: RateLimitConfig(per_second=5))
     docx_rate_limit: RateLimitConfig = Field(default_factory=lambda: RateLimitConfig(per_second=50))
     txt_rate_limit: RateLimitConfig = Field(default_factory=lambda: RateLimitConfig(per_second=50))
+    # "sqlite" shares each rate limit between all processes on this host (uvicorn
+    # workers, benchmark runs); "memory" enforces it per process
+    rate_limit_backend: Literal["memory", "sqlite"] = "memory"
+    rate_limit_db_path: str = ".cache/rate_limits.sqlite"
+
+    # PDF Parsing
+    # More than one worker shards page ranges of long PDFs across a process pool
+    pdf_parse_workers: int = Field(default=1, ge=1)
+    pdf_parallel_min_pages: int = Field(default=32, ge=1)
+
+    # Hybrid PDF Parsing
+    # Pages whose text layer fails these checks are re-parsed with Docling: text
+    # density is in visible characters per square inch
+    hybrid_min_text_density: float = 5.0
+    hybrid_max_image_coverage: float = Field(default=0.5, ge=0, le=1)
+    hybrid_max_garbled_ratio: float = Field(default=0.05, ge=0, le=1)
+    hybrid_detect_tables: bool = True
+
+    # Docling
+    # Warmed converters shared by concurrent conversions; a converter is replaced
+    # after a failed conversion or after `docling_converter_max_uses` conversions
+    docling_pool_size: int = Field(default=2, ge=1)
+    docling_converter_max_uses: Optional[int] = None
+
+    # Extraction
+    extraction_max_concurrency: int = Field(default=8, ge=1)
+    extraction_batch_size: int = Field(default=1, ge=1)
+
+    # Background Extraction Jobs
+    jobs_db_path: str = ".cache/jobs.sqlite"
+    job_workers: int = Field(default=2, ge=1)
+    # A running job whose worker has not heartbeated for this long is claimed again
+    job_lease_seconds: float = Field(default=60.0, gt=0)
+
+    # Agent Checkpoints & Store
+    checkpoint_backend: str = "sqlite"
+    checkpoint_db_path: str = ".cache/checkpoints.sqlite"
+    store_db_path: str = ".cache/store.sqlite"
+    checkpoint_ttl_seconds: Optional[int] = 7 * 24 * 3600
 
     @property
     def current_context_strategy(self) -> ContextStrategy:
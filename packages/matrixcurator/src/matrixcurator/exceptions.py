@@ -1,6 +1,7 @@
 __all__ = [
     "MatrixCuratorError",
     "DocumentParseError",
+    "DocumentNotFoundError",
     "NexusFormatError",
     "LLMServiceError",
     "ContextLengthExceededError",
@@ -19,6 +20,12 @@ class DocumentParseError(MatrixCuratorError):
     pass
 
 
+class DocumentNotFoundError(MatrixCuratorError):
+    """Raised when a registered document reference cannot be resolved."""
+
+    pass
+
+
 class NexusFormatError(MatrixCuratorError):
     """Raised when a NEXUS file is malformed or cannot be processed."""
 
@@ -1,29 +1,98 @@
-from matrixcurator.integrations.docling import (
-    McpVlmConvertModel,
-    McpVlmEngine,
-    McpVlmPipeline,
-    logger,
-)
-from matrixcurator.integrations.dspy import (
-    CharacterExtraction,
-    EvaluationModule,
-    ExtractionEvaluation,
-    ExtractionModule,
-    MCPAwareLM,
-    configure_dspy,
-)
-from matrixcurator.integrations.litellm import (
-    acompletion,
-    completion,
-)
-from matrixcurator.integrations.mcp import (
-    MCPSamplingError,
-    mcp_session_var,
-    sample_message,
+def lazy_import(module_name, submodules, submod_attrs, eager="auto"):
+    import importlib
+    import os
+
+    name_to_submod = {
+        func: mod for mod, funcs in submod_attrs.items() for func in funcs
+    }
+
+    def __getattr__(name):
+        if name in submodules:
+            attr = importlib.import_module(
+                "{module_name}.{name}".format(module_name=module_name, name=name)
+            )
+        elif name in name_to_submod:
+            submodname = name_to_submod[name]
+            module = importlib.import_module(f"{module_name}.{submodname}")
+            attr = getattr(module, name)
+        else:
+            raise AttributeError(f"Module {module_name!r} has no attribute {name!r}")
+        globals()[name] = attr
+        return attr
+
+    eager_import_flag = False
+    if eager == "auto":
+        eager_import_text = os.environ.get("EAGER_IMPORT", "")
+        if eager_import_text:
+            eager_import_text_ = eager_import_text.lower()
+            if eager_import_text_ in {"true", "1", "on", "yes"}:
+                eager_import_flag = True
+
+        eager_import_module_text = os.environ.get("EAGER_IMPORT_MODULES", "")
+        if eager_import_module_text:
+            if eager_import_module_text.lower() in __name__.lower():
+                eager_import_flag = True
+    else:
+        eager_import_flag = eager
+    if eager_import_flag:
+        for name in submodules:
+            __getattr__(name)
+
+        for attrs in submod_attrs.values():
+            for attr in attrs:
+                __getattr__(attr)
+    return __getattr__
+
+
+__getattr__ = lazy_import(
+    __name__,
+    submodules={
+    },
+    submod_attrs={
+        "context_cache": [
+            "ContextCacheRegistry",
+            "acompletion_with_context",
+            "build_context_messages",
+            "context_cache_registry",
+            "document_hash",
+            "supports_context_caching",
+        ],
+        "docling": [
+            "McpVlmConvertModel",
+            "McpVlmEngine",
+            "McpVlmPipeline",
+            "logger",
+        ],
+        "dspy": [
+            "CharacterExtraction",
+            "EvaluationModule",
+            "ExtractionEvaluation",
+            "ExtractionModule",
+            "MCPAwareLM",
+            "configure_dspy",
+        ],
+        "litellm": [
+            "acompletion",
+            "completion",
+            "get_response_cache",
+        ],
+        "mcp": [
+            "MCPSamplingError",
+            "mcp_loop_var",
+            "mcp_session_var",
+            "sample_message",
+        ],
+    },
 )
 
+
+def __dir__():
+    return __all__
+
+
 __all__ = [
     "CharacterExtraction",
+    "ContextCacheRegistry",
     "EvaluationModule",
     "ExtractionEvaluation",
     "ExtractionModule",
@@ -33,9 +102,16 @@ __all__ = [
     "McpVlmEngine",
     "McpVlmPipeline",
     "acompletion",
+    "acompletion_with_context",
+    "build_context_messages",
     "completion",
     "configure_dspy",
+    "context_cache_registry",
+    "document_hash",
+    "get_response_cache",
     "logger",
+    "mcp_loop_var",
     "mcp_session_var",
     "sample_message",
+    "supports_context_caching",
 ]
@@ -0,0 +1,196 @@
+import hashlib
+import logging
+import time
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from litellm import ModelResponse
+from litellm.exceptions import BadRequestError, NotFoundError
+
+from matrixcurator.config.main import settings
+from matrixcurator.integrations.litellm import acompletion
+
+__all__ = [
+    "ContextCacheRegistry",
+    "acompletion_with_context",
+    "build_context_messages",
+    "context_cache_registry",
+    "document_hash",
+    "supports_context_caching",
+]
+
+logger = logging.getLogger(__name__)
+
+# Providers whose LiteLLM integration understands `cache_control` content blocks.
+# Gemini/Vertex create a cachedContent resource, Anthropic marks a cache breakpoint.
+_GEMINI_PREFIXES = ("gemini/", "vertex_ai/")
+_ANTHROPIC_PREFIXES = ("anthropic/", "claude")
+
+
+def document_hash(context: str) -> str:
+    """Returns the SHA-256 hex digest of the document text."""
+    return hashlib.sha256(context.encode("utf-8")).hexdigest()
+
+
+def supports_context_caching(model: str) -> bool:
+    """Whether the model's provider supports caching a shared prompt prefix."""
+    model = model.lower()
+    return model.startswith(_GEMINI_PREFIXES) or model.startswith(_ANTHROPIC_PREFIXES)
+
+
+class ContextCacheRegistry:
+    """
+    Tracks provider-side context caches per (document hash, model).
+
+    LiteLLM creates the cache on the first cache-marked request and reuses it for
+    identical prefixes; the registry remembers when that cache expires and which
+    documents the provider refused to cache so those fall back to plain requests.
+    """
+
+    def __init__(self) -> None:
+        self._expires_at: Dict[Tuple[str, str], float] = {}
+        self._disabled: Set[Tuple[str, str]] = set()
+
+    def is_enabled(self, key: Tuple[str, str]) -> bool:
+        return key not in self._disabled
+
+    def is_live(self, key: Tuple[str, str]) -> bool:
+        return self._expires_at.get(key, 0.0) > time.monotonic()
+
+    def mark_created(self, key: Tuple[str, str], ttl_seconds: int) -> None:
+        self._expires_at[key] = time.monotonic() + ttl_seconds
+
+    def expire(self, key: Tuple[str, str]) -> None:
+        self._expires_at.pop(key, None)
+
+    def disable(self, key: Tuple[str, str]) -> None:
+        self._expires_at.pop(key, None)
+        self._disabled.add(key)
+
+    def clear(self) -> None:
+        self._expires_at.clear()
+        self._disabled.clear()
+
+
+context_cache_registry = ContextCacheRegistry()
+
+# Provider error messages that are about the context cache itself; any other
+# BadRequest/NotFound error is unrelated to caching and is raised as is
+_CACHE_EXPIRED_MARKERS = (
+    "cachedcontent not found",
+    "cached content not found",
+    "cache expired",
+    "cachedcontent has expired",
+)
+_CACHE_REJECTED_MARKERS = (
+    "cached content is too small",
+    "minimum token count",
+    "does not support caching",
+    "does not support context caching",
+    "caching is not supported",
+)
+
+
+def _cache_error_kind(error: Exception) -> Optional[str]:
+    """Classifies a provider error as "expired", "rejected" or None (not cache related)."""
+    message = str(error).lower().replace("_", "")
+    if any(marker.replace("_", "") in message for marker in _CACHE_EXPIRED_MARKERS):
+        return "expired"
+    if any(marker.replace("_", "") in message for marker in _CACHE_REJECTED_MARKERS):
+        return "rejected"
+    return None
+
+
+def _cache_control(model: str) -> Dict[str, Any]:
+    control: Dict[str, Any] = {"type": "ephemeral"}
+    if model.lower().startswith(_GEMINI_PREFIXES):
+        control["ttl"] = f"{settings.context_cache_ttl_seconds}s"
+    return control
+
+
+def build_context_messages(
+    context: str,
+    prompt: str,
+    model: str,
+    system_prompt: Optional[str] = None,
+    cache: bool = True,
+) -> List[Dict[str, Any]]:
+    """
+    Builds messages with the document text as a stable prefix followed by the
+    per-call instruction. When `cache` is set, the prefix is marked cacheable.
+    """
+    prefix: List[Dict[str, Any]] = []
+    if system_prompt:
+        prefix.append({"role": "system", "content": system_prompt})
+    prefix.append({"role": "user", "content": f"Text:\n{context}"})
+
+    if cache:
+        for message in prefix:
+            message["content"] = [
+                {
+                    "type": "text",
+                    "text": message["content"],
+                    "cache_control": _cache_control(model),
+                }
+            ]
+
+    return prefix + [{"role": "user", "content": prompt}]
+
+
+async def acompletion_with_context(
+    context: str,
+    prompt: str,
+    model: str,
+    system_prompt: Optional[str] = None,
+    **kwargs,
+) -> ModelResponse:
+    """
+    Completion over a shared document context that reuses a provider-side cache.
+
+    The cache is keyed by the document content hash and model. An expired or
+    evicted cache is re-created by retrying with caching on; only when the provider
+    refuses to cache the document (e.g. context too small) is the call retried
+    without caching and the document not cached again. Other errors are raised.
+    """
+    key = (document_hash(context), model)
+    use_cache = (
+        settings.context_cache_enabled
+        and len(context) >= settings.context_cache_min_chars
+        and supports_context_caching(model)
+        and context_cache_registry.is_enabled(key)
+    )
+
+    if use_cache:
+        for attempt in range(2):
+            if not context_cache_registry.is_live(key):
+                logger.info(f"Creating context cache for document {key[0][:12]} on {model}")
+            try:
+                response = await acompletion(
+                    model=model,
+                    messages=build_context_messages(context, prompt, model, system_prompt),
+                    **kwargs,
+                )
+            except (BadRequestError, NotFoundError) as e:
+                kind = _cache_error_kind(e)
+                if kind is None:
+                    raise
+                if kind == "expired" and attempt == 0:
+                    logger.info(f"Context cache for document {key[0][:12]} expired: {e}")
+                    context_cache_registry.expire(key)
+                    continue
+                logger.warning(
+                    f"Provider refused to cache the context, falling back to uncached requests: {e}"
+                )
+                context_cache_registry.disable(key)
+                break
+            else:
+                if not context_cache_registry.is_live(key):
+                    context_cache_registry.mark_created(key, settings.context_cache_ttl_seconds)
+                return response
+
+    return await acompletion(
+        model=model,
+        messages=build_context_messages(
+            context, prompt, model, system_prompt, cache=False
+        ),
+        **kwargs,
+    )
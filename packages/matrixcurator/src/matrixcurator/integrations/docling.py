@@ -4,9 +4,11 @@ import logging
 import time
 import concurrent.futures
 import contextvars
+import threading
 from io import BytesIO
-from typing import List
+from typing import Any, Dict, List, Optional, Tuple
 
+from PIL import Image, ImageChops
 
 from docling.models.inference_engines.vlm.api_openai_compatible_engine import (
     ApiVlmEngine,
@@ -17,32 +19,72 @@ from docling.pipeline.vlm_pipeline import VlmPipeline, VlmPipelineOptions
 
 from matrixcurator.integrations.mcp import (
     MCPSamplingError,
+    mcp_loop_var,
     mcp_session_var,
     sample_message,
 )
-from matrixcurator.integrations.litellm import completion
+from matrixcurator.integrations.litellm import acompletion, completion
 from matrixcurator.config.main import settings
+from matrixcurator.utils.concurrency import AdaptiveConcurrencyLimiter, TokenBucket
+from matrixcurator.utils.rate_limits import build_rate_limiter
 
 logger = logging.getLogger(__name__)
 
 
-def _process_single_input(input_data: VlmEngineInput) -> VlmEngineOutput:
-    session = mcp_session_var.get()
+# Largest per-channel spread on a thumbnail for a page to count as colorless
+_GRAYSCALE_TOLERANCE = 16
+_POINTS_PER_INCH = 72
+
+
+def _is_colorless(image: Image.Image) -> bool:
+    thumbnail = image.resize((64, 64)).convert("RGB")
+    red, green, blue = thumbnail.split()
+    spread = max(
+        ImageChops.difference(red, green).getextrema()[1],
+        ImageChops.difference(green, blue).getextrema()[1],
+    )
+    return spread <= _GRAYSCALE_TOLERANCE
+
+
+def encode_page_image(image: Image.Image) -> Tuple[str, str]:
+    """
+    Encodes a rendered page for a VLM request and returns `(mime_type, base64_data)`.
+
+    Uses `settings.vlm_image_format` and `vlm_image_quality`; with
+    `vlm_image_grayscale`, pages without color content are sent as single-channel
+    images. The input image is never modified, so no defensive copy is made.
+    """
+    image_format = settings.vlm_image_format
+    if settings.vlm_image_grayscale and image.mode != "L" and _is_colorless(image):
+        image = image.convert("L")
+    elif image.mode not in ("RGB", "L"):
+        # JPEG has no alpha channel; page renders do not need one for any format
+        image = image.convert("RGB")
+
+    save_kwargs: Dict[str, Any] = {}
+    if image_format in ("JPEG", "WEBP"):
+        save_kwargs["quality"] = settings.vlm_image_quality
 
-    # Format image and prompt for MCP/LiteLLM
     img_io = BytesIO()
-    image = input_data.image.copy().convert("RGBA")
-    image.save(img_io, "PNG")
-    image_base64 = base64.b64encode(img_io.getvalue()).decode("utf-8")
+    image.save(img_io, image_format, **save_kwargs)
+    return (
+        f"image/{image_format.lower()}",
+        base64.b64encode(img_io.getvalue()).decode("utf-8"),
+    )
+
 
-    messages = [
+def _build_messages(input_data: VlmEngineInput) -> List[Dict[str, Any]]:
+    # Format image and prompt for MCP/LiteLLM
+    mime_type, image_base64 = encode_page_image(input_data.image)
+
+    return [
         {
             "role": "user",
             "content": [
                 {
                     "type": "image_url",
                     "image_url": {
-                        "url": f"data:image/png;base64,{image_base64}"
+                        "url": f"data:{mime_type};base64,{image_base64}"
                     },
                 },
                 {"type": "text", "text": input_data.prompt},
@@ -50,6 +92,102 @@ def _process_single_input(input_data: VlmEngineInput) -> VlmEngineOutput:
         }
     ]
 
+
+def _mcp_result_text(mcp_result: Any) -> str:
+    content = ""
+    if hasattr(mcp_result, "content"):
+        for item in mcp_result.content:
+            if getattr(item, "type", "") == "text":
+                content += getattr(item, "text", "")
+    return content
+
+
+def _engine_output(content: str, request_start_time: float) -> VlmEngineOutput:
+    return VlmEngineOutput(
+        text=content,
+        stop_reason="stop",
+        metadata={
+            "generation_time": time.time() - request_start_time,
+            "num_tokens": 0,
+        },
+    )
+
+
+# Rough per-page cost for TPM accounting: one image tile plus the prompt, with
+# the completion budget reserved up front
+_IMAGE_TOKENS = 258
+_CHARS_PER_TOKEN = 4
+
+
+def _is_rate_limited(error: BaseException) -> bool:
+    while error is not None:
+        if getattr(error, "status_code", None) == 429:
+            return True
+        error = error.__cause__
+    return False
+
+
+class VlmThrottle:
+    """
+    Request pacing shared by every page request to `settings.vlm_model`.
+
+    Token buckets keep requests and estimated tokens under the configured
+    per-minute limits, and an adaptive concurrency limit halves the number of
+    requests in flight when the provider still answers 429 and grows it back as
+    requests succeed.
+    """
+
+    def __init__(self) -> None:
+        # Requests count against the provider quota of every process on the host
+        # when the shared backend is on; threads in this process share one bucket
+        if settings.rate_limit_backend == "sqlite":
+            self.requests = build_rate_limiter("vlm", settings.vlm_rate_limit)
+        else:
+            self.requests = TokenBucket.from_config(settings.vlm_rate_limit)
+        self.tokens = None
+        if settings.vlm_tokens_per_minute:
+            rate = settings.vlm_tokens_per_minute / 60
+            self.tokens = TokenBucket(rate, capacity=rate)
+        self.concurrency = AdaptiveConcurrencyLimiter(maximum=settings.vlm_max_concurrency)
+
+    def reserve(self, input_data: VlmEngineInput) -> float:
+        """Reserves capacity for one page request and returns the seconds to wait."""
+        delay = self.requests.reserve() if self.requests else 0.0
+        if self.tokens:
+            estimated = (
+                _IMAGE_TOKENS
+                + len(input_data.prompt or "") // _CHARS_PER_TOKEN
+                + (input_data.max_new_tokens or 0)
+            )
+            delay = max(delay, self.tokens.reserve(estimated))
+        return delay
+
+
+_throttle: Optional[VlmThrottle] = None
+_executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+
+
+def get_throttle() -> VlmThrottle:
+    global _throttle
+    if _throttle is None:
+        _throttle = VlmThrottle()
+    return _throttle
+
+
+def get_executor() -> concurrent.futures.ThreadPoolExecutor:
+    """Worker threads shared by all "threads" mode batches, kept for the process lifetime."""
+    global _executor
+    if _executor is None:
+        _executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=settings.vlm_max_concurrency, thread_name_prefix="vlm-page"
+        )
+    return _executor
+
+
+def _process_single_input(input_data: VlmEngineInput) -> VlmEngineOutput:
+    session = mcp_session_var.get()
+    messages = _build_messages(input_data)
+
     request_start_time = time.time()
     content = ""
 
@@ -64,12 +202,7 @@ def _process_single_input(input_data: VlmEngineInput) -> VlmEngineOutput:
                     max_tokens=input_data.max_new_tokens,
                 )
             )
-
-            # Extract text content
-            if hasattr(mcp_result, "content"):
-                for item in mcp_result.content:
-                    if getattr(item, "type", "") == "text":
-                        content += getattr(item, "text", "")
+            content = _mcp_result_text(mcp_result)
 
         except MCPSamplingError as e:
             logger.warning(
@@ -84,50 +217,189 @@ def _process_single_input(input_data: VlmEngineInput) -> VlmEngineOutput:
 
     if session is None:
         # Fallback to LiteLLM (Gemini)
-        response = completion(
-            model=settings.vlm_model,
-            messages=messages,
-            temperature=input_data.temperature,
-            max_tokens=input_data.max_new_tokens,
-        )
+        throttle = get_throttle()
+        for attempt in range(settings.vlm_max_retries + 1):
+            time.sleep(throttle.reserve(input_data))
+            try:
+                response = completion(
+                    model=settings.vlm_model,
+                    messages=messages,
+                    temperature=input_data.temperature,
+                    max_tokens=input_data.max_new_tokens,
+                )
+                break
+            except Exception as e:
+                if attempt == settings.vlm_max_retries or not _is_rate_limited(e):
+                    raise
+                throttle.concurrency.record_throttle()
+                logger.warning(f"VLM request rate limited, retrying: {e}")
+        throttle.concurrency.record_success()
         content = response.choices[0].message.content or ""
 
-    generation_time = time.time() - request_start_time
+    return _engine_output(content, request_start_time)
+
+
+async def _aprocess_single_input(
+    input_data: VlmEngineInput, session: Optional[Any]
+) -> VlmEngineOutput:
+    # Image encoding is CPU-bound, keep it off the loop serving the MCP session
+    messages = await asyncio.to_thread(_build_messages, input_data)
+
+    request_start_time = time.time()
+
+    if session is not None:
+        try:
+            mcp_result = await sample_message(
+                session=session,
+                messages=messages,
+                temperature=input_data.temperature,
+                max_tokens=input_data.max_new_tokens,
+            )
+            return _engine_output(_mcp_result_text(mcp_result), request_start_time)
+        except MCPSamplingError as e:
+            logger.warning(
+                f"MCP sampling failed, falling back to native LiteLLM: {e}"
+            )
+        except Exception as e:
+            logger.warning(
+                f"Unexpected error during MCP sampling, falling back to native LiteLLM: {e}"
+            )
+
+    # Fallback to LiteLLM (Gemini); the session is cleared for this task only so
+    # the wrapper does not retry MCP sampling
+    mcp_session_var.set(None)
+    throttle = get_throttle()
+    for attempt in range(settings.vlm_max_retries + 1):
+        # The shared SQLite limiter may wait on a write lock; keep that off the loop
+        delay = await asyncio.to_thread(throttle.reserve, input_data)
+        await asyncio.sleep(delay)
+        try:
+            response = await acompletion(
+                model=settings.vlm_model,
+                messages=messages,
+                temperature=input_data.temperature,
+                max_tokens=input_data.max_new_tokens,
+            )
+            break
+        except Exception as e:
+            if attempt == settings.vlm_max_retries or not _is_rate_limited(e):
+                raise
+            throttle.concurrency.record_throttle()
+            logger.warning(f"VLM request rate limited, retrying: {e}")
+    throttle.concurrency.record_success()
+    return _engine_output(response.choices[0].message.content or "", request_start_time)
 
-    return VlmEngineOutput(
-        text=content,
-        stop_reason="stop",
-        metadata={
-            "generation_time": generation_time,
-            "num_tokens": 0,
-        },
-    )
+
+class _BackgroundLoop:
+    """A single event loop running forever in a daemon thread, started on first use."""
+
+    def __init__(self) -> None:
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lock = threading.Lock()
+
+    def get(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None or self._loop.is_closed():
+                loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=loop.run_forever, name="vlm-engine-loop", daemon=True
+                ).start()
+                self._loop = loop
+            return self._loop
+
+
+_background_loop = _BackgroundLoop()
+
+
+def _dispatch_loop(session: Optional[Any]) -> asyncio.AbstractEventLoop:
+    """Prefers the loop owning the MCP session; otherwise the shared background loop."""
+    owner = mcp_loop_var.get()
+    if session is not None and owner is not None and owner.is_running():
+        try:
+            current = asyncio.get_running_loop()
+        except RuntimeError:
+            current = None
+        # Blocking on the owner's own thread would deadlock it
+        if owner is not current:
+            return owner
+    return _background_loop.get()
 
 
 class McpVlmEngine(ApiVlmEngine):
     """
     Custom VLM Engine for Docling that intercepts calls for MCP sampling.
     Falls back to litellm.completion (Gemini) if no MCP session is active or if sampling fails.
+
+    In the default "async" mode a batch is scheduled as coroutines on one
+    long-lived loop (the MCP session's own loop when it is known); the "threads"
+    mode runs every page on the shared worker threads. Either way, requests in
+    flight across all batches are bounded by the adaptive limit of `VlmThrottle`.
     """
 
     def predict_batch(self, input_batch: List[VlmEngineInput]) -> List[VlmEngineOutput]:
-        outputs = []
+        if not input_batch:
+            return []
+        if settings.vlm_engine_mode == "async":
+            return self._predict_batch_async(input_batch)
+        return self._predict_batch_threads(input_batch)
+
+    def _predict_batch_async(self, input_batch: List[VlmEngineInput]) -> List[VlmEngineOutput]:
+        session = mcp_session_var.get()
+        concurrency = get_throttle().concurrency
+
+        async def run_one(input_data: VlmEngineInput) -> VlmEngineOutput:
+            async with concurrency.aslot():
+                return await _aprocess_single_input(input_data, session)
 
-        # Let's use threads to run multiple VLM inputs concurrently.
-        # This matches upstream ApiVlmEngine pattern for API requests.
-        num_threads = min(len(input_batch) or 1, 8)  # max workers
+        async def run_batch() -> List[VlmEngineOutput]:
+            return await asyncio.gather(*(run_one(input_data) for input_data in input_batch))
 
-        with concurrent.futures.ThreadPoolExecutor(max_workers=num_threads) as executor:
-            # context.run propagates the contextvars to the thread.
-            futures = [
-                executor.submit(contextvars.copy_context().run, _process_single_input, input_data)
-                for input_data in input_batch
-            ]
-            
-            for future in futures:
-                outputs.append(future.result())
+        future = asyncio.run_coroutine_threadsafe(run_batch(), _dispatch_loop(session))
+        return future.result()
 
-        return outputs
+    def _predict_batch_threads(self, input_batch: List[VlmEngineInput]) -> List[VlmEngineOutput]:
+        concurrency = get_throttle().concurrency
+
+        def run_one(input_data: VlmEngineInput) -> VlmEngineOutput:
+            with concurrency.slot():
+                return _process_single_input(input_data)
+
+        # context.run propagates the contextvars to the thread.
+        futures = [
+            get_executor().submit(contextvars.copy_context().run, run_one, input_data)
+            for input_data in input_batch
+        ]
+        return [future.result() for future in futures]
+
+
+def _force_api_engine_options(vlm_options: Any) -> None:
+    """
+    Points `vlm_options` at an API engine, so Docling never loads local model
+    weights for an engine that McpVlmEngine replaces anyway.
+    """
+    try:
+        from docling.datamodel.vlm_engine_options import (
+            ApiVlmEngineOptions,
+            VlmEngineType,
+        )
+
+        if (
+            not getattr(vlm_options, "engine_options", None)
+            or getattr(vlm_options.engine_options, "engine_type", None)
+            != VlmEngineType.API_OLLAMA
+        ):
+            vlm_options.engine_options = ApiVlmEngineOptions(
+                engine_type=VlmEngineType.API_OLLAMA,
+                url="http://localhost:11434/v1/chat/completions",
+            )
+    except ImportError:
+        from docling.datamodel.pipeline_options_vlm_model import ApiVlmOptions, ResponseFormat
+
+        if not isinstance(vlm_options.engine_options, ApiVlmOptions):
+            vlm_options.engine_options = ApiVlmOptions(
+                prompt=getattr(vlm_options, "model_spec", vlm_options).prompt,
+                response_format=ResponseFormat.MARKDOWN,
+            )
 
 
 class McpVlmConvertModel(VlmConvertModel):
@@ -136,10 +408,18 @@ class McpVlmConvertModel(VlmConvertModel):
     """
 
     def __init__(self, *args, **kwargs):
+        if kwargs.get("options") is not None:
+            _force_api_engine_options(kwargs["options"])
         super().__init__(*args, **kwargs)
         # Replace the engine with our MCP-aware engine
         # Note: VlmConvertModel uses self.options.engine_options
         if hasattr(self, "options") and hasattr(self.options, "engine_options"):
+            # Pages are rendered at 72 DPI per unit of scale; rendering straight at
+            # the DPI cap is cheaper than downscaling a larger render afterwards
+            max_scale = settings.vlm_image_max_dpi / _POINTS_PER_INCH
+            if isinstance(getattr(self.options, "scale", None), (int, float)) and self.options.scale > max_scale:
+                # Copy so the caller's pipeline options keep their configured scale
+                self.options = self.options.model_copy(update={"scale": max_scale})
             self.engine = McpVlmEngine(
                 enable_remote_services=getattr(self, "enable_remote_services", True),
                 options=self.options.engine_options,
@@ -154,30 +434,8 @@ class McpVlmPipeline(VlmPipeline):
     def _initialize_new_runtime_system(
         self, pipeline_options: VlmPipelineOptions
     ) -> None:
-        try:
-            from docling.datamodel.vlm_engine_options import (
-                ApiVlmEngineOptions,
-                VlmEngineType,
-            )
+        _force_api_engine_options(pipeline_options.vlm_options)
 
-            if (
-                not getattr(pipeline_options.vlm_options, "engine_options", None)
-                or getattr(pipeline_options.vlm_options.engine_options, "engine_type", None)
-                != VlmEngineType.API_OLLAMA
-            ):
-                pipeline_options.vlm_options.engine_options = ApiVlmEngineOptions(
-                    engine_type=VlmEngineType.API_OLLAMA,
-                    url="http://localhost:11434/v1/chat/completions",
-                )
-        except ImportError:
-            from docling.datamodel.pipeline_options_vlm_model import ApiVlmOptions, ResponseFormat
-
-            if not isinstance(pipeline_options.vlm_options.engine_options, ApiVlmOptions):
-                pipeline_options.vlm_options.engine_options = ApiVlmOptions(
-                    prompt=getattr(pipeline_options.vlm_options, "model_spec", pipeline_options.vlm_options).prompt,
-                    response_format=ResponseFormat.MARKDOWN,
-                )
-                
         # Force response format to MARKDOWN to ensure Gemini's plain markdown output is correctly parsed 
         # instead of failing silently when parsed as DOCTAGS.
         try:
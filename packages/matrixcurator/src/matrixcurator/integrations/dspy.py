@@ -1,5 +1,6 @@
+import asyncio
 import os
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 import dspy
 from openinference.instrumentation.dspy import DSPyInstrumentor
 from matrixcurator.modules.schemas import CharacterState
@@ -10,6 +11,13 @@ from matrixcurator.integrations.mcp import (
     mcp_session_var,
     sample_message,
 )
+from matrixcurator.integrations.litellm import (
+    _format_mcp_to_litellm,
+    get_cached_response,
+    get_response_cache,
+    response_cache_key,
+    store_cached_response,
+)
 
 _logger = structlog.get_logger(__name__)
 
@@ -18,19 +26,70 @@ class MCPAwareLM(dspy.LM):
     """
     Custom DSPy LM that intercepts calls for MCP sampling.
     Falls back to native dspy.LM (LiteLLM) if no MCP session is active or if sampling fails.
+    Responses are served from and stored in the persistent response cache when enabled;
+    completions produced by the MCP client are not cached under the requested model.
+    Every path returns a LiteLLM ModelResponse, like the native dspy.LM.
     """
 
+    def _cache_key(
+        self,
+        prompt: Optional[str],
+        messages: Optional[List[Dict[str, Any]]],
+        kwargs: Dict[str, Any],
+    ) -> Optional[str]:
+        if get_response_cache() is None:
+            return None
+
+        return response_cache_key(
+            self.model,
+            messages or [{"role": "user", "content": prompt}],
+            kwargs.get("response_format", self.kwargs.get("response_format")),
+            kwargs.get("temperature", self.kwargs.get("temperature")),
+        )
+
     def forward(
         self,
         prompt: Optional[str] = None,
         messages: Optional[List[Dict[str, Any]]] = None,
         **kwargs,
     ):
+        key = self._cache_key(prompt, messages, kwargs)
+        cached = get_cached_response(key)
+        if cached is not None:
+            return cached
+
+        response, sampled = self._forward(prompt=prompt, messages=messages, **kwargs)
+        if not sampled:
+            store_cached_response(key, response)
+        return response
+
+    async def aforward(
+        self,
+        prompt: Optional[str] = None,
+        messages: Optional[List[Dict[str, Any]]] = None,
+        **kwargs,
+    ):
+        key = self._cache_key(prompt, messages, kwargs)
+        if key is not None:
+            cached = await asyncio.to_thread(get_cached_response, key)
+            if cached is not None:
+                return cached
+
+        response, sampled = await self._aforward(prompt=prompt, messages=messages, **kwargs)
+        if key is not None and not sampled:
+            await asyncio.to_thread(store_cached_response, key, response)
+        return response
+
+    def _forward(
+        self,
+        prompt: Optional[str] = None,
+        messages: Optional[List[Dict[str, Any]]] = None,
+        **kwargs,
+    ) -> Tuple[Any, bool]:
+        """Returns the response and whether it came from MCP sampling."""
         session = mcp_session_var.get()
         if session is not None:
             try:
-                import asyncio
-
                 msgs = messages or [{"role": "user", "content": prompt}]
                 temperature = kwargs.get("temperature", self.kwargs.get("temperature"))
                 max_tokens = kwargs.get("max_tokens", self.kwargs.get("max_tokens"))
@@ -46,7 +105,7 @@ class MCPAwareLM(dspy.LM):
                     _logger.warning(
                         "Cannot run sync MCP sampling inside an active event loop. Falling back to native dspy.LM."
                     )
-                    return super().forward(prompt=prompt, messages=messages, **kwargs)
+                    return super().forward(prompt=prompt, messages=messages, **kwargs), False
 
                 mcp_result = loop.run_until_complete(
                     sample_message(
@@ -56,31 +115,7 @@ class MCPAwareLM(dspy.LM):
                         max_tokens=max_tokens,
                     )
                 )
-
-                # Extract text content
-                content = ""
-                if hasattr(mcp_result, "content"):
-                    for item in mcp_result.content:
-                        if getattr(item, "type", "") == "text":
-                            content += getattr(item, "text", "")
-
-                # Format response into the dictionary structure DSPy expects
-                return {
-                    "choices": [
-                        {
-                            "message": {
-                                "content": content,
-                                "role": getattr(mcp_result, "role", "assistant"),
-                            },
-                            "finish_reason": "stop",
-                        }
-                    ],
-                    "usage": {
-                        "prompt_tokens": 0,
-                        "completion_tokens": 0,
-                        "total_tokens": 0,
-                    },
-                }
+                return _format_mcp_to_litellm(mcp_result, self.model), True
 
             except MCPSamplingError as e:
                 _logger.warning(
@@ -92,14 +127,15 @@ class MCPAwareLM(dspy.LM):
                 )
 
         # Fallback to native dspy.LM
-        return super().forward(prompt=prompt, messages=messages, **kwargs)
+        return super().forward(prompt=prompt, messages=messages, **kwargs), False
 
-    async def aforward(
+    async def _aforward(
         self,
         prompt: Optional[str] = None,
         messages: Optional[List[Dict[str, Any]]] = None,
         **kwargs,
-    ):
+    ) -> Tuple[Any, bool]:
+        """Returns the response and whether it came from MCP sampling."""
         session = mcp_session_var.get()
         if session is not None:
             try:
@@ -114,31 +150,7 @@ class MCPAwareLM(dspy.LM):
                     temperature=temperature,
                     max_tokens=max_tokens,
                 )
-
-                # Extract text content
-                content = ""
-                if hasattr(mcp_result, "content"):
-                    for item in mcp_result.content:
-                        if getattr(item, "type", "") == "text":
-                            content += getattr(item, "text", "")
-
-                # Format response into the dictionary structure DSPy expects
-                return {
-                    "choices": [
-                        {
-                            "message": {
-                                "content": content,
-                                "role": getattr(mcp_result, "role", "assistant"),
-                            },
-                            "finish_reason": "stop",
-                        }
-                    ],
-                    "usage": {
-                        "prompt_tokens": 0,
-                        "completion_tokens": 0,
-                        "total_tokens": 0,
-                    },
-                }
+                return _format_mcp_to_litellm(mcp_result, self.model), True
 
             except MCPSamplingError as e:
                 _logger.warning(
@@ -150,7 +162,7 @@ class MCPAwareLM(dspy.LM):
                 )
 
         # Fallback to native dspy.LM
-        return await super().aforward(prompt=prompt, messages=messages, **kwargs)
+        return await super().aforward(prompt=prompt, messages=messages, **kwargs), False
 
 
 def configure_dspy(model_name: Optional[str] = None):
@@ -1,20 +1,103 @@
 import asyncio
+import hashlib
+import json
 import logging
 import time
 import uuid
-from typing import Any
+from typing import Any, Dict, List, Optional, Tuple
 
 import litellm
 from litellm import Choices, Message, ModelResponse, Usage
+from pydantic import BaseModel
 
+from matrixcurator.config.main import settings
 from matrixcurator.integrations.mcp import (
     MCPSamplingError,
     mcp_session_var,
     sample_message,
 )
+from matrixcurator.utils.cache import SQLiteCache
 
 logger = logging.getLogger(__name__)
 
+_response_cache: Optional[SQLiteCache] = None
+
+
+def get_response_cache() -> Optional[SQLiteCache]:
+    """
+    Returns the persistent LLM response cache singleton,
+    or None if response caching is disabled in settings.
+    """
+    global _response_cache
+
+    if not settings.llm_cache_enabled:
+        return None
+
+    if _response_cache is None:
+        _response_cache = SQLiteCache(
+            settings.llm_cache_path, max_bytes=settings.llm_cache_max_bytes
+        )
+    return _response_cache
+
+
+def response_cache_key(
+    model: Optional[str],
+    messages: List[Dict[str, Any]],
+    response_format: Any = None,
+    temperature: Optional[float] = None,
+) -> str:
+    """Content-addressed cache key for a completion request."""
+    if isinstance(response_format, type) and issubclass(response_format, BaseModel):
+        response_format = response_format.model_json_schema()
+
+    payload = json.dumps(
+        {
+            "model": model,
+            "messages": messages,
+            "response_format": response_format,
+            "temperature": temperature,
+        },
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def get_cached_response(key: Optional[str]) -> Optional[ModelResponse]:
+    """Looks up a cached response; returns None on a miss or when caching is off."""
+    cache = get_response_cache()
+    if cache is None or key is None:
+        return None
+
+    raw = cache.get(key)
+    if raw is None:
+        return None
+    return ModelResponse(**json.loads(raw))
+
+
+def store_cached_response(key: Optional[str], response: Any) -> None:
+    """Stores a completion response (ModelResponse or plain dict) in the cache."""
+    cache = get_response_cache()
+    if cache is None or key is None:
+        return
+
+    data = response if isinstance(response, dict) else response.model_dump()
+    cache.set(key, json.dumps(data, default=str).encode("utf-8"))
+
+
+def _cache_key_from_call(args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Optional[str]:
+    if get_response_cache() is None or kwargs.get("stream"):
+        return None
+
+    model = kwargs.get("model") or (args[0] if len(args) > 0 else None)
+    messages = kwargs.get("messages") or (args[1] if len(args) > 1 else [])
+    return response_cache_key(
+        model,
+        messages,
+        kwargs.get("response_format"),
+        kwargs.get("temperature"),
+    )
+
 
 def _format_mcp_to_litellm(mcp_result: Any, model: str) -> ModelResponse:
     """Convert an MCP CreateMessageResult to a LiteLLM ModelResponse."""
@@ -46,7 +129,23 @@ async def acompletion(*args, **kwargs) -> ModelResponse:
     """
     Universal async completion wrapper that intercepts calls for MCP sampling.
     Falls back to litellm.acompletion if no MCP session is active or if sampling fails.
+    Responses are served from and stored in the persistent response cache when enabled;
+    completions produced by the MCP client are not cached under the requested model.
     """
+    key = _cache_key_from_call(args, kwargs)
+    if key is not None:
+        cached = await asyncio.to_thread(get_cached_response, key)
+        if cached is not None:
+            return cached
+
+    response, sampled = await _acompletion(*args, **kwargs)
+    if key is not None and not sampled:
+        await asyncio.to_thread(store_cached_response, key, response)
+    return response
+
+
+async def _acompletion(*args, **kwargs) -> Tuple[ModelResponse, bool]:
+    """Returns the response and whether it came from MCP sampling."""
     session = mcp_session_var.get()
     if session is not None:
         try:
@@ -70,7 +169,7 @@ async def acompletion(*args, **kwargs) -> ModelResponse:
             )
 
             # Format and return
-            return _format_mcp_to_litellm(mcp_result, model)
+            return _format_mcp_to_litellm(mcp_result, model), True
 
         except MCPSamplingError as e:
             logger.warning(
@@ -82,14 +181,29 @@ async def acompletion(*args, **kwargs) -> ModelResponse:
             )
 
     # Fallback to native LiteLLM
-    return await litellm.acompletion(*args, **kwargs)
+    return await litellm.acompletion(*args, **kwargs), False
 
 
 def completion(*args, **kwargs) -> ModelResponse:
     """
     Universal sync completion wrapper that intercepts calls for MCP sampling.
     Falls back to litellm.completion if no MCP session is active or if sampling fails.
+    Responses are served from and stored in the persistent response cache when enabled;
+    completions produced by the MCP client are not cached under the requested model.
     """
+    key = _cache_key_from_call(args, kwargs)
+    cached = get_cached_response(key)
+    if cached is not None:
+        return cached
+
+    response, sampled = _completion(*args, **kwargs)
+    if not sampled:
+        store_cached_response(key, response)
+    return response
+
+
+def _completion(*args, **kwargs) -> Tuple[ModelResponse, bool]:
+    """Returns the response and whether it came from MCP sampling."""
     session = mcp_session_var.get()
     if session is not None:
         try:
@@ -117,7 +231,7 @@ def completion(*args, **kwargs) -> ModelResponse:
                 logger.warning(
                     "Cannot run sync MCP sampling inside an active event loop. Falling back to native litellm.completion."
                 )
-                return litellm.completion(*args, **kwargs)
+                return litellm.completion(*args, **kwargs), False
 
             mcp_result = loop.run_until_complete(
                 sample_message(
@@ -129,7 +243,7 @@ def completion(*args, **kwargs) -> ModelResponse:
             )
 
             # Format and return
-            return _format_mcp_to_litellm(mcp_result, model)
+            return _format_mcp_to_litellm(mcp_result, model), True
 
         except MCPSamplingError as e:
             logger.warning(
@@ -141,4 +255,4 @@ def completion(*args, **kwargs) -> ModelResponse:
             )
 
     # Fallback to native LiteLLM
-    return litellm.completion(*args, **kwargs)
+    return litellm.completion(*args, **kwargs), False
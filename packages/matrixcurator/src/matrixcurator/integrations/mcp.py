@@ -1,3 +1,4 @@
+import asyncio
 import contextvars
 import logging
 from typing import Any, Dict, List, Optional
@@ -11,6 +12,12 @@ mcp_session_var: contextvars.ContextVar[Optional[Any]] = contextvars.ContextVar(
     "mcp_session", default=None
 )
 
+# Event loop the active MCP session is bound to, so sync code running in worker
+# threads can schedule sampling requests back onto it
+mcp_loop_var: contextvars.ContextVar[Optional[asyncio.AbstractEventLoop]] = (
+    contextvars.ContextVar("mcp_loop", default=None)
+)
+
 
 class MCPSamplingError(Exception):
     """Raised when MCP sampling fails."""
@@ -1,6 +1,6 @@
 from typing import List, Optional
 from pydantic import BaseModel
-from matrixcurator.integrations.litellm import acompletion
+from matrixcurator.integrations.context_cache import acompletion_with_context
 from matrixcurator.config.main import settings
 
 
@@ -33,25 +33,19 @@ async def extract_characters_and_states(
     model = settings.get_model_for_tier(1)
 
     prompt = (
-        "Extract the characters and their associated states from the following text."
+        "Extract the characters and their associated states from the text above."
     )
     if indices:
         prompt += f" Pay special attention to character indices: {indices}."
 
-    prompt += "\n\nText:\n" + text
-
-    messages = [
-        {
-            "role": "system",
-            "content": "You are a morphological matrix extraction tool. Extract the characters and their states accurately.",
-        },
-        {"role": "user", "content": prompt},
-    ]
-
-    # We use response_format to enforce Pydantic structured output
-    response = await acompletion(
+    # We use response_format to enforce Pydantic structured output.
+    # The document text is sent as a cacheable prefix so repeated calls over the
+    # same document reuse the provider-side context cache.
+    response = await acompletion_with_context(
+        context=text,
+        prompt=prompt,
         model=model,
-        messages=messages,
+        system_prompt="You are a morphological matrix extraction tool. Extract the characters and their states accurately.",
         response_format=ExtractionResult,
     )
 
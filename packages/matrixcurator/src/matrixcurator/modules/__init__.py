@@ -1,58 +1,128 @@
-from matrixcurator.modules.graph import (
-    agent_graph,
-    build_graph,
-)
-from matrixcurator.modules.memory import (
-    get_store,
-    store,
-)
-from matrixcurator.modules.nodes import (
-    CharacterStateOutput,
-    evaluator_agent,
-    extractor_agent,
-    llm_error_handler,
-    supervisor_node,
-)
-from matrixcurator.modules.schemas import (
-    ExtractRequest,
-    ExtractResponse,
-)
-from matrixcurator.modules.state import (
-    AgentState,
-    ContextSchema,
-)
-from matrixcurator.modules.tools import (
-    docling,
-    docx,
-    generate_with_re,
-    parse_with_docling,
-    parse_with_docx,
-    parse_with_pymupdf,
-    parse_with_txt,
-    pymupdf,
-    re,
-    txt,
+def lazy_import(module_name, submodules, submod_attrs, eager="auto"):
+    import importlib
+    import os
+
+    name_to_submod = {
+        func: mod for mod, funcs in submod_attrs.items() for func in funcs
+    }
+
+    def __getattr__(name):
+        if name in submodules:
+            attr = importlib.import_module(
+                "{module_name}.{name}".format(module_name=module_name, name=name)
+            )
+        elif name in name_to_submod:
+            submodname = name_to_submod[name]
+            module = importlib.import_module(f"{module_name}.{submodname}")
+            attr = getattr(module, name)
+        else:
+            raise AttributeError(f"Module {module_name!r} has no attribute {name!r}")
+        globals()[name] = attr
+        return attr
+
+    eager_import_flag = False
+    if eager == "auto":
+        eager_import_text = os.environ.get("EAGER_IMPORT", "")
+        if eager_import_text:
+            eager_import_text_ = eager_import_text.lower()
+            if eager_import_text_ in {"true", "1", "on", "yes"}:
+                eager_import_flag = True
+
+        eager_import_module_text = os.environ.get("EAGER_IMPORT_MODULES", "")
+        if eager_import_module_text:
+            if eager_import_module_text.lower() in __name__.lower():
+                eager_import_flag = True
+    else:
+        eager_import_flag = eager
+    if eager_import_flag:
+        for name in submodules:
+            __getattr__(name)
+
+        for attrs in submod_attrs.values():
+            for attr in attrs:
+                __getattr__(attr)
+    return __getattr__
+
+
+__getattr__ = lazy_import(
+    __name__,
+    submodules={
+    },
+    submod_attrs={
+        "graph": [
+            "agent_graph",
+            "build_graph",
+        ],
+        "memory": [
+            "checkpointer",
+            "get_checkpointer",
+            "get_store",
+            "prune_expired",
+            "store",
+        ],
+        "nodes": [
+            "CharacterStateOutput",
+            "evaluator_agent",
+            "extractor_agent",
+            "llm_error_handler",
+            "supervisor_node",
+        ],
+        "schemas": [
+            "ExtractRequest",
+            "ExtractResponse",
+            "ExtractStreamEvent",
+        ],
+        "state": [
+            "AgentState",
+            "ContextSchema",
+        ],
+        "tools": [
+            "docling",
+            "docx",
+            "generate_with_re",
+            "hybrid",
+            "parse_with_docling",
+            "parse_with_docx",
+            "parse_with_hybrid",
+            "parse_with_pymupdf",
+            "parse_with_txt",
+            "pymupdf",
+            "re",
+            "txt",
+        ],
+    },
 )
 
+
+def __dir__():
+    return __all__
+
+
 __all__ = [
     "AgentState",
     "CharacterStateOutput",
     "ContextSchema",
     "ExtractRequest",
     "ExtractResponse",
+    "ExtractStreamEvent",
     "agent_graph",
     "build_graph",
+    "checkpointer",
     "docling",
     "docx",
     "evaluator_agent",
     "extractor_agent",
     "generate_with_re",
+    "get_checkpointer",
     "get_store",
+    "hybrid",
     "llm_error_handler",
     "parse_with_docling",
     "parse_with_docx",
+    "parse_with_hybrid",
     "parse_with_pymupdf",
     "parse_with_txt",
+    "prune_expired",
     "pymupdf",
     "re",
     "store",
@@ -1,12 +1,15 @@
-from langgraph.graph import StateGraph, START
-from langgraph.checkpoint.memory import MemorySaver
-from matrixcurator.modules.agent.state import AgentState, ContextSchema
+from typing import Any
+
+from langgraph.graph import StateGraph, START, END
+from matrixcurator.modules.agent.state import AgentState, BatchAgentState, ContextSchema
 from matrixcurator.modules.agent.nodes import (
+    batch_evaluator_agent,
+    batch_extractor_agent,
     extractor_agent,
     evaluator_agent,
     supervisor_node,
 )
-from matrixcurator.modules.agent.memory import get_store
+from matrixcurator.modules.agent.memory import get_checkpointer, get_store
 
 
 def build_graph():
@@ -23,11 +26,57 @@ def build_graph():
     workflow.add_edge("evaluator_agent", "supervisor_node")
 
     # Compile
-    checkpointer = MemorySaver()
+    checkpointer = get_checkpointer()
     store = get_store()
 
     app = workflow.compile(checkpointer=checkpointer, store=store)
     return app
 
 
-agent_graph = build_graph()
+def build_batch_graph():
+    workflow = StateGraph(BatchAgentState, config_schema=ContextSchema)
+
+    # Add nodes
+    workflow.add_node("batch_extractor_agent", batch_extractor_agent)
+    workflow.add_node("batch_evaluator_agent", batch_evaluator_agent)
+
+    # Add edges
+    workflow.add_edge(START, "batch_extractor_agent")
+    workflow.add_edge("batch_extractor_agent", "batch_evaluator_agent")
+    workflow.add_edge("batch_evaluator_agent", END)
+
+    # Compile
+    checkpointer = get_checkpointer()
+    store = get_store()
+
+    app = workflow.compile(checkpointer=checkpointer, store=store)
+    return app
+
+
+_agent_graph = None
+_batch_agent_graph = None
+
+
+def get_agent_graph():
+    """Compiles the supervisor graph on first use and reuses it afterwards."""
+    global _agent_graph
+    if _agent_graph is None:
+        _agent_graph = build_graph()
+    return _agent_graph
+
+
+def get_batch_agent_graph():
+    """Compiles the batch extraction graph on first use and reuses it afterwards."""
+    global _batch_agent_graph
+    if _batch_agent_graph is None:
+        _batch_agent_graph = build_batch_graph()
+    return _batch_agent_graph
+
+
+def __getattr__(name: str) -> Any:
+    # Importing this module must not compile graphs or open the checkpointer
+    if name == "agent_graph":
+        return get_agent_graph()
+    if name == "batch_agent_graph":
+        return get_batch_agent_graph()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,9 +1,228 @@
+import asyncio
+import os
+import sqlite3
+import time
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Sequence
+
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import (
+    BaseCheckpointSaver,
+    ChannelVersions,
+    Checkpoint,
+    CheckpointMetadata,
+    CheckpointTuple,
+)
+from langgraph.checkpoint.memory import MemorySaver
+from langgraph.checkpoint.sqlite import SqliteSaver
+from langgraph.store.base import BaseStore, Op, Result
 from langgraph.store.memory import InMemoryStore
+from langgraph.store.sqlite import SqliteStore
+from lume import structlog
+
+from matrixcurator.config.main import settings
+
+logger = structlog.get_logger(__name__)
+
+
+def _connect(path: str, **kwargs: Any) -> sqlite3.Connection:
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    conn = sqlite3.connect(path, check_same_thread=False, **kwargs)
+    conn.execute("PRAGMA journal_mode=WAL")
+    return conn
+
+
+class SqliteCheckpointer(SqliteSaver):
+    """
+    On-disk checkpointer usable from both sync and async graph runs.
+
+    The async methods run the synchronous SQLite calls in a worker thread, so the
+    saver is not bound to the event loop it was created on. Threads that have not
+    been written to for `ttl_seconds` are deleted, checked at most once every
+    `prune_interval` seconds.
+    """
+
+    def __init__(
+        self,
+        conn: sqlite3.Connection,
+        ttl_seconds: Optional[int] = None,
+        prune_interval: float = 300.0,
+    ) -> None:
+        super().__init__(conn)
+        self.ttl_seconds = ttl_seconds
+        self.prune_interval = prune_interval
+        self._last_prune = time.monotonic()
+
+    def setup(self) -> None:
+        if self.is_setup:
+            return
+        super().setup()
+        self.conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS thread_activity (
+                thread_id TEXT PRIMARY KEY,
+                updated_at REAL NOT NULL
+            )
+            """
+        )
+        self.conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_thread_activity_updated_at ON thread_activity (updated_at)"
+        )
+
+    def put(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        next_config = super().put(config, checkpoint, metadata, new_versions)
+        with self.cursor() as cur:
+            cur.execute(
+                "INSERT OR REPLACE INTO thread_activity (thread_id, updated_at) VALUES (?, ?)",
+                (str(config["configurable"]["thread_id"]), time.time()),
+            )
+
+        if self.ttl_seconds and time.monotonic() - self._last_prune >= self.prune_interval:
+            self._last_prune = time.monotonic()
+            self.prune()
+        return next_config
+
+    def prune(self, max_age_seconds: Optional[float] = None) -> int:
+        """Deletes threads idle for longer than `max_age_seconds` (default `ttl_seconds`)."""
+        max_age = max_age_seconds if max_age_seconds is not None else self.ttl_seconds
+        if not max_age:
+            return 0
+
+        with self.cursor() as cur:
+            cur.execute(
+                "SELECT thread_id FROM thread_activity WHERE updated_at < ?",
+                (time.time() - max_age,),
+            )
+            stale = [row[0] for row in cur.fetchall()]
+
+        for thread_id in stale:
+            self.delete_thread(thread_id)
+            with self.cursor() as cur:
+                cur.execute("DELETE FROM thread_activity WHERE thread_id = ?", (thread_id,))
+
+        if stale:
+            logger.info(f"Pruned {len(stale)} expired checkpoint threads")
+        return len(stale)
+
+    async def aget_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
+        return await asyncio.to_thread(self.get_tuple, config)
+
+    async def alist(
+        self,
+        config: Optional[RunnableConfig],
+        *,
+        filter: Optional[Dict[str, Any]] = None,
+        before: Optional[RunnableConfig] = None,
+        limit: Optional[int] = None,
+    ) -> AsyncIterator[CheckpointTuple]:
+        items = await asyncio.to_thread(
+            lambda: list(self.list(config, filter=filter, before=before, limit=limit))
+        )
+        for item in items:
+            yield item
+
+    async def aput(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        return await asyncio.to_thread(self.put, config, checkpoint, metadata, new_versions)
+
+    async def aput_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        await asyncio.to_thread(self.put_writes, config, writes, task_id, task_path)
+
+    async def adelete_thread(self, thread_id: str) -> None:
+        await asyncio.to_thread(self.delete_thread, thread_id)
+
+
+class SqliteMemoryStore(SqliteStore):
+    """SQLite-backed long-term store whose async API runs in a worker thread."""
+
+    async def abatch(self, ops: Iterable[Op]) -> List[Result]:
+        return await asyncio.to_thread(self.batch, list(ops))
+
+
+def _build_checkpointer() -> BaseCheckpointSaver:
+    if settings.checkpoint_backend == "memory":
+        return MemorySaver()
+    if settings.checkpoint_backend == "sqlite":
+        return SqliteCheckpointer(
+            _connect(settings.checkpoint_db_path),
+            ttl_seconds=settings.checkpoint_ttl_seconds,
+        )
+    raise ValueError(f"Unsupported checkpoint backend: {settings.checkpoint_backend}")
+
+
+def _build_store() -> BaseStore:
+    if settings.checkpoint_backend == "memory":
+        return InMemoryStore()
+    if settings.checkpoint_backend == "sqlite":
+        ttl = None
+        if settings.checkpoint_ttl_seconds:
+            ttl = {
+                "default_ttl": settings.checkpoint_ttl_seconds / 60,
+                "refresh_on_read": True,
+            }
+        sqlite_store = SqliteMemoryStore(
+            _connect(settings.store_db_path, isolation_level=None), ttl=ttl
+        )
+        sqlite_store.setup()
+        return sqlite_store
+    raise ValueError(f"Unsupported checkpoint backend: {settings.checkpoint_backend}")
+
+
+_checkpointer: Optional[BaseCheckpointSaver] = None
+_store: Optional[BaseStore] = None
+
+
+def get_checkpointer() -> BaseCheckpointSaver:
+    """Process-wide checkpointer, opened on first use."""
+    global _checkpointer
+    if _checkpointer is None:
+        _checkpointer = _build_checkpointer()
+    return _checkpointer
+
+
+def get_store() -> BaseStore:
+    """Process-wide long-term store, opened on first use."""
+    global _store
+    if _store is None:
+        _store = _build_store()
+    return _store
+
 
-# For now, we use a simple InMemoryStore.
-# In production, this could be replaced with PostgresStore.
-store = InMemoryStore()
+def __getattr__(name: str) -> Any:
+    # `checkpointer` and `store` stay importable without opening their databases at import time
+    if name == "checkpointer":
+        return get_checkpointer()
+    if name == "store":
+        return get_store()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
-def get_store():
-    return store
+def prune_expired() -> int:
+    """Removes expired checkpoint threads and store items; returns the number of threads pruned."""
+    checkpointer = get_checkpointer()
+    store = get_store()
+    pruned = 0
+    if isinstance(checkpointer, SqliteCheckpointer):
+        pruned = checkpointer.prune()
+    if isinstance(store, SqliteStore) and store.ttl_config:
+        store.sweep_ttl()
+    return pruned
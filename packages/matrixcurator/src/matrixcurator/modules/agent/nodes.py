@@ -1,10 +1,11 @@
 # src/modules/agent/nodes.py
 import json
-from typing import Any, Dict
-from litellm import completion
+from typing import Any, Dict, List
+from matrixcurator.integrations.context_cache import acompletion_with_context
 from langgraph.types import Command
-from matrixcurator.modules.agent.state import AgentState
+from matrixcurator.modules.agent.state import AgentState, BatchAgentState
 from matrixcurator.exceptions import ContextLengthExceededError
+from matrixcurator.modules.document.registry import document_registry
 from pydantic import BaseModel, Field
 
 
@@ -16,6 +17,16 @@ class CharacterStateOutput(BaseModel):
     )
 
 
+class CharacterBatchOutput(BaseModel):
+    characters: List[CharacterStateOutput] = Field(
+        description="One entry per requested character index"
+    )
+
+
+# Minimum evaluation score for an extraction to be accepted without retrying
+ACCEPTANCE_SCORE = 8
+
+
 def llm_error_handler(state: AgentState, error: Exception) -> Command:
     """Fallback error handler for LLM nodes."""
     print(f"Error in LLM node: {error}")
@@ -28,9 +39,10 @@ def llm_error_handler(state: AgentState, error: Exception) -> Command:
     )
 
 
-def extractor_agent(state: AgentState) -> Dict[str, Any]:
-    """Extracts character data using LLM."""
-    context = state.get("context", "")
+async def extractor_agent(state: AgentState) -> Dict[str, Any]:
+    """Extracts character data using LLM without blocking the event loop."""
+    document_id = state.get("document_id")
+    context = await document_registry.resolve(document_id) if document_id else ""
     char_idx = state.get("character_index")
     model = state.get("current_model", "gemini/gemini-1.5-pro")
 
@@ -41,17 +53,16 @@ def extractor_agent(state: AgentState) -> Dict[str, Any]:
         raise ContextLengthExceededError("Context too large for extraction.")
 
     prompt = f"""
-    Extract the character state information for character index {char_idx} from the following text.
+    Extract the character state information for character index {char_idx} from the text above.
     Return the data in a structured format.
-    
-    Text:
-    {context[:50000]} # Truncate for safety in this example
     """
 
     try:
-        response = completion(
+        # The document text is sent as a cacheable prefix shared by every character
+        response = await acompletion_with_context(
+            context=context[:50000],  # Truncate for safety in this example
+            prompt=prompt,
             model=model,
-            messages=[{"role": "user", "content": prompt}],
             response_format=CharacterStateOutput,
             max_retries=2,
         )
@@ -71,20 +82,83 @@ def extractor_agent(state: AgentState) -> Dict[str, Any]:
         raise e  # Let the retry policy or error handler catch it
 
 
+def _score_extraction(data: Dict[str, Any]) -> int:
+    """Simple heuristic evaluation for now."""
+    score = 10
+    if not data.get("character_name"):
+        score -= 5
+    if not data.get("states"):
+        score -= 5
+    return score
+
+
 def evaluator_agent(state: AgentState) -> Dict[str, Any]:
     """Evaluates the extracted data."""
     data = state.get("extracted_data")
     if not data:
         return {"evaluation_score": 0}
 
-    # Simple heuristic evaluation for now
-    score = 10
-    if not data.get("character_name"):
-        score -= 5
-    if not data.get("states"):
-        score -= 5
+    return {"evaluation_score": _score_extraction(data)}
+
+
+async def batch_extractor_agent(state: BatchAgentState) -> Dict[str, Any]:
+    """Extracts a contiguous block of characters in a single structured LLM call."""
+    document_id = state.get("document_id")
+    context = await document_registry.resolve(document_id) if document_id else ""
+    char_indices = state.get("character_indices", [])
+    model = state.get("current_model", "gemini/gemini-1.5-pro")
+
+    if not context:
+        return {"extracted_batch": None, "errors": ["Empty context provided."]}
+
+    if len(context) > 1000000:  # Arbitrary large limit for safety
+        raise ContextLengthExceededError("Context too large for extraction.")
+
+    prompt = f"""
+    Extract the character state information for each of the character indices {char_indices} from the text above.
+    Return exactly one entry per character index in a structured format.
+    """
+
+    response = await acompletion_with_context(
+        context=context[:50000],  # Truncate for safety in this example
+        prompt=prompt,
+        model=model,
+        response_format=CharacterBatchOutput,
+        max_retries=2,
+    )
+
+    content = response.choices[0].message.content
+    if isinstance(content, str):
+        data = json.loads(content)
+    else:
+        data = content
+
+    if isinstance(data, BaseModel):
+        data = data.model_dump()
+
+    characters = data.get("characters", []) if isinstance(data, dict) else data
+    return {"extracted_batch": characters or []}
+
+
+def batch_evaluator_agent(state: BatchAgentState) -> Dict[str, Any]:
+    """Accepts well-formed batch results and flags the rest for per-character retries."""
+    char_indices = state.get("character_indices", [])
+    requested = set(char_indices)
+
+    accepted: Dict[int, Dict[str, Any]] = {}
+    for data in state.get("extracted_batch") or []:
+        if not isinstance(data, dict):
+            continue
+        idx = data.get("character_index")
+        if idx not in requested or idx in accepted:
+            continue
+        if _score_extraction(data) >= ACCEPTANCE_SCORE:
+            accepted[idx] = data
 
-    return {"evaluation_score": score}
+    return {
+        "accepted": [accepted[idx] for idx in char_indices if idx in accepted],
+        "pending_indices": [idx for idx in char_indices if idx not in accepted],
+    }
 
 
 def supervisor_node(state: AgentState) -> Command:
@@ -98,7 +172,7 @@ def supervisor_node(state: AgentState) -> Command:
     if not data and attempts < MAX_ATTEMPTS:
         return Command(goto="extractor_agent")
 
-    if data and score < 8 and attempts < MAX_ATTEMPTS:
+    if data and score < ACCEPTANCE_SCORE and attempts < MAX_ATTEMPTS:
         return Command(goto="extractor_agent")
 
     return Command(goto="__end__")
@@ -13,9 +13,21 @@ class ContextSchema:
 
 class AgentState(MessagesState):
     character_index: int
-    context: str
+    # Content hash of the document in the document registry
+    document_id: str
     extracted_data: Optional[Dict[str, Any]]
     evaluation_score: int
     attempts: int
     current_model: str
     errors: Annotated[List[str], operator.add]
+
+
+class BatchAgentState(MessagesState):
+    character_indices: List[int]
+    # Content hash of the document in the document registry
+    document_id: str
+    extracted_batch: Optional[List[Dict[str, Any]]]
+    accepted: List[Dict[str, Any]]
+    pending_indices: List[int]
+    current_model: str
+    errors: Annotated[List[str], operator.add]
@@ -0,0 +1,157 @@
+# src/modules/document/cache.py
+import asyncio
+import hashlib
+import json
+from importlib import metadata
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from matrixcurator.config.main import settings
+from matrixcurator.utils.cache import SQLiteCache
+
+__all__ = [
+    "cached_parse",
+    "cached_text",
+    "get_parse_cache",
+    "parse_cache_key",
+    "parser_version",
+]
+
+# Bump when the stored page format or a parser's output changes in this codebase
+PARSE_CACHE_VERSION = 1
+
+_PARSER_DISTRIBUTIONS = {
+    "pymupdf": "PyMuPDF",
+    "docling": "docling",
+    "docx": "python-docx",
+}
+
+_parse_cache: Optional[SQLiteCache] = None
+
+
+def get_parse_cache() -> Optional[SQLiteCache]:
+    """
+    Returns the persistent parse cache singleton,
+    or None if parse caching is disabled in settings.
+    """
+    global _parse_cache
+
+    if not settings.parse_cache_enabled:
+        return None
+
+    if _parse_cache is None:
+        _parse_cache = SQLiteCache(
+            settings.parse_cache_path, max_bytes=settings.parse_cache_max_bytes
+        )
+    return _parse_cache
+
+
+def parser_version(parser: str) -> Optional[str]:
+    """Installed version of the library behind `parser`, if it has one."""
+    distribution = _PARSER_DISTRIBUTIONS.get(parser)
+    if distribution is None:
+        return None
+    try:
+        return metadata.version(distribution)
+    except metadata.PackageNotFoundError:
+        return None
+
+
+def parse_cache_key(
+    file_sha256: str,
+    parser: str,
+    options: Dict[str, Any],
+    page: Optional[int],
+) -> str:
+    """Cache key for one parsed page; `page=None` addresses the whole document."""
+    payload = json.dumps(
+        {
+            "cache_version": PARSE_CACHE_VERSION,
+            "file": file_sha256,
+            "parser": parser,
+            "version": parser_version(parser),
+            "options": options,
+            "page": page,
+        },
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+async def cached_parse(
+    parser: str,
+    file_content: bytes,
+    pages: Optional[List[int]],
+    parse: Callable[[Optional[List[int]]], Awaitable[List[Dict[str, Any]]]],
+    options: Optional[Dict[str, Any]] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Serves `[{"page", "content"}]` parses from the cache, page by page.
+
+    `parse(pages)` is only awaited for what is missing: the uncached subset of an
+    explicit page selection, or the whole document when `pages` is None and no
+    complete whole-document parse is stored. Its results are written back per page,
+    plus a whole-document entry listing the page numbers when `pages` is None.
+    """
+    cache = get_parse_cache()
+    if cache is None:
+        return await parse(pages)
+
+    options = options or {}
+    file_sha256 = hashlib.sha256(file_content).hexdigest()
+
+    def key(page: Optional[int]) -> str:
+        return parse_cache_key(file_sha256, parser, options, page)
+
+    wanted = list(dict.fromkeys(pages)) if pages is not None else None
+    if wanted is None:
+        manifest = await asyncio.to_thread(cache.get, key(None))
+        if manifest is not None:
+            wanted = json.loads(manifest)
+
+    cached: Dict[int, str] = {}
+    if wanted is not None:
+        keys = {key(p): p for p in wanted}
+        found = await asyncio.to_thread(cache.get_many, keys)
+        cached = {keys[k]: value.decode("utf-8") for k, value in found.items()}
+        if len(cached) == len(wanted):
+            return [{"page": p, "content": cached[p]} for p in wanted]
+
+    if pages is not None:
+        parsed = await parse([p for p in wanted if p not in cached])
+    else:
+        parsed = await parse(None)
+
+    entries = {key(page["page"]): page["content"].encode("utf-8") for page in parsed}
+    if pages is None:
+        entries[key(None)] = json.dumps([page["page"] for page in parsed]).encode("utf-8")
+    await asyncio.to_thread(cache.set_many, entries)
+
+    if pages is None:
+        return parsed
+    contents = {page["page"]: page["content"] for page in parsed}
+    contents.update(cached)
+    return [{"page": p, "content": contents[p]} for p in wanted if p in contents]
+
+
+def cached_text(
+    parser: str,
+    file_content: bytes,
+    parse: Callable[[], str],
+    options: Optional[Dict[str, Any]] = None,
+) -> str:
+    """Synchronous whole-document variant of `cached_parse` for plain-text parses."""
+    cache = get_parse_cache()
+    if cache is None:
+        return parse()
+
+    key = parse_cache_key(
+        hashlib.sha256(file_content).hexdigest(), parser, options or {}, None
+    )
+    value = cache.get(key)
+    if value is not None:
+        return value.decode("utf-8")
+
+    text = parse()
+    cache.set(key, text.encode("utf-8"))
+    return text
@@ -0,0 +1,61 @@
+# src/modules/document/registry.py
+from collections import OrderedDict
+from typing import Optional
+
+from matrixcurator.exceptions import DocumentNotFoundError
+from matrixcurator.integrations.context_cache import document_hash
+from matrixcurator.modules.agent.memory import get_store
+
+__all__ = ["DOCUMENTS_NAMESPACE", "DocumentRegistry", "document_registry"]
+
+DOCUMENTS_NAMESPACE = ("documents",)
+
+
+class DocumentRegistry:
+    """
+    Stores each parsed document once under its content hash.
+
+    Graph state only carries the returned `document_id`, so checkpoints stay small
+    no matter how long the article is. Texts are persisted in the agent store so
+    resumed runs can still resolve them, and the most recently used ones are kept
+    in memory to avoid reloading them for every character.
+    """
+
+    def __init__(self, max_cached: int = 8) -> None:
+        self.max_cached = max_cached
+        self._cache: "OrderedDict[str, str]" = OrderedDict()
+
+    def _remember(self, document_id: str, context: str) -> None:
+        self._cache[document_id] = context
+        self._cache.move_to_end(document_id)
+        while len(self._cache) > self.max_cached:
+            self._cache.popitem(last=False)
+
+    async def register(self, context: str) -> str:
+        """Stores the document if it is new and returns its id."""
+        document_id = document_hash(context)
+        # Always check the store, even for documents held in memory: the read
+        # refreshes the store's TTL, and a document that already expired there
+        # is written again so resumed runs can still resolve it
+        store = get_store()
+        if await store.aget(DOCUMENTS_NAMESPACE, document_id) is None:
+            await store.aput(DOCUMENTS_NAMESPACE, document_id, {"text": context})
+        self._remember(document_id, context)
+        return document_id
+
+    async def resolve(self, document_id: str) -> str:
+        """Returns the text registered under `document_id`."""
+        context: Optional[str] = self._cache.get(document_id)
+        if context is None:
+            item = await get_store().aget(DOCUMENTS_NAMESPACE, document_id)
+            if item is None:
+                raise DocumentNotFoundError(f"Unknown document: {document_id}")
+            context = item.value["text"]
+        self._remember(document_id, context)
+        return context
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+
+document_registry = DocumentRegistry()
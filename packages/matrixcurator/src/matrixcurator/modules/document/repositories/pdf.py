@@ -1,13 +1,142 @@
+import multiprocessing
+import unicodedata
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional
+
 import fitz  # PyMuPDF
+from matrixcurator.config.main import settings
 from matrixcurator.exceptions import DocumentParseError
 
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_workers = 0
 
-def read_pdf(file_content: bytes, **kwargs) -> str:
+
+def get_pool(workers: int) -> ProcessPoolExecutor:
+    """Returns the shared page-parsing process pool, resized if `workers` changed."""
+    global _pool, _pool_workers
+    if _pool is None or _pool_workers != workers:
+        if _pool is not None:
+            _pool.shutdown(wait=False)
+        # Spawned workers do not inherit the parent's threads or open handles
+        _pool = ProcessPoolExecutor(
+            max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+        )
+        _pool_workers = workers
+    return _pool
+
+
+def _extract_page_texts(file_content: bytes, page_numbers: List[int]) -> List[str]:
+    doc = fitz.open(stream=file_content, filetype="pdf")
+    try:
+        return [doc[p - 1].get_text() for p in page_numbers]
+    finally:
+        doc.close()
+
+
+def read_pdf_pages(
+    file_content: bytes,
+    pages: Optional[List[int]] = None,
+    workers: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Extracts text page by page and returns `[{"page": n, "content": text}]`.
+
+    `pages` are 1-based; out-of-range pages are skipped. With more than one worker
+    and at least `settings.pdf_parallel_min_pages` pages, contiguous page shards
+    are parsed in a process pool, each worker opening the document once.
+    """
+    workers = workers or settings.pdf_parse_workers
     try:
         doc = fitz.open(stream=file_content, filetype="pdf")
-        text = ""
-        for page in doc:
-            text += page.get_text()
-        return text
+        try:
+            total = doc.page_count
+            candidates = pages if pages is not None else range(1, total + 1)
+            page_numbers = [p for p in candidates if 1 <= p <= total]
+            parallel = workers > 1 and len(page_numbers) >= settings.pdf_parallel_min_pages
+            if not parallel:
+                # Serial parses reuse the document opened for the page count
+                texts = [doc[p - 1].get_text() for p in page_numbers]
+        finally:
+            doc.close()
+
+        if parallel:
+            shard_size = -(-len(page_numbers) // workers)
+            shards = [
+                page_numbers[i : i + shard_size]
+                for i in range(0, len(page_numbers), shard_size)
+            ]
+            pool = get_pool(workers)
+            futures = [
+                pool.submit(_extract_page_texts, file_content, shard) for shard in shards
+            ]
+            texts = [text for future in futures for text in future.result()]
     except Exception as e:
         raise DocumentParseError(f"Failed to parse PDF: {str(e)}") from e
+
+    return [{"page": p, "content": text} for p, text in zip(page_numbers, texts)]
+
+
+def _garbled_ratio(text: str) -> float:
+    """Share of visible characters that are replacement, private-use or control glyphs."""
+    visible = [c for c in text if not c.isspace()]
+    if not visible:
+        return 0.0
+    garbled = sum(
+        1
+        for c in visible
+        if c == "\ufffd" or "\ue000" <= c <= "\uf8ff" or unicodedata.category(c) == "Cc"
+    )
+    return garbled / len(visible)
+
+
+def assess_text_layer(
+    file_content: bytes, pages: List[Dict[str, Any]]
+) -> List[Dict[str, Any]]:
+    """
+    Scores the extracted text layer of each page in `pages` (`read_pdf_pages` output).
+
+    Returns `[{"page", "needs_vlm", "reasons"}]`. A page needs a VLM when its text is
+    garbled, when it has little text but carries images (scans, figure pages), when
+    images cover most of it, or when it contains tables (if table detection is on).
+    Table detection is by far the slowest check, so it only runs on pages the other
+    checks let through.
+    """
+    assessments = []
+    try:
+        doc = fitz.open(stream=file_content, filetype="pdf")
+        try:
+            for parsed in pages:
+                page = doc[parsed["page"] - 1]
+                text = parsed["content"]
+                area = page.rect.width * page.rect.height
+                # Text density in visible characters per square inch
+                density = sum(not c.isspace() for c in text) / (area / 72**2) if area else 0.0
+                image_area = sum(
+                    fitz.Rect(info["bbox"]).intersect(page.rect).get_area()
+                    for info in page.get_image_info()
+                )
+                image_coverage = min(1.0, image_area / area) if area else 0.0
+
+                reasons = []
+                if _garbled_ratio(text) > settings.hybrid_max_garbled_ratio:
+                    reasons.append("garbled")
+                if image_coverage > 0 and density < settings.hybrid_min_text_density:
+                    reasons.append("low_text")
+                elif image_coverage > settings.hybrid_max_image_coverage:
+                    reasons.append("figures")
+                if not reasons and settings.hybrid_detect_tables and page.find_tables().tables:
+                    reasons.append("tables")
+
+                assessments.append(
+                    {"page": parsed["page"], "needs_vlm": bool(reasons), "reasons": reasons}
+                )
+        finally:
+            doc.close()
+    except Exception as e:
+        raise DocumentParseError(f"Failed to assess PDF text layer: {str(e)}") from e
+
+    return assessments
+
+
+def read_pdf(file_content: bytes, **kwargs) -> str:
+    return "".join(page["content"] for page in read_pdf_pages(file_content, **kwargs))
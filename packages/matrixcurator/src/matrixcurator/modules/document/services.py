@@ -5,19 +5,28 @@ from matrixcurator.modules.document.repositories.docx import read_docx
 from matrixcurator.modules.document.repositories.txt import read_txt
 from matrixcurator.modules.document.repositories.nexus import write_nexus
 from matrixcurator.exceptions import DocumentParseError
+from matrixcurator.modules.document.cache import cached_text
 
 
 def parse_document(file_content: bytes, filename: str, **kwargs) -> str:
     filename = filename.lower()
     if filename.endswith(".pdf"):
-        return read_pdf(file_content, **kwargs)
+        parser, read = "pymupdf", read_pdf
     elif filename.endswith(".docx"):
-        return read_docx(file_content, **kwargs)
+        parser, read = "docx", read_docx
     elif filename.endswith(".txt"):
+        # Decoding is cheaper than a cache lookup
         return read_txt(file_content, **kwargs)
     else:
         raise DocumentParseError("Unsupported file type")
 
+    # Worker counts do not change the parsed text, so they are not part of the key
+    options = {key: value for key, value in kwargs.items() if key != "workers"}
+    options["source"] = "parse_document"
+    return cached_text(
+        parser, file_content, lambda: read(file_content, **kwargs), options=options
+    )
+
 
 def generate_document(
     original_nexus: str, extracted_states: List[Dict[str, Any]], **kwargs
@@ -1,12 +1,13 @@
+from typing import Any
+
 from langgraph.graph import StateGraph, START
-from langgraph.checkpoint.memory import MemorySaver
 from matrixcurator.modules.state import AgentState, ContextSchema
 from matrixcurator.modules.nodes import (
     extractor_agent,
     evaluator_agent,
     supervisor_node,
 )
-from matrixcurator.modules.memory import get_store
+from matrixcurator.modules.memory import get_checkpointer, get_store
 
 
 def build_graph():
@@ -23,11 +24,25 @@ def build_graph():
     workflow.add_edge("evaluator_agent", "supervisor_node")
 
     # Compile
-    checkpointer = MemorySaver()
+    checkpointer = get_checkpointer()
     store = get_store()
 
     app = workflow.compile(checkpointer=checkpointer, store=store)
     return app
 
 
-agent_graph = build_graph()
+_agent_graph = None
+
+
+def get_agent_graph():
+    """Compiles the graph on first use and reuses it afterwards."""
+    global _agent_graph
+    if _agent_graph is None:
+        _agent_graph = build_graph()
+    return _agent_graph
+
+
+def __getattr__(name: str) -> Any:
+    if name == "agent_graph":
+        return get_agent_graph()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
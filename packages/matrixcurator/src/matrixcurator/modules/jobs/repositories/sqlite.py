@@ -0,0 +1,243 @@
+import json
+import os
+import time
+from typing import Any, Dict, List, Optional
+from sqlalchemy import and_, create_engine, Column, Float, Integer, or_, String, Text, update
+from sqlalchemy.orm import declarative_base, Session
+
+from matrixcurator.config.main import settings
+from matrixcurator.modules.jobs.schemas import JobStatus
+
+Base = declarative_base()
+
+
+class JobRecord(Base):
+    __tablename__ = "extraction_jobs"
+
+    id = Column(String, primary_key=True)
+    status = Column(String, index=True)
+    request_json = Column(Text)
+    total = Column(Integer)
+    error = Column(Text, nullable=True)
+    worker_id = Column(String, nullable=True)
+    created_at = Column(Float, index=True)
+    # Doubles as the lease heartbeat while the job is running
+    updated_at = Column(Float)
+
+
+class JobResultRecord(Base):
+    __tablename__ = "extraction_job_results"
+
+    job_id = Column(String, primary_key=True)
+    character_index = Column(Integer, primary_key=True)
+    extracted_data_json = Column(Text, nullable=True)
+    evaluation_score = Column(Integer, nullable=True)
+    errors_json = Column(Text)
+
+
+_engine = None
+
+
+def get_engine():
+    global _engine
+    if _engine is None:
+        directory = os.path.dirname(settings.jobs_db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        _engine = create_engine(f"sqlite:///{settings.jobs_db_path}")
+        Base.metadata.create_all(_engine)
+        with _engine.begin() as conn:
+            # Job databases created before leases were tracked lack the owner column
+            columns = {row[1] for row in conn.exec_driver_sql("PRAGMA table_info(extraction_jobs)")}
+            if "worker_id" not in columns:
+                conn.exec_driver_sql("ALTER TABLE extraction_jobs ADD COLUMN worker_id VARCHAR")
+    return _engine
+
+
+def _job_to_dict(job: JobRecord) -> Dict[str, Any]:
+    return {
+        "id": job.id,
+        "status": JobStatus(job.status),
+        "request_json": job.request_json,
+        "total": job.total,
+        "error": job.error,
+        "worker_id": job.worker_id,
+        "created_at": job.created_at,
+        "updated_at": job.updated_at,
+    }
+
+
+def create_job(job_id: str, request_json: str, total: int) -> None:
+    now = time.time()
+    with Session(get_engine()) as session:
+        session.add(
+            JobRecord(
+                id=job_id,
+                status=JobStatus.QUEUED.value,
+                request_json=request_json,
+                total=total,
+                created_at=now,
+                updated_at=now,
+            )
+        )
+        session.commit()
+
+
+def get_job(job_id: str) -> Optional[Dict[str, Any]]:
+    with Session(get_engine()) as session:
+        job = session.get(JobRecord, job_id)
+        return _job_to_dict(job) if job else None
+
+
+def claim_next_job(worker_id: str) -> Optional[Dict[str, Any]]:
+    """
+    Atomically leases the oldest claimable job to `worker_id` and returns it.
+
+    Queued jobs are claimable, and so are running jobs whose lease has not been
+    renewed for `job_lease_seconds` (their worker died or was restarted).
+    """
+    stale_before = time.time() - settings.job_lease_seconds
+    with Session(get_engine()) as session:
+        candidates = (
+            session.query(JobRecord.id, JobRecord.status, JobRecord.updated_at)
+            .filter(
+                or_(
+                    JobRecord.status == JobStatus.QUEUED.value,
+                    and_(
+                        JobRecord.status == JobStatus.RUNNING.value,
+                        JobRecord.updated_at < stale_before,
+                    ),
+                )
+            )
+            .order_by(JobRecord.created_at)
+            .limit(5)
+            .all()
+        )
+        for job_id, status, updated_at in candidates:
+            # Conditional update so only one worker can claim a given job
+            result = session.execute(
+                update(JobRecord)
+                .where(
+                    JobRecord.id == job_id,
+                    JobRecord.status == status,
+                    JobRecord.updated_at == updated_at,
+                )
+                .values(status=JobStatus.RUNNING.value, worker_id=worker_id, updated_at=time.time())
+            )
+            session.commit()
+            if result.rowcount == 1:
+                return _job_to_dict(session.get(JobRecord, job_id))
+    return None
+
+
+def _holds_lease(job_id: str, worker_id: str):
+    return (
+        JobRecord.id == job_id,
+        JobRecord.worker_id == worker_id,
+        JobRecord.status == JobStatus.RUNNING.value,
+    )
+
+
+def renew_lease(job_id: str, worker_id: str) -> bool:
+    """Refreshes the heartbeat of a running job; returns False if the worker lost it."""
+    with Session(get_engine()) as session:
+        result = session.execute(
+            update(JobRecord)
+            .where(*_holds_lease(job_id, worker_id))
+            .values(updated_at=time.time())
+        )
+        session.commit()
+        return result.rowcount == 1
+
+
+def finish_job(
+    job_id: str,
+    worker_id: str,
+    status: JobStatus,
+    error: Optional[str] = None,
+) -> bool:
+    """Records the final status if `worker_id` still holds the lease; returns False otherwise."""
+    with Session(get_engine()) as session:
+        result = session.execute(
+            update(JobRecord)
+            .where(*_holds_lease(job_id, worker_id))
+            .values(status=status.value, error=error, updated_at=time.time())
+        )
+        session.commit()
+        return result.rowcount == 1
+
+
+def release_jobs(worker_ids: List[str]) -> int:
+    """Puts the running jobs leased to `worker_ids` back on the queue."""
+    with Session(get_engine()) as session:
+        result = session.execute(
+            update(JobRecord)
+            .where(
+                JobRecord.status == JobStatus.RUNNING.value,
+                JobRecord.worker_id.in_(worker_ids),
+            )
+            .values(status=JobStatus.QUEUED.value, worker_id=None, updated_at=time.time())
+        )
+        session.commit()
+        return result.rowcount
+
+
+def save_result(job_id: str, worker_id: str, event: Dict[str, Any]) -> bool:
+    """
+    Records one character result and renews the lease, in one transaction.
+
+    Nothing is written if `worker_id` no longer holds the lease; returns False then.
+    """
+    with Session(get_engine()) as session:
+        renewed = session.execute(
+            update(JobRecord)
+            .where(*_holds_lease(job_id, worker_id))
+            .values(updated_at=time.time())
+        )
+        if renewed.rowcount != 1:
+            session.rollback()
+            return False
+
+        session.merge(
+            JobResultRecord(
+                job_id=job_id,
+                character_index=event["character_index"],
+                extracted_data_json=json.dumps(event.get("extracted_data"))
+                if event.get("extracted_data")
+                else None,
+                evaluation_score=event.get("evaluation_score"),
+                errors_json=json.dumps(event.get("errors") or []),
+            )
+        )
+        session.commit()
+        return True
+
+
+def get_results(job_id: str) -> List[Dict[str, Any]]:
+    with Session(get_engine()) as session:
+        rows = (
+            session.query(JobResultRecord)
+            .filter(JobResultRecord.job_id == job_id)
+            .order_by(JobResultRecord.character_index)
+            .all()
+        )
+        return [
+            {
+                "character_index": row.character_index,
+                "extracted_data": json.loads(row.extracted_data_json)
+                if row.extracted_data_json
+                else None,
+                "evaluation_score": row.evaluation_score,
+                "errors": json.loads(row.errors_json) if row.errors_json else [],
+            }
+            for row in rows
+        ]
+
+
+def count_results(job_id: str) -> int:
+    with Session(get_engine()) as session:
+        return (
+            session.query(JobResultRecord)
+            .filter(JobResultRecord.job_id == job_id)
+            .count()
+        )
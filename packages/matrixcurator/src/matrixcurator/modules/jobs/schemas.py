@@ -0,0 +1,32 @@
+from enum import Enum
+from pydantic import BaseModel
+from typing import List, Dict, Any, Optional
+
+
+class JobStatus(str, Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+class JobSubmitResponse(BaseModel):
+    job_id: str
+    status: JobStatus
+
+
+class JobStatusResponse(BaseModel):
+    job_id: str
+    status: JobStatus
+    completed: int
+    total: int
+    created_at: float
+    updated_at: float
+    error: Optional[str] = None
+
+
+class JobResultsResponse(BaseModel):
+    job_id: str
+    status: JobStatus
+    extracted_states: List[Dict[str, Any]]
+    errors: List[str]
@@ -0,0 +1,182 @@
+# src/modules/jobs/services.py
+import asyncio
+import uuid
+from typing import Any, List, Optional
+from lume import structlog
+
+from matrixcurator.config.main import settings
+from matrixcurator.modules.schemas import ExtractRequest
+from matrixcurator.modules.jobs.schemas import (
+    JobStatus,
+    JobStatusResponse,
+    JobResultsResponse,
+)
+from matrixcurator.modules.jobs.repositories.sqlite import (
+    claim_next_job,
+    count_results,
+    create_job,
+    finish_job,
+    get_job,
+    get_results,
+    release_jobs,
+    renew_lease,
+    save_result,
+)
+
+logger = structlog.get_logger(__name__)
+
+
+def submit_job(request: ExtractRequest) -> str:
+    """Queues an extraction request and returns its job id."""
+    job_id = str(uuid.uuid4())
+    total = len(set(request.character_indices))
+    create_job(job_id, request.model_dump_json(), total)
+    logger.info(f"Queued extraction job {job_id} for {total} characters")
+    return job_id
+
+
+def get_job_status(job_id: str) -> Optional[JobStatusResponse]:
+    job = get_job(job_id)
+    if job is None:
+        return None
+
+    return JobStatusResponse(
+        job_id=job_id,
+        status=job["status"],
+        completed=count_results(job_id),
+        total=job["total"],
+        created_at=job["created_at"],
+        updated_at=job["updated_at"],
+        error=job["error"],
+    )
+
+
+def get_job_results(job_id: str) -> Optional[JobResultsResponse]:
+    """Returns the results recorded so far, ordered like the submitted indices."""
+    job = get_job(job_id)
+    if job is None:
+        return None
+
+    request = ExtractRequest.model_validate_json(job["request_json"])
+    results = {result["character_index"]: result for result in get_results(job_id)}
+
+    extracted_states = []
+    errors: List[str] = []
+    for idx in dict.fromkeys(request.character_indices):
+        result = results.get(idx)
+        if result is None:
+            continue
+        if result["extracted_data"]:
+            extracted_states.append(result["extracted_data"])
+        errors.extend(result["errors"])
+
+    return JobResultsResponse(
+        job_id=job_id,
+        status=job["status"],
+        extracted_states=extracted_states,
+        errors=errors,
+    )
+
+
+class JobWorkerPool:
+    """
+    Runs queued extraction jobs on a fixed number of asyncio workers.
+
+    Each character result is persisted as soon as it finishes. A worker leases
+    the job it runs and renews the lease while it works; jobs are released on
+    shutdown, and a job whose worker died is claimed again once its lease
+    expires, so only its remaining characters are extracted again. Graph runs use
+    deterministic thread ids per job and character so they continue from their
+    checkpoints.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        workers: Optional[int] = None,
+        poll_interval: float = 1.0,
+    ) -> None:
+        self.client = client
+        self.workers = workers or settings.job_workers
+        self.poll_interval = poll_interval
+        self.worker_ids = [f"{uuid.uuid4().hex[:12]}-{i}" for i in range(self.workers)]
+        self._tasks: List[asyncio.Task] = []
+
+    async def start(self) -> None:
+        self._tasks = [
+            asyncio.create_task(self._worker(worker_id)) for worker_id in self.worker_ids
+        ]
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+        released = await asyncio.to_thread(release_jobs, self.worker_ids)
+        if released:
+            logger.info(f"Released {released} unfinished extraction jobs")
+
+    async def _worker(self, worker_id: str) -> None:
+        while True:
+            job = await asyncio.to_thread(claim_next_job, worker_id)
+            if job is None:
+                await asyncio.sleep(self.poll_interval)
+                continue
+
+            logger.info(f"Worker {worker_id} picked up job {job['id']}")
+            await self.run_job(job)
+
+    async def _heartbeat(self, job_id: str, worker_id: str) -> None:
+        """Renews the lease until it is lost; returning means another worker owns the job."""
+        while True:
+            await asyncio.sleep(settings.job_lease_seconds / 3)
+            if not await asyncio.to_thread(renew_lease, job_id, worker_id):
+                return
+
+    async def _extract(
+        self, job_id: str, worker_id: str, request: ExtractRequest, pending: List[int]
+    ) -> bool:
+        """Streams and saves the pending characters; returns False if the lease was lost."""
+        async for event in self.client.stream_characters(
+            context=request.context,
+            character_indices=pending,
+            user_id=request.user_id,
+            job_id=job_id,
+        ):
+            if not await asyncio.to_thread(save_result, job_id, worker_id, event):
+                return False
+        return True
+
+    async def run_job(self, job: dict) -> None:
+        job_id = job["id"]
+        worker_id = job["worker_id"]
+        request = ExtractRequest.model_validate_json(job["request_json"])
+
+        done = {result["character_index"] for result in await asyncio.to_thread(get_results, job_id)}
+        pending = [idx for idx in dict.fromkeys(request.character_indices) if idx not in done]
+
+        extraction = asyncio.create_task(self._extract(job_id, worker_id, request, pending))
+        heartbeat = asyncio.create_task(self._heartbeat(job_id, worker_id))
+        try:
+            await asyncio.wait({extraction, heartbeat}, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            # Also stops the extraction when the lease is lost or the pool shuts down
+            extraction.cancel()
+            heartbeat.cancel()
+        await asyncio.gather(extraction, heartbeat, return_exceptions=True)
+
+        if not extraction.cancelled() and extraction.exception() is not None:
+            e = extraction.exception()
+            logger.error(f"Extraction job {job_id} failed: {str(e)}")
+            await asyncio.to_thread(finish_job, job_id, worker_id, JobStatus.FAILED, str(e))
+            return
+
+        if extraction.cancelled() or not extraction.result():
+            logger.warning(f"Worker {worker_id} lost the lease on job {job_id}, stopping")
+            return
+
+        if await asyncio.to_thread(finish_job, job_id, worker_id, JobStatus.COMPLETED):
+            logger.info(f"Extraction job {job_id} completed")
+        else:
+            logger.warning(f"Worker {worker_id} lost the lease on job {job_id} before completing it")
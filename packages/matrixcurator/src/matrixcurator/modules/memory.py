@@ -1,9 +1,17 @@
-from langgraph.store.memory import InMemoryStore
+from typing import Any
 
-# For now, we use a simple InMemoryStore.
-# In production, this could be replaced with PostgresStore.
-store = InMemoryStore()
+from matrixcurator.modules.agent import memory as _memory
+from matrixcurator.modules.agent.memory import (
+    get_checkpointer,
+    get_store,
+    prune_expired,
+)
 
+# Both agent graph trees share the process-wide checkpointer and store.
+__all__ = ["checkpointer", "get_checkpointer", "get_store", "prune_expired", "store"]
 
-def get_store():
-    return store
+
+def __getattr__(name: str) -> Any:
+    if name in ("checkpointer", "store"):
+        return getattr(_memory, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,10 +1,11 @@
 # src/modules/agent/nodes.py
 import json
 from typing import Any, Dict
-from litellm import completion
+from matrixcurator.integrations.context_cache import acompletion_with_context
 from langgraph.types import Command
 from matrixcurator.modules.state import AgentState
 from matrixcurator.exceptions import ContextLengthExceededError
+from matrixcurator.modules.document.registry import document_registry
 from pydantic import BaseModel, Field
 
 
@@ -28,9 +29,10 @@ def llm_error_handler(state: AgentState, error: Exception) -> Command:
     )
 
 
-def extractor_agent(state: AgentState) -> Dict[str, Any]:
-    """Extracts character data using LLM."""
-    context = state.get("context", "")
+async def extractor_agent(state: AgentState) -> Dict[str, Any]:
+    """Extracts character data using LLM without blocking the event loop."""
+    document_id = state.get("document_id")
+    context = await document_registry.resolve(document_id) if document_id else ""
     char_idx = state.get("character_index")
     model = state.get("current_model", "gemini/gemini-1.5-pro")
 
@@ -41,17 +43,16 @@ def extractor_agent(state: AgentState) -> Dict[str, Any]:
         raise ContextLengthExceededError("Context too large for extraction.")
 
     prompt = f"""
-    Extract the character state information for character index {char_idx} from the following text.
+    Extract the character state information for character index {char_idx} from the text above.
     Return the data in a structured format.
-    
-    Text:
-    {context[:50000]} # Truncate for safety in this example
     """
 
     try:
-        response = completion(
+        # The document text is sent as a cacheable prefix shared by every character
+        response = await acompletion_with_context(
+            context=context[:50000],  # Truncate for safety in this example
+            prompt=prompt,
             model=model,
-            messages=[{"role": "user", "content": prompt}],
             response_format=CharacterStateOutput,
             max_retries=2,
         )
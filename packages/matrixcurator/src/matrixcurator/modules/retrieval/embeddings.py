@@ -0,0 +1,58 @@
+from typing import Dict, Optional
+
+from matrixcurator.config.main import settings
+
+__all__ = ["EMBEDDING_DIMENSIONS", "embedding_dimension"]
+
+# Output dimension of each embedding model at its default size, keyed by the
+# litellm model string; models served under several provider prefixes are also
+# matched on the name after the prefix
+EMBEDDING_DIMENSIONS: Dict[str, int] = {
+    # Google Gemini
+    "gemini/gemini-embedding-2": 3072,
+    "gemini/gemini-embedding-001": 3072,
+    "gemini/text-embedding-004": 768,
+    "vertex_ai/text-embedding-005": 768,
+    "vertex_ai/text-multilingual-embedding-002": 768,
+    # OpenAI
+    "text-embedding-3-small": 1536,
+    "text-embedding-3-large": 3072,
+    "text-embedding-ada-002": 1536,
+    # Cohere
+    "embed-english-v3.0": 1024,
+    "embed-multilingual-v3.0": 1024,
+    "embed-english-light-v3.0": 384,
+    "embed-multilingual-light-v3.0": 384,
+    # Mistral
+    "mistral/mistral-embed": 1024,
+    # Voyage
+    "voyage/voyage-3": 1024,
+    "voyage/voyage-3-lite": 512,
+    # Ollama
+    "ollama/nomic-embed-text": 768,
+    "ollama/mxbai-embed-large": 1024,
+    "ollama/all-minilm": 384,
+}
+
+
+def embedding_dimension(model: Optional[str] = None) -> int:
+    """
+    Dimension of the vectors produced by `model` (default: `settings.embedding_model`).
+
+    `settings.embedding_dimension` takes precedence for the configured model, so
+    models missing from `EMBEDDING_DIMENSIONS` or requested at a reduced size
+    can still be indexed. Never calls the embedding API.
+    """
+    model = model or settings.embedding_model
+    if settings.embedding_dimension and model == settings.embedding_model:
+        return settings.embedding_dimension
+
+    if model in EMBEDDING_DIMENSIONS:
+        return EMBEDDING_DIMENSIONS[model]
+    _, _, name = model.partition("/")
+    if name in EMBEDDING_DIMENSIONS:
+        return EMBEDDING_DIMENSIONS[name]
+
+    raise ValueError(
+        f"Unknown embedding dimension for {model!r}; set EMBEDDING_DIMENSION"
+    )
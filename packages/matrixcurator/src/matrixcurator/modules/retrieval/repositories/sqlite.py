@@ -1,24 +1,29 @@
-from typing import List, Optional
+from typing import List, Optional, Sequence, Union
 import json
-from sqlalchemy import create_engine, text, Column, String, Text
+import logging
+import re
+from sqlalchemy import create_engine, event, text, Column, Integer, String, Text
 from sqlalchemy.orm import declarative_base, Session
+import numpy as np
 import sqlite_vec
 
 from matrixcurator.config.main import settings
+from matrixcurator.modules.retrieval.embeddings import embedding_dimension
 from matrixcurator.modules.retrieval.schemas import DocumentChunk
-from litellm import embedding
+
+logger = logging.getLogger(__name__)
 
 Base = declarative_base()
 
+# Unversioned vector table of releases before vector_indexes; registered as version 0
+LEGACY_VEC_TABLE = "document_chunks_vec"
+
+# Bump when the layout of the vector tables changes; vectors of older tables for the
+# same model and dimension are copied into the new table when it is created
+VECTOR_SCHEMA_VERSION = 2
 
-def _get_embedding_dimension() -> int:
-    """Dynamically determine the embedding dimension of the configured model."""
-    try:
-        response = embedding(model=settings.embedding_model, input=["test"])
-        return len(response.data[0]["embedding"])
-    except Exception:
-        # Fallback to 768 if the API call fails or is not configured
-        return 768
+# Largest k sqlite-vec accepts in a KNN query
+MAX_KNN_K = 4096
 
 
 class DocumentChunkMeta(Base):
@@ -31,7 +36,25 @@ class DocumentChunkMeta(Base):
     metadata_json = Column(Text)
 
 
+class VectorIndex(Base):
+    """One vec0 table per embedding model, dimension and schema version."""
+
+    __tablename__ = "vector_indexes"
+
+    table_name = Column(String, primary_key=True)
+    embedding_model = Column(String)
+    dimension = Column(Integer)
+    schema_version = Column(Integer)
+
+
 _engine = None
+_vec_tables = set()
+
+
+def vec_table_name(model: str, dimension: int) -> str:
+    """Name of the vector table holding `model` embeddings of size `dimension`."""
+    slug = re.sub(r"[^0-9a-z]+", "_", model.lower()).strip("_")
+    return f"document_chunks_vec_v{VECTOR_SCHEMA_VERSION}_{slug}_{dimension}"
 
 
 def get_engine():
@@ -40,67 +63,202 @@ def get_engine():
         db_path = settings.sqlite_db_path
         # sqlite:///{db_path}
         _engine = create_engine(f"sqlite:///{db_path}")
+        _vec_tables.clear()
 
-        # Load sqlite-vec extension
-        with _engine.connect() as conn:
-            # Need raw dbapi connection to enable extension loading
-            dbapi_conn = conn.connection.dbapi_connection
+        @event.listens_for(_engine, "connect")
+        def _configure_connection(dbapi_conn, _):
+            # Every pooled connection needs sqlite-vec, not just the first one
             dbapi_conn.enable_load_extension(True)
             sqlite_vec.load(dbapi_conn)
             dbapi_conn.enable_load_extension(False)
+            # WAL lets readers query while a batch is being written
+            dbapi_conn.execute("PRAGMA journal_mode=WAL")
+            dbapi_conn.execute("PRAGMA synchronous=NORMAL")
 
         Base.metadata.create_all(_engine)
+    return _engine
 
-        with _engine.connect() as conn:
-            # Check if the virtual table already exists
-            result = conn.execute(
-                text(
-                    "SELECT name FROM sqlite_master WHERE type='table' AND name='document_chunks_vec'"
-                )
-            ).fetchone()
-            if not result:
-                # Dynamically fetch the required dimension for the current model
-                dim = _get_embedding_dimension()
-                conn.execute(
-                    text(f"""
-                    CREATE VIRTUAL TABLE document_chunks_vec USING vec0(
-                        id TEXT PRIMARY KEY,
-                        embedding FLOAT[{dim}]
-                    )
-                """)
+
+def get_vec_table() -> str:
+    """
+    Vector table for the configured embedding model, created on first use.
+
+    The dimension comes from the static registry (or `settings.embedding_dimension`),
+    so this never calls the embedding API; switching models starts a new table
+    instead of writing mismatched vectors into the old one.
+    """
+    engine = get_engine()
+    model = settings.embedding_model
+    dimension = embedding_dimension(model)
+    table = vec_table_name(model, dimension)
+    if table in _vec_tables:
+        return table
+
+    with Session(engine) as session:
+        _register_legacy_table(session, model, dimension)
+        exists = session.execute(
+            text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"),
+            {"name": table},
+        ).scalar()
+        if not exists:
+            # KNN queries only visit the vectors of the filtered document (partition
+            # key) and skip other parsers' rows (metadata column). Small chunks keep
+            # the space preallocated per document partition in check
+            session.execute(
+                text(f"""
+                CREATE VIRTUAL TABLE {table} USING vec0(
+                    id TEXT PRIMARY KEY,
+                    document_id TEXT PARTITION KEY,
+                    parser_name TEXT,
+                    embedding FLOAT[{dimension}] distance_metric=cosine,
+                    chunk_size={settings.sqlite_vec_chunk_size}
                 )
-    return _engine
+            """)
+            )
+            _copy_older_vectors(session, table, model, dimension)
+        session.merge(
+            VectorIndex(
+                table_name=table,
+                embedding_model=model,
+                dimension=dimension,
+                schema_version=VECTOR_SCHEMA_VERSION,
+            )
+        )
+        session.commit()
 
+    _vec_tables.add(table)
+    return table
+
+
+def _register_legacy_table(session: Session, model: str, dimension: int) -> None:
+    """
+    Adopts the unversioned table of older releases as schema version 0 of `model`,
+    so its vectors are copied forward and deleted along with their documents.
+
+    That table did not record its model, so it is adopted only if its declared
+    dimension matches the configured model.
+    """
+    if session.get(VectorIndex, LEGACY_VEC_TABLE) is not None:
+        return
+    sql = session.execute(
+        text("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = :name"),
+        {"name": LEGACY_VEC_TABLE},
+    ).scalar()
+    if sql is None:
+        return
+
+    match = re.search(r"FLOAT\[(\d+)\]", sql, re.IGNORECASE)
+    legacy_dimension = int(match.group(1)) if match else None
+    if legacy_dimension != dimension:
+        logger.warning(
+            f"Not migrating {LEGACY_VEC_TABLE}: it holds {legacy_dimension}-dimensional "
+            f"vectors but {model} produces {dimension}. Re-ingest its documents or drop the table."
+        )
+        return
 
-def insert_chunks(chunks: List[DocumentChunk]) -> None:
+    session.add(
+        VectorIndex(
+            table_name=LEGACY_VEC_TABLE,
+            embedding_model=model,
+            dimension=dimension,
+            schema_version=0,
+        )
+    )
+    session.flush()
+
+
+def _copy_older_vectors(session: Session, table: str, model: str, dimension: int) -> None:
+    previous = session.execute(
+        text("""
+            SELECT table_name FROM vector_indexes
+            WHERE embedding_model = :model AND dimension = :dimension
+              AND schema_version < :version
+            ORDER BY schema_version DESC LIMIT 1
+        """),
+        {"model": model, "dimension": dimension, "version": VECTOR_SCHEMA_VERSION},
+    ).scalar()
+    if previous is None:
+        return
+
+    session.execute(
+        text(f"""
+            INSERT INTO {table} (id, document_id, parser_name, embedding)
+            SELECT v.id, m.document_id, COALESCE(m.parser_name, ''), v.embedding
+            FROM {previous} v
+            JOIN document_chunks_meta m ON m.id = v.id
+        """)
+    )
+
+
+def float32_blob(embedding: Union[bytes, np.ndarray, Sequence[float]]) -> bytes:
+    """Packs an embedding into the float32 blob sqlite-vec stores natively."""
+    if isinstance(embedding, (bytes, bytearray, memoryview)):
+        return bytes(embedding)
+    # A no-op conversion for the float32 rows produced by the retrieval service
+    return np.asarray(embedding, dtype="<f4").tobytes()
+
+
+def insert_chunks(chunks: List[DocumentChunk], batch_size: Optional[int] = None) -> None:
+    """
+    Upserts chunks and their vectors in bulk.
+
+    Each batch of `batch_size` chunks (default `settings.sqlite_insert_batch_size`)
+    is written in one transaction with a single executemany per statement, and
+    vectors are bound as float32 blobs rather than JSON text.
+    """
     if not chunks:
         return
 
     engine = get_engine()
-    with Session(engine) as session:
-        for chunk in chunks:
-            # Insert meta
-            parser_name = chunk.get("metadata", {}).get("parser_name")
-            meta = DocumentChunkMeta(
-                id=chunk["id"],
-                document_id=chunk["document_id"],
-                parser_name=parser_name,
-                content=chunk["content"],
-                metadata_json=json.dumps(chunk.get("metadata", {})),
+    vec_table = get_vec_table()
+    batch_size = batch_size or settings.sqlite_insert_batch_size
+
+    for start in range(0, len(chunks), batch_size):
+        batch = chunks[start : start + batch_size]
+        meta_rows = []
+        vec_rows = []
+        for chunk in batch:
+            metadata = chunk.get("metadata") or {}
+            parser_name = metadata.get("parser_name")
+            meta_rows.append(
+                (
+                    chunk["id"],
+                    chunk["document_id"],
+                    parser_name,
+                    chunk["content"],
+                    json.dumps(metadata),
+                )
             )
-            session.merge(meta)
-
-            # Insert vector
-            embedding = json.dumps(chunk["embedding"])  # vec0 accepts JSON arrays
-            session.execute(
-                text("""
-                INSERT OR REPLACE INTO document_chunks_vec (id, embedding)
-                VALUES (:id, :emb)
-            """),
-                {"id": chunk["id"], "emb": embedding},
+            # vec0 metadata columns can't hold NULL
+            vec_rows.append(
+                (
+                    chunk["id"],
+                    chunk["document_id"],
+                    parser_name or "",
+                    float32_blob(chunk["embedding"]),
+                )
             )
 
-        session.commit()
+        with engine.begin() as conn:
+            conn.exec_driver_sql(
+                """
+                INSERT OR REPLACE INTO document_chunks_meta
+                    (id, document_id, parser_name, content, metadata_json)
+                VALUES (?, ?, ?, ?, ?)
+                """,
+                meta_rows,
+            )
+            # vec0 tables reject INSERT OR REPLACE for an existing id
+            conn.exec_driver_sql(
+                f"DELETE FROM {vec_table} WHERE id = ?", [(row[0],) for row in vec_rows]
+            )
+            conn.exec_driver_sql(
+                f"""
+                INSERT INTO {vec_table} (id, document_id, parser_name, embedding)
+                VALUES (?, ?, ?, ?)
+                """,
+                vec_rows,
+            )
 
 
 def delete_chunks_by_document(document_ids: List[str]) -> None:
@@ -109,6 +267,8 @@ def delete_chunks_by_document(document_ids: List[str]) -> None:
 
     engine = get_engine()
     with Session(engine) as session:
+        # Vectors of every embedding model indexed so far belong to the document
+        vec_tables = session.execute(text("SELECT table_name FROM vector_indexes")).scalars().all()
         for chunk_id in range(0, len(document_ids), 100):
             batch = document_ids[chunk_id : chunk_id + 100]
             
@@ -117,16 +277,17 @@ def delete_chunks_by_document(document_ids: List[str]) -> None:
             in_clause = ", ".join([f":{k}" for k in bind_params.keys()])
             
             # Delete vectors first
-            session.execute(
-                text(f"""
-                DELETE FROM document_chunks_vec 
-                WHERE id IN (
-                    SELECT id FROM document_chunks_meta 
-                    WHERE document_id IN ({in_clause})
+            for vec_table in vec_tables:
+                session.execute(
+                    text(f"""
+                    DELETE FROM {vec_table}
+                    WHERE id IN (
+                        SELECT id FROM document_chunks_meta
+                        WHERE document_id IN ({in_clause})
+                    )
+                    """),
+                    bind_params
                 )
-                """),
-                bind_params
-            )
             
             # Delete meta
             session.execute(
@@ -138,42 +299,44 @@ def delete_chunks_by_document(document_ids: List[str]) -> None:
 
 
 def query_similar_chunks(
-    embedding: List[float],
+    embedding: Union[np.ndarray, Sequence[float]],
     match_threshold: float = 0.7,
     match_count: int = 5,
     document_id: Optional[str] = None,
     parser_name: Optional[str] = None,
 ) -> List[DocumentChunk]:
     engine = get_engine()
+    vec_table = get_vec_table()
 
     with Session(engine) as session:
-        emb_json = json.dumps(embedding)
-
-        # We construct the WHERE clause dynamically based on filters
-        query_sql = """
-            SELECT m.id, m.document_id, m.content, m.metadata_json
-            FROM document_chunks_vec v
-            JOIN document_chunks_meta m ON v.id = m.id
-            WHERE vec_distance_cosine(v.embedding, :query_emb) <= :threshold
-        """
+        # KNN over the vec0 index: filters on the partition key and metadata
+        # column are applied inside the search, so only matching vectors are scored
+        knn_filters = ""
         params = {
-            "query_emb": emb_json,
+            "query_emb": float32_blob(embedding),
+            "k": min(match_count, MAX_KNN_K),
             "threshold": 1.0
             - match_threshold,  # Cosine distance = 1 - cosine similarity
-            "limit": match_count,
         }
 
         if document_id:
-            query_sql += " AND m.document_id = :doc_id"
+            knn_filters += " AND document_id = :doc_id"
             params["doc_id"] = document_id
 
         if parser_name:
-            query_sql += " AND m.parser_name = :parser"
+            knn_filters += " AND parser_name = :parser"
             params["parser"] = parser_name
 
-        query_sql += (
-            " ORDER BY vec_distance_cosine(v.embedding, :query_emb) LIMIT :limit"
-        )
+        query_sql = f"""
+            SELECT m.id, m.document_id, m.content, m.metadata_json
+            FROM (
+                SELECT id, distance FROM {vec_table}
+                WHERE embedding MATCH :query_emb AND k = :k{knn_filters}
+            ) v
+            JOIN document_chunks_meta m ON v.id = m.id
+            WHERE v.distance <= :threshold
+            ORDER BY v.distance
+        """
 
         result = session.execute(text(query_sql), params)
 
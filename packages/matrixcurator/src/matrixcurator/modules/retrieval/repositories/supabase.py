@@ -1,8 +1,18 @@
-from typing import List
+from typing import List, Optional, Sequence, Union
+import numpy as np
 from matrixcurator.integrations.supabase import get_client
 from matrixcurator.modules.retrieval.schemas import DocumentChunk
 
 
+def _to_json_vector(
+    embedding: Union[np.ndarray, Sequence[float], None],
+) -> Optional[List[float]]:
+    # PostgREST takes vectors as JSON arrays
+    if isinstance(embedding, np.ndarray):
+        return embedding.tolist()
+    return embedding
+
+
 def insert_chunks(chunks: List[DocumentChunk]) -> None:
     """
     Inserts document chunks into the Supabase document_chunks table.
@@ -16,7 +26,7 @@ def insert_chunks(chunks: List[DocumentChunk]) -> None:
                 "document_id": chunk.get("document_id"),
                 "content": chunk.get("content"),
                 "metadata": chunk.get("metadata", {}),
-                "embedding": chunk.get("embedding"),
+                "embedding": _to_json_vector(chunk.get("embedding")),
             }
         )
 
@@ -25,7 +35,7 @@ def insert_chunks(chunks: List[DocumentChunk]) -> None:
 
 
 def query_similar_chunks(
-    embedding: List[float],
+    embedding: Union[np.ndarray, Sequence[float]],
     match_threshold: float = 0.7,
     match_count: int = 5,
     document_id: str = None,
@@ -37,7 +47,7 @@ def query_similar_chunks(
     client = get_client()
 
     params = {
-        "query_embedding": embedding,
+        "query_embedding": _to_json_vector(embedding),
         "match_threshold": match_threshold,
         "match_count": match_count,
     }
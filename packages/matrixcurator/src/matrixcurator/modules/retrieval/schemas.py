@@ -1,4 +1,6 @@
-from typing import TypedDict, Optional, List
+from typing import TypedDict, Optional
+
+import numpy as np
 
 
 class ChunkMetadata(TypedDict, total=False):
@@ -14,4 +16,5 @@ class DocumentChunk(TypedDict):
     document_id: str
     content: str
     metadata: ChunkMetadata
-    embedding: Optional[List[float]]
+    # float32 vector; a row of the batch matrix returned by the embedding call
+    embedding: Optional[np.ndarray]
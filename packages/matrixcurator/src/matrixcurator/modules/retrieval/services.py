@@ -1,6 +1,7 @@
 import uuid
 import asyncio
 from typing import List, Optional, Dict, Any
+import numpy as np
 from langchain_text_splitters import RecursiveCharacterTextSplitter
 from litellm import aembedding
 from litellm.exceptions import RateLimitError, APIConnectionError, APIError
@@ -24,6 +25,12 @@ async def _fetch_embeddings_with_retry(texts: list[str]):
     return await aembedding(model=settings.embedding_model, input=texts)
 
 
+async def _fetch_embeddings(texts: list[str]) -> np.ndarray:
+    """Embeds `texts` into a (len(texts), dim) float32 matrix, one row per text."""
+    response = await _fetch_embeddings_with_retry(texts)
+    return np.array([data["embedding"] for data in response.data], dtype=np.float32)
+
+
 def _get_insert_chunks():
     if settings.retrieval_backend == "sqlite":
         from matrixcurator.modules.retrieval.repositories.sqlite import (
@@ -113,11 +120,11 @@ async def embed_and_store_chunks(chunks: List[DocumentChunk]) -> None:
         texts = [chunk["content"] for chunk in batch]
 
         # We use retry-wrapped aembedding for async liteLLM embedding
-        response = await _fetch_embeddings_with_retry(texts)
+        embeddings = await _fetch_embeddings(texts)
 
-        # response['data'] contains the embeddings in the same order
-        for j, data in enumerate(response.data):
-            batch[j]["embedding"] = data["embedding"]
+        # Rows come back in input order; each chunk keeps a float32 view of its row
+        for chunk, embedding in zip(batch, embeddings):
+            chunk["embedding"] = embedding
 
         insert_fn(batch)
 
@@ -137,8 +144,7 @@ async def retrieve_context(
     """
     Embeds the query, searches the active backend, and returns concatenated context.
     """
-    response = await _fetch_embeddings_with_retry([query])
-    query_embedding = response.data[0]["embedding"]
+    query_embedding = (await _fetch_embeddings([query]))[0]
 
     query_fn = _get_query_similar_chunks()
 
@@ -15,6 +15,13 @@ class ExtractResponse(BaseModel):
     errors: List[str]
 
 
+class ExtractStreamEvent(BaseModel):
+    character_index: int
+    extracted_data: Optional[Dict[str, Any]] = None
+    evaluation_score: Optional[int] = None
+    errors: List[str] = []
+
+
 # Domain-driven schemas for Agent State (aligns with Parquet structures)
 class Character(TypedDict):
     index: int
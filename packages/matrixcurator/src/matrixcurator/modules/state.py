@@ -13,7 +13,8 @@ class ContextSchema:
 
 class AgentState(MessagesState):
     character_index: int
-    context: str
+    # Content hash of the document in the document registry
+    document_id: str
     extracted_data: Optional[Dict[str, Any]]
     evaluation_score: int
     attempts: int
@@ -1,31 +1,94 @@
-from matrixcurator.modules.tools import docling
-from matrixcurator.modules.tools import docx
-from matrixcurator.modules.tools import pymupdf
-from matrixcurator.modules.tools import re
-from matrixcurator.modules.tools import txt
-
-from matrixcurator.modules.tools.docling import (
-    parse_with_docling,
-)
-from matrixcurator.modules.tools.docx import (
-    parse_with_docx,
-)
-from matrixcurator.modules.tools.pymupdf import (
-    parse_with_pymupdf,
-)
-from matrixcurator.modules.tools.re import (
-    generate_with_re,
-)
-from matrixcurator.modules.tools.txt import (
-    parse_with_txt,
+def lazy_import(module_name, submodules, submod_attrs, eager="auto"):
+    import importlib
+    import os
+
+    name_to_submod = {
+        func: mod for mod, funcs in submod_attrs.items() for func in funcs
+    }
+
+    def __getattr__(name):
+        if name in submodules:
+            attr = importlib.import_module(
+                "{module_name}.{name}".format(module_name=module_name, name=name)
+            )
+        elif name in name_to_submod:
+            submodname = name_to_submod[name]
+            module = importlib.import_module(f"{module_name}.{submodname}")
+            attr = getattr(module, name)
+        else:
+            raise AttributeError(f"Module {module_name!r} has no attribute {name!r}")
+        globals()[name] = attr
+        return attr
+
+    eager_import_flag = False
+    if eager == "auto":
+        eager_import_text = os.environ.get("EAGER_IMPORT", "")
+        if eager_import_text:
+            eager_import_text_ = eager_import_text.lower()
+            if eager_import_text_ in {"true", "1", "on", "yes"}:
+                eager_import_flag = True
+
+        eager_import_module_text = os.environ.get("EAGER_IMPORT_MODULES", "")
+        if eager_import_module_text:
+            if eager_import_module_text.lower() in __name__.lower():
+                eager_import_flag = True
+    else:
+        eager_import_flag = eager
+    if eager_import_flag:
+        for name in submodules:
+            __getattr__(name)
+
+        for attrs in submod_attrs.values():
+            for attr in attrs:
+                __getattr__(attr)
+    return __getattr__
+
+
+__getattr__ = lazy_import(
+    __name__,
+    submodules={
+        "docling",
+        "docx",
+        "hybrid",
+        "pymupdf",
+        "re",
+        "txt",
+    },
+    submod_attrs={
+        "docling": [
+            "parse_with_docling",
+        ],
+        "docx": [
+            "parse_with_docx",
+        ],
+        "hybrid": [
+            "parse_with_hybrid",
+        ],
+        "pymupdf": [
+            "parse_with_pymupdf",
+        ],
+        "re": [
+            "generate_with_re",
+        ],
+        "txt": [
+            "parse_with_txt",
+        ],
+    },
 )
 
+
+def __dir__():
+    return __all__
+
+
 __all__ = [
     "docling",
     "docx",
     "generate_with_re",
+    "hybrid",
     "parse_with_docling",
     "parse_with_docx",
+    "parse_with_hybrid",
     "parse_with_pymupdf",
     "parse_with_txt",
     "pymupdf",
@@ -1,75 +1,258 @@
 import io
 import asyncio
 import atexit
+import logging
+import queue
+import threading
+from contextlib import contextmanager
 from langchain_core.tools import tool
 from docling.document_converter import DocumentConverter, PdfFormatOption
 from docling.datamodel.document import InputFormat
 from docling.datamodel.base_models import DocumentStream
+from docling.exceptions import ConversionError
 from docling.pipeline.vlm_pipeline import VlmPipelineOptions
 from matrixcurator.integrations.docling import McpVlmPipeline
+from matrixcurator.integrations.mcp import mcp_loop_var
 from matrixcurator.exceptions import DocumentParseError
-from typing import Optional
-from matrixcurator.utils.concurrency import AsyncRateLimiter, AsyncConcurrencyManager
+from matrixcurator.modules.document.cache import cached_parse
+from typing import Callable, Dict, Iterator, Optional
+from matrixcurator.utils.concurrency import AsyncConcurrencyManager
+from matrixcurator.utils.rate_limits import build_rate_limiter
 from matrixcurator.config.main import settings
 
+logger = logging.getLogger(__name__)
+
 _manager = None
-_converter = None
+_pool = None
+
+# Failures caused by the input rather than the converter: docling reports
+# unreadable or unsupported documents (and conversions its pipeline already
+# contained) as ConversionError, and rejects bad page ranges with ValueError
+_INPUT_ERRORS = (ConversionError, DocumentParseError, ValueError)
 
 def get_manager() -> AsyncConcurrencyManager:
     global _manager
     if _manager is None:
-        limiter = AsyncRateLimiter(settings=settings.docling_rate_limit)
-        _manager = AsyncConcurrencyManager(rate_limiter=limiter)
+        limiter = build_rate_limiter("docling", settings.docling_rate_limit)
+        # More conversions in flight than pooled converters would only queue on checkout
+        _manager = AsyncConcurrencyManager(
+            max_concurrent=min(limiter.max_concurrency, settings.docling_pool_size),
+            rate_limiter=limiter,
+        )
     return _manager
 
-def get_converter() -> DocumentConverter:
-    global _converter
-    if _converter is None:
-        pipeline_options = VlmPipelineOptions()
-        pipeline_options.enable_remote_services = True
+def build_converter() -> DocumentConverter:
+    pipeline_options = VlmPipelineOptions()
+    pipeline_options.enable_remote_services = True
 
-        _converter = DocumentConverter(
-            format_options={
-                InputFormat.PDF: PdfFormatOption(
-                    pipeline_cls=McpVlmPipeline, pipeline_options=pipeline_options
-                )
-            }
+    return DocumentConverter(
+        format_options={
+            InputFormat.PDF: PdfFormatOption(
+                pipeline_cls=McpVlmPipeline, pipeline_options=pipeline_options
+            )
+        }
+    )
+
+
+class ConverterPool:
+    """
+    Fixed-size pool of DocumentConverters shared by the conversion threads.
+
+    Converters are created lazily up to `size` and checked out exclusively, so
+    concurrent conversions never share a pipeline instance. A converter whose
+    pipeline failed at runtime, or that has served `max_uses` conversions, is
+    discarded on return and replaced by a fresh one on a later checkout; input
+    errors are re-raised and leave the converter in the pool.
+    """
+
+    def __init__(
+        self,
+        size: int,
+        factory: Callable[[], DocumentConverter] = build_converter,
+        max_uses: Optional[int] = None,
+    ) -> None:
+        self.size = size
+        self.factory = factory
+        self.max_uses = max_uses
+        self._idle: "queue.Queue[DocumentConverter]" = queue.Queue()
+        self._uses: Dict[int, int] = {}
+        self._created = 0
+        self._lock = threading.Lock()
+
+    def _create(self) -> DocumentConverter:
+        try:
+            converter = self.factory()
+        except Exception:
+            with self._lock:
+                self._created -= 1
+            raise
+        self._uses[id(converter)] = 0
+        return converter
+
+    def warm(self, count: Optional[int] = None) -> None:
+        """Creates converters ahead of time and initializes their PDF pipelines."""
+        for _ in range(min(count or self.size, self.size)):
+            with self._lock:
+                if self._created >= self.size:
+                    return
+                self._created += 1
+            converter = self._create()
+            try:
+                converter.initialize_pipeline(InputFormat.PDF)
+            except Exception:
+                self._uses.pop(id(converter), None)
+                with self._lock:
+                    self._created -= 1
+                raise
+            self._idle.put(converter)
+
+    def checkout(self, timeout: Optional[float] = None) -> DocumentConverter:
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._lock:
+            can_create = self._created < self.size
+            if can_create:
+                self._created += 1
+        if can_create:
+            return self._create()
+        return self._idle.get(timeout=timeout)
+
+    def checkin(self, converter: DocumentConverter, healthy: bool = True) -> None:
+        uses = self._uses.get(id(converter), 0) + 1
+        if not healthy or (self.max_uses and uses >= self.max_uses):
+            logger.info(
+                f"Recycling Docling converter after {uses} conversions (healthy={healthy})"
+            )
+            self._uses.pop(id(converter), None)
+            with self._lock:
+                self._created -= 1
+            return
+
+        self._uses[id(converter)] = uses
+        self._idle.put(converter)
+
+    @contextmanager
+    def converter(self) -> Iterator[DocumentConverter]:
+        """Checks out a converter for the duration of the block."""
+        converter = self.checkout()
+        healthy = True
+        try:
+            yield converter
+        except _INPUT_ERRORS:
+            raise
+        except Exception:
+            healthy = False
+            raise
+        finally:
+            self.checkin(converter, healthy=healthy)
+
+    def close(self) -> None:
+        while True:
+            try:
+                converter = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._uses.pop(id(converter), None)
+            with self._lock:
+                self._created -= 1
+
+
+def get_converter_pool() -> ConverterPool:
+    global _pool
+    if _pool is None:
+        _pool = ConverterPool(
+            size=settings.docling_pool_size,
+            max_uses=settings.docling_converter_max_uses,
         )
-    return _converter
+    return _pool
+
+
+def contiguous_page_ranges(pages: list[int]) -> list[tuple[int, int]]:
+    """Groups 1-based page numbers into inclusive (start, end) runs, e.g. [3, 4, 97] -> [(3, 4), (97, 97)]."""
+    ranges: list[tuple[int, int]] = []
+    for page in sorted(set(pages)):
+        if ranges and page == ranges[-1][1] + 1:
+            ranges[-1] = (ranges[-1][0], page)
+        else:
+            ranges.append((page, page))
+    return ranges
 
 
 @tool
 async def parse_with_docling(
-    file_content: bytes, filename: str, pages: list[int] | None = None
-) -> str:
-    """Use this tool to parse complex documents (PDF, DOCX, HTML, etc.) using Docling. It is slower but highly accurate for complex layouts, tables, and reading order."""
-    async with get_manager():
-        def _parse():
+    file_content: bytes,
+    filename: str,
+    pages: list[int] | None = None,
+    by_page: bool = False,
+) -> str | dict:
+    """Use this tool to parse complex documents (PDF, DOCX, HTML, etc.) using Docling. It is slower but highly accurate for complex layouts, tables, and reading order.
+    Set by_page to get {"parser", "pages": [{"page", "content"}]} instead of a single string."""
+    def _parse(page_numbers: list[int] | None) -> list[dict]:
+        try:
+            # Only the requested pages are rendered: sparse selections are
+            # converted as separate contiguous runs on the same converter
+            page_ranges = contiguous_page_ranges(page_numbers) if page_numbers else [None]
+
+            documents = []
+            with get_converter_pool().converter() as converter:
+                for page_range in page_ranges:
+                    stream = DocumentStream(name=filename, stream=io.BytesIO(file_content))
+                    convert_kwargs = {"page_range": page_range} if page_range else {}
+                    documents.append(converter.convert(stream, **convert_kwargs).document)
+
+            # Split each conversion into per-page markdown
+            parsed_pages = []
+            for document in documents:
+                if not document.pages:
+                    parsed_pages.append({"page": 1, "content": document.export_to_markdown()})
+                    continue
+                parsed_pages.extend(
+                    {"page": p, "content": document.export_to_markdown(page_no=p)}
+                    for p in sorted(document.pages)
+                )
+            return parsed_pages
+        except Exception as e:
+            raise DocumentParseError(
+                f"Failed to parse document with Docling: {str(e)}"
+            ) from e
+
+    async def parse(page_numbers: list[int] | None) -> list[dict]:
+        async with get_manager():
+            # The conversion thread schedules MCP sampling back onto this loop
+            loop_token = mcp_loop_var.set(asyncio.get_running_loop())
             try:
-                buf = io.BytesIO(file_content)
-                stream = DocumentStream(name=filename, stream=buf)
-                
-                converter = get_converter()
-                
-                convert_kwargs = {}
-                if pages:
-                    convert_kwargs["page_range"] = (min(pages), max(pages))
-                    
-                result = converter.convert(stream, **convert_kwargs)
-                return result.document.export_to_markdown()
-            except Exception as e:
-                raise DocumentParseError(
-                    f"Failed to parse document with Docling: {str(e)}"
-                ) from e
-
-        return await asyncio.to_thread(_parse)
+                return await asyncio.to_thread(_parse, page_numbers)
+            finally:
+                mcp_loop_var.reset(loop_token)
+
+    parsed_pages = await cached_parse(
+        "docling", file_content, pages, parse, options=_cache_options()
+    )
+    if by_page:
+        return {"parser": "docling", "pages": parsed_pages}
+    return "\n\n".join(page["content"] for page in parsed_pages)
+
+
+def _cache_options() -> dict:
+    # Settings that change what the VLM pipeline produces for a page
+    return {
+        "vlm_model": settings.vlm_model,
+        "vlm_image_format": settings.vlm_image_format,
+        "vlm_image_quality": settings.vlm_image_quality,
+        "vlm_image_max_dpi": settings.vlm_image_max_dpi,
+        "vlm_image_grayscale": settings.vlm_image_grayscale,
+    }
 
 
 def _cleanup_converter():
-    """Destroy the DocumentConverter singleton before Python starts tearing down modules."""
-    global _converter
-    if _converter is not None:
-        _converter = None
+    """Drop the pooled DocumentConverters before Python starts tearing down modules."""
+    global _pool
+    if _pool is not None:
+        _pool.close()
+        _pool = None
 
 
 atexit.register(_cleanup_converter)
@@ -2,7 +2,9 @@ import io
 import asyncio
 from langchain_core.tools import tool
 from matrixcurator.exceptions import DocumentParseError
-from matrixcurator.utils.concurrency import AsyncRateLimiter, AsyncConcurrencyManager
+from matrixcurator.modules.document.cache import cached_parse
+from matrixcurator.utils.concurrency import AsyncConcurrencyManager
+from matrixcurator.utils.rate_limits import build_rate_limiter
 from matrixcurator.config.main import settings
 
 # Absolute import to avoid circular dependency with the file name
@@ -13,23 +15,34 @@ _manager = None
 def get_manager() -> AsyncConcurrencyManager:
     global _manager
     if _manager is None:
-        limiter = AsyncRateLimiter(settings=settings.docx_rate_limit)
+        limiter = build_rate_limiter("docx", settings.docx_rate_limit)
         _manager = AsyncConcurrencyManager(rate_limiter=limiter)
     return _manager
 
 
 @tool
-async def parse_with_docx(file_content: bytes, filename: str) -> str:
-    """Use this tool to parse DOCX (Microsoft Word) files."""
-    async with get_manager():
-        def _parse():
-            try:
-                doc = python_docx.Document(io.BytesIO(file_content))
-                text = []
-                for para in doc.paragraphs:
-                    text.append(para.text)
-                return "\n".join(text)
-            except Exception as e:
-                raise DocumentParseError(f"Failed to parse DOCX: {str(e)}") from e
+async def parse_with_docx(
+    file_content: bytes, filename: str, by_page: bool = False
+) -> str | dict:
+    """Use this tool to parse DOCX (Microsoft Word) files.
+    Set by_page to get {"parser", "pages": [{"page", "content"}]} instead of a single string."""
+    def _parse():
+        try:
+            doc = python_docx.Document(io.BytesIO(file_content))
+            text = []
+            for para in doc.paragraphs:
+                text.append(para.text)
+            return "\n".join(text)
+        except Exception as e:
+            raise DocumentParseError(f"Failed to parse DOCX: {str(e)}") from e
 
-        return await asyncio.to_thread(_parse)
+    async def parse(page_numbers: list[int] | None) -> list[dict]:
+        async with get_manager():
+            text = await asyncio.to_thread(_parse)
+        # DOCX files have no pages; the whole document is page 1
+        return [{"page": 1, "content": text}]
+
+    parsed = await cached_parse("docx", file_content, None, parse)
+    if by_page:
+        return {"parser": "docx", "pages": parsed}
+    return parsed[0]["content"]
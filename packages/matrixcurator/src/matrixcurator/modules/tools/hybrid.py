@@ -0,0 +1,48 @@
+import asyncio
+import logging
+from langchain_core.tools import tool
+from matrixcurator.exceptions import DocumentParseError
+from matrixcurator.modules.document.repositories.pdf import assess_text_layer
+from matrixcurator.modules.tools.docling import parse_with_docling
+from matrixcurator.modules.tools.pymupdf import parse_with_pymupdf
+
+logger = logging.getLogger(__name__)
+
+
+@tool
+async def parse_with_hybrid(
+    file_content: bytes,
+    filename: str,
+    pages: list[int] | None = None,
+    by_page: bool = False,
+) -> str | dict:
+    """Use this tool to parse PDF files quickly while keeping accuracy on hard pages. Pages are read from the PDF text layer with PyMuPDF, and only pages whose text layer is garbled, image-only, figure-heavy or tabular are sent to Docling.
+    Set by_page to get {"parser", "pages": [{"page", "content"}]} instead of a single string."""
+    if not filename.lower().endswith(".pdf"):
+        raise DocumentParseError("Hybrid parsing only supports PDF files")
+
+    # The underlying tools apply their own rate limits and concurrency
+    text_layer = await parse_with_pymupdf.ainvoke(
+        {"file_content": file_content, "filename": filename, "pages": pages, "by_page": True}
+    )
+    parsed_pages = text_layer["pages"]
+
+    assessments = await asyncio.to_thread(assess_text_layer, file_content, parsed_pages)
+    hard_pages = [assessment["page"] for assessment in assessments if assessment["needs_vlm"]]
+    logger.info(
+        f"Hybrid parse of {filename}: {len(hard_pages)} of {len(parsed_pages)} pages sent to Docling"
+    )
+
+    if hard_pages:
+        vlm_result = await parse_with_docling.ainvoke(
+            {"file_content": file_content, "filename": filename, "pages": hard_pages, "by_page": True}
+        )
+        vlm_contents = {page["page"]: page["content"] for page in vlm_result["pages"]}
+        parsed_pages = [
+            {"page": page["page"], "content": vlm_contents.get(page["page"], page["content"])}
+            for page in parsed_pages
+        ]
+
+    if by_page:
+        return {"parser": "hybrid", "pages": parsed_pages}
+    return "".join(page["content"] for page in parsed_pages)
@@ -1,41 +1,44 @@
-import fitz  # PyMuPDF
 import asyncio
 from langchain_core.tools import tool
 from matrixcurator.exceptions import DocumentParseError
-from matrixcurator.utils.concurrency import AsyncRateLimiter, AsyncConcurrencyManager
+from matrixcurator.utils.concurrency import AsyncConcurrencyManager
+from matrixcurator.utils.rate_limits import build_rate_limiter
 from matrixcurator.config.main import settings
+from matrixcurator.modules.document.cache import cached_parse
+from matrixcurator.modules.document.repositories.pdf import read_pdf_pages
 
 _manager = None
 
 def get_manager() -> AsyncConcurrencyManager:
     global _manager
     if _manager is None:
-        limiter = AsyncRateLimiter(settings=settings.pymupdf_rate_limit)
+        limiter = build_rate_limiter("pymupdf", settings.pymupdf_rate_limit)
         _manager = AsyncConcurrencyManager(rate_limiter=limiter)
     return _manager
 
 
 @tool
 async def parse_with_pymupdf(
-    file_content: bytes, filename: str, pages: list[int] | None = None
-) -> str:
-    """Use this tool to parse PDF files using PyMuPDF. It is fast and works well for standard text-heavy PDFs."""
-    async with get_manager():
+    file_content: bytes,
+    filename: str,
+    pages: list[int] | None = None,
+    by_page: bool = False,
+) -> str | dict:
+    """Use this tool to parse PDF files using PyMuPDF. It is fast and works well for standard text-heavy PDFs.
+    Set by_page to get {"parser", "pages": [{"page", "content"}]} instead of a single string."""
+    def _parse(page_numbers: list[int] | None) -> list[dict]:
+        try:
+            return read_pdf_pages(file_content, page_numbers)
+        except DocumentParseError as e:
+            raise DocumentParseError(
+                f"Failed to parse PDF with PyMuPDF: {str(e.__cause__)}"
+            ) from e.__cause__
 
-        def _parse():
-            try:
-                doc = fitz.open(stream=file_content, filetype="pdf")
-                text = ""
-                
-                if pages is not None:
-                    for p in pages:
-                        if 1 <= p <= len(doc):
-                            text += doc[p - 1].get_text()
-                else:
-                    for page in doc:
-                        text += page.get_text()
-                return text
-            except Exception as e:
-                raise DocumentParseError(f"Failed to parse PDF with PyMuPDF: {str(e)}") from e
+    async def parse(page_numbers: list[int] | None) -> list[dict]:
+        async with get_manager():
+            return await asyncio.to_thread(_parse, page_numbers)
 
-        return await asyncio.to_thread(_parse)
+    parsed = await cached_parse("pymupdf", file_content, pages, parse)
+    if by_page:
+        return {"parser": "pymupdf", "pages": parsed}
+    return "".join(page["content"] for page in parsed)
@@ -1,7 +1,8 @@
 import asyncio
 from langchain_core.tools import tool
 from matrixcurator.exceptions import DocumentParseError
-from matrixcurator.utils.concurrency import AsyncRateLimiter, AsyncConcurrencyManager
+from matrixcurator.utils.concurrency import AsyncConcurrencyManager
+from matrixcurator.utils.rate_limits import build_rate_limiter
 from matrixcurator.config.main import settings
 
 _manager = None
@@ -9,14 +10,17 @@ _manager = None
 def get_manager() -> AsyncConcurrencyManager:
     global _manager
     if _manager is None:
-        limiter = AsyncRateLimiter(settings=settings.txt_rate_limit)
+        limiter = build_rate_limiter("txt", settings.txt_rate_limit)
         _manager = AsyncConcurrencyManager(rate_limiter=limiter)
     return _manager
 
 
 @tool
-async def parse_with_txt(file_content: bytes, filename: str) -> str:
-    """Use this tool to parse plain text (TXT) files."""
+async def parse_with_txt(
+    file_content: bytes, filename: str, by_page: bool = False
+) -> str | dict:
+    """Use this tool to parse plain text (TXT) files.
+    Set by_page to get {"parser", "pages": [{"page", "content"}]} instead of a single string."""
     async with get_manager():
 
         def _parse():
@@ -30,4 +34,8 @@ async def parse_with_txt(file_content: bytes, filename: str) -> str:
             except Exception as e:
                 raise DocumentParseError(f"Failed to parse TXT: {str(e)}") from e
 
-        return await asyncio.to_thread(_parse)
+        text = await asyncio.to_thread(_parse)
+        if by_page:
+            # TXT files have no pages; the whole document is page 1
+            return {"parser": "txt", "pages": [{"page": 1, "content": text}]}
+        return text
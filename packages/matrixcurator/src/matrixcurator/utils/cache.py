@@ -0,0 +1,142 @@
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Iterable, Optional
+
+__all__ = ["SQLiteCache"]
+
+
+class SQLiteCache:
+    """
+    Persistent key/value cache backed by a local SQLite file.
+
+    Entries are evicted least-recently-used first once the total stored size
+    exceeds `max_bytes`. Hit and miss counters are kept per instance.
+    """
+
+    # Stays under SQLite's default limit on bound parameters per statement
+    _MAX_KEYS_PER_QUERY = 500
+
+    def __init__(self, path: str, max_bytes: int = 512 * 1024 * 1024) -> None:
+        self.path = path
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS cache_entries (
+                key TEXT PRIMARY KEY,
+                value BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_cache_entries_accessed_at ON cache_entries (accessed_at)"
+        )
+        self._conn.commit()
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Returns the cached value for `key`, or None on a miss."""
+        return self.get_many([key]).get(key)
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, bytes]:
+        """Returns the cached values for `keys` that are present, in one transaction."""
+        keys = list(dict.fromkeys(keys))
+        found: Dict[str, bytes] = {}
+        with self._lock:
+            for start in range(0, len(keys), self._MAX_KEYS_PER_QUERY):
+                chunk = keys[start : start + self._MAX_KEYS_PER_QUERY]
+                placeholders = ", ".join("?" * len(chunk))
+                found.update(
+                    self._conn.execute(
+                        f"SELECT key, value FROM cache_entries WHERE key IN ({placeholders})",
+                        chunk,
+                    )
+                )
+
+            if found:
+                now = time.time()
+                self._conn.executemany(
+                    "UPDATE cache_entries SET accessed_at = ? WHERE key = ?",
+                    [(now, key) for key in found],
+                )
+                self._conn.commit()
+            self.hits += len(found)
+            self.misses += len(keys) - len(found)
+        return found
+
+    def set(self, key: str, value: bytes) -> None:
+        """Stores `value` under `key` and evicts old entries if over budget."""
+        self.set_many({key: value})
+
+    def set_many(self, entries: Dict[str, bytes]) -> None:
+        """Stores all `entries` in one transaction and evicts once afterwards."""
+        now = time.time()
+        rows = [
+            (key, value, len(value), now)
+            for key, value in entries.items()
+            if len(value) <= self.max_bytes
+        ]
+        if not rows:
+            return
+
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO cache_entries (key, value, size, accessed_at) VALUES (?, ?, ?, ?)",
+                rows,
+            )
+            self._evict()
+            self._conn.commit()
+
+    def _evict(self) -> None:
+        total = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM cache_entries"
+        ).fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        expired = []
+        for key, size in self._conn.execute(
+            "SELECT key, size FROM cache_entries ORDER BY accessed_at"
+        ):
+            expired.append((key,))
+            total -= size
+            if total <= self.max_bytes:
+                break
+
+        self._conn.executemany("DELETE FROM cache_entries WHERE key = ?", expired)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM cache_entries")
+            self._conn.commit()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            entries, size = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM cache_entries"
+            ).fetchone()
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "entries": entries,
+            "size_bytes": size,
+            "max_bytes": self.max_bytes,
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
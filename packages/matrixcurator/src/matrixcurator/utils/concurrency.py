@@ -1,6 +1,11 @@
 import asyncio
+import os
+import sqlite3
+import threading
 import time
-from typing import Any, Optional
+from collections import deque
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, AsyncIterator, Callable, Deque, Iterator, Optional
 from pydantic import BaseModel
 
 
@@ -11,7 +16,15 @@ class RateLimitConfig(BaseModel):
 
 
 class AsyncRateLimiter:
-    """Rate limiter that restricts execution to a maximum number of calls per time period."""
+    """
+    Rate limiter that restricts execution to a maximum number of calls per time period.
+
+    Each limit keeps the timestamps of its last `max_calls` slots in a bounded
+    deque, so the next free slot is simply the oldest of them plus the period and
+    every acquire is O(1) per limit. Callers reserve their slot synchronously in
+    arrival order and only then sleep, outside of any lock, so waiters are woken
+    in FIFO order. A reserved slot stays used if its caller is cancelled.
+    """
 
     def __init__(
         self,
@@ -30,40 +43,33 @@ class AsyncRateLimiter:
         elif max_calls is not None:
             self.limits.append((max_calls, time_period))
 
-        self.calls: list[float] = []
-        self._lock = asyncio.Lock()
+        self._slots: list[Deque[float]] = [
+            deque(maxlen=max_calls) for max_calls, _ in self.limits
+        ]
+        self._last_slot = float("-inf")
+
+    def reserve(self) -> float:
+        """Reserves the next free slot and returns the seconds until it starts."""
+        now = time.monotonic()
+        # Never start before an earlier reservation, so slots are handed out FIFO
+        slot = max(now, self._last_slot)
+        for (max_calls, time_period), slots in zip(self.limits, self._slots):
+            if len(slots) == max_calls:
+                slot = max(slot, slots[0] + time_period)
+
+        for slots in self._slots:
+            slots.append(slot)
+        self._last_slot = slot
+        return slot - now
 
     async def acquire(self) -> None:
         """Acquire a token from the rate limiter, sleeping if necessary."""
         if not self.limits:
             return
 
-        async with self._lock:
-            while True:
-                now = time.monotonic()
-                max_sleep = 0.0
-
-                for max_calls, time_period in self.limits:
-                    window_start = now - time_period
-                    recent_calls = [t for t in self.calls if t > window_start]
-
-                    if len(recent_calls) >= max_calls:
-                        oldest_in_window = recent_calls[0]
-                        sleep_time = time_period - (now - oldest_in_window)
-                        if sleep_time > max_sleep:
-                            max_sleep = sleep_time
-
-                if max_sleep > 0:
-                    await asyncio.sleep(max_sleep)
-                else:
-                    break
-
-            now = time.monotonic()
-            self.calls.append(now)
-
-            # Cleanup old calls beyond the maximum time period
-            max_period = max(limit[1] for limit in self.limits)
-            self.calls = [t for t in self.calls if now - t <= max_period]
+        delay = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
 
     @property
     def max_concurrency(self) -> int:
@@ -81,6 +87,105 @@ class AsyncRateLimiter:
         return max(1, int(strictest_rate))
 
 
+class SharedRateLimiter(AsyncRateLimiter):
+    """
+    AsyncRateLimiter whose slots are stored in a SQLite file, so every process on
+    the host that uses the same `name` and `path` draws from one budget.
+
+    Reservations run in an immediate (write-locking) transaction, which serializes
+    them across processes in FIFO order. Slots are wall-clock timestamps because
+    monotonic clocks are not comparable between processes.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        path: str,
+        max_calls: Optional[int] = None,
+        time_period: float = 1.0,
+        settings: Optional[RateLimitConfig] = None,
+    ) -> None:
+        super().__init__(max_calls=max_calls, time_period=time_period, settings=settings)
+        self.name = name
+        self.path = path
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._conn = sqlite3.connect(
+            path, timeout=30.0, isolation_level=None, check_same_thread=False
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS rate_limit_slots (
+                name TEXT NOT NULL,
+                period REAL NOT NULL,
+                slot REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_rate_limit_slots ON rate_limit_slots (name, period, slot)"
+        )
+
+    def reserve(self) -> float:
+        """Reserves the next free slot shared by all processes and returns the seconds until it starts."""
+        if not self.limits:
+            return 0.0
+
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                now = time.time()
+                first_period = self.limits[0][1]
+                (last_slot,) = self._conn.execute(
+                    "SELECT MAX(slot) FROM rate_limit_slots WHERE name = ? AND period = ?",
+                    (self.name, first_period),
+                ).fetchone()
+                slot = max(now, last_slot if last_slot is not None else now)
+
+                for max_calls, time_period in self.limits:
+                    # Start of the max_calls-th most recent slot bounds the next one
+                    row = self._conn.execute(
+                        "SELECT slot FROM rate_limit_slots WHERE name = ? AND period = ? "
+                        "ORDER BY slot DESC LIMIT 1 OFFSET ?",
+                        (self.name, time_period, max_calls - 1),
+                    ).fetchone()
+                    if row is not None:
+                        slot = max(slot, row[0] + time_period)
+
+                for _, time_period in self.limits:
+                    self._conn.execute(
+                        "DELETE FROM rate_limit_slots WHERE name = ? AND period = ? AND slot < ?",
+                        (self.name, time_period, now - time_period),
+                    )
+                self._conn.executemany(
+                    "INSERT INTO rate_limit_slots (name, period, slot) VALUES (?, ?, ?)",
+                    [(self.name, time_period, slot) for _, time_period in self.limits],
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        return slot - now
+
+    async def acquire(self) -> None:
+        if not self.limits:
+            return
+
+        # Waiting on another process's write lock must not block the event loop
+        delay = await asyncio.to_thread(self.reserve)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
 class AsyncConcurrencyManager:
     """Context manager combining asyncio.Semaphore and an optional AsyncRateLimiter."""
 
@@ -110,3 +215,146 @@ class AsyncConcurrencyManager:
     async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
         """Release the semaphore."""
         self.semaphore.release()
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket shared by sync and async callers.
+
+    `reserve` never blocks: it takes the tokens immediately, letting the balance go
+    negative, and returns how long the caller must wait before using them. Threads
+    then `time.sleep` and coroutines `asyncio.sleep` for that delay.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None) -> None:
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, settings: RateLimitConfig) -> Optional["TokenBucket"]:
+        """Builds a bucket at the strictest configured rate, or None when unlimited."""
+        rates = [
+            limit / period
+            for limit, period in (
+                (settings.per_second, 1.0),
+                (settings.per_minute, 60.0),
+                (settings.per_hour, 3600.0),
+            )
+            if limit
+        ]
+        return cls(min(rates)) if rates else None
+
+    def reserve(self, amount: float = 1.0) -> float:
+        """Takes `amount` tokens and returns the seconds to wait before they are available."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            self._tokens -= amount
+            return max(0.0, -self._tokens / self.rate)
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    AIMD concurrency limit usable from threads and event loops at the same time.
+
+    The limit starts at `maximum`, is halved when a caller reports throttling
+    (at most once per `cooldown` seconds, so one burst of 429s counts once) and
+    grows by one after `limit` consecutive successes. Freed slots are handed to
+    waiters in FIFO order.
+    """
+
+    def __init__(self, maximum: int, minimum: int = 1, cooldown: float = 5.0) -> None:
+        self.maximum = maximum
+        self.minimum = minimum
+        self.cooldown = cooldown
+        self.limit = maximum
+        self._in_flight = 0
+        self._successes = 0
+        self._last_decrease = float("-inf")
+        self._waiters: Deque[Callable[[], None]] = deque()
+        self._lock = threading.Lock()
+
+    def _try_acquire(self, waiter: Callable[[], None]) -> bool:
+        with self._lock:
+            if self._in_flight < self.limit and not self._waiters:
+                self._in_flight += 1
+                return True
+            self._waiters.append(waiter)
+            return False
+
+    def _wake_waiters(self) -> None:
+        # Called with the lock held; waking transfers the slot to the waiter
+        while self._waiters and self._in_flight < self.limit:
+            self._in_flight += 1
+            self._waiters.popleft()()
+
+    def acquire(self) -> None:
+        event = threading.Event()
+        if not self._try_acquire(event.set):
+            event.wait()
+
+    async def aacquire(self) -> None:
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future = loop.create_future()
+
+        def wake() -> None:
+            loop.call_soon_threadsafe(
+                lambda: future.done() or future.set_result(None)
+            )
+
+        if self._try_acquire(wake):
+            return
+        try:
+            await future
+        except asyncio.CancelledError:
+            with self._lock:
+                if wake in self._waiters:
+                    self._waiters.remove(wake)
+                    raise
+            # The slot was handed over before the cancellation landed
+            self.release()
+            raise
+
+    def release(self) -> None:
+        with self._lock:
+            self._in_flight -= 1
+            self._wake_waiters()
+
+    @contextmanager
+    def slot(self) -> Iterator[None]:
+        self.acquire()
+        try:
+            yield
+        finally:
+            self.release()
+
+    @asynccontextmanager
+    async def aslot(self) -> AsyncIterator[None]:
+        await self.aacquire()
+        try:
+            yield
+        finally:
+            self.release()
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._successes += 1
+            if self._successes >= self.limit and self.limit < self.maximum:
+                self.limit += 1
+                self._successes = 0
+                self._wake_waiters()
+
+    def record_throttle(self) -> None:
+        with self._lock:
+            self._successes = 0
+            now = time.monotonic()
+            if now - self._last_decrease < self.cooldown:
+                return
+            self._last_decrease = now
+            self.limit = max(self.minimum, self.limit // 2)
@@ -0,0 +1,20 @@
+from matrixcurator.config.main import settings
+from matrixcurator.utils.concurrency import (
+    AsyncRateLimiter,
+    RateLimitConfig,
+    SharedRateLimiter,
+)
+
+__all__ = ["build_rate_limiter"]
+
+
+def build_rate_limiter(name: str, config: RateLimitConfig) -> AsyncRateLimiter:
+    """
+    Builds the limiter for one `*_rate_limit` setting on the configured backend.
+
+    With `rate_limit_backend="sqlite"` all processes on the host share the budget
+    of each `name`; with "memory" every process enforces it on its own.
+    """
+    if settings.rate_limit_backend == "sqlite":
+        return SharedRateLimiter(name, settings.rate_limit_db_path, settings=config)
+    return AsyncRateLimiter(settings=config)
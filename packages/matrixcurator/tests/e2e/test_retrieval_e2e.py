@@ -3,7 +3,7 @@ import asyncio
 from matrixcurator.modules.retrieval.services import vectorize_document, retrieve_context
 
 try:
-    from matrixcurator.modules.retrieval.repositories.sqlite import get_engine
+    from matrixcurator.modules.retrieval.repositories.sqlite import get_engine, get_vec_table
     from sqlalchemy.orm import Session
     from sqlalchemy import text
     HAS_SQLITE_VEC = True
@@ -18,12 +18,12 @@ def clean_db():
     engine = get_engine()
     with Session(engine) as session:
         session.execute(text("DELETE FROM document_chunks_meta"))
-        session.execute(text("DELETE FROM document_chunks_vec"))
+        session.execute(text(f"DELETE FROM {get_vec_table()}"))
         session.commit()
     yield
     with Session(engine) as session:
         session.execute(text("DELETE FROM document_chunks_meta"))
-        session.execute(text("DELETE FROM document_chunks_vec"))
+        session.execute(text(f"DELETE FROM {get_vec_table()}"))
         session.commit()
 
 @pytest.mark.asyncio
@@ -11,10 +11,10 @@ def test_docling_shutdown_is_clean():
     script = """
 import logging
 logging.basicConfig(level=logging.INFO)
-from matrixcurator.modules.tools.docling import get_converter
+from matrixcurator.modules.tools.docling import get_converter_pool
 
-# Trigger the singleton initialization
-converter = get_converter()
+# Trigger the pool initialization
+get_converter_pool().warm(1)
 print("Converter initialized successfully")
 """
     
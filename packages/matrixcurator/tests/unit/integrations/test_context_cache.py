@@ -0,0 +1,114 @@
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from litellm.exceptions import BadRequestError, NotFoundError
+
+from matrixcurator.config.main import settings
+from matrixcurator.integrations.context_cache import (
+    acompletion_with_context,
+    build_context_messages,
+    context_cache_registry,
+    document_hash,
+)
+
+LONG_CONTEXT = "character description " * 1000
+
+@pytest.fixture(autouse=True)
+def clear_registry():
+    context_cache_registry.clear()
+    yield
+    context_cache_registry.clear()
+
+def test_build_context_messages_marks_document_prefix():
+    messages = build_context_messages("Doc text", "Extract character 1", "gemini/gemini-1.5-pro", system_prompt="System")
+
+    assert [m["role"] for m in messages] == ["system", "user", "user"]
+    for message in messages[:2]:
+        assert message["content"][0]["cache_control"]["type"] == "ephemeral"
+        assert message["content"][0]["cache_control"]["ttl"] == f"{settings.context_cache_ttl_seconds}s"
+    assert messages[-1]["content"] == "Extract character 1"
+
+def test_build_context_messages_anthropic_has_no_ttl():
+    messages = build_context_messages("Doc text", "Extract", "anthropic/claude-3-5-sonnet-20240620")
+
+    assert messages[0]["content"][0]["cache_control"] == {"type": "ephemeral"}
+
+@pytest.mark.asyncio
+@patch("matrixcurator.integrations.context_cache.acompletion", new_callable=AsyncMock)
+async def test_acompletion_with_context_caches_supported_models(mock_acompletion):
+    await acompletion_with_context(LONG_CONTEXT, "Extract", "gemini/gemini-1.5-pro")
+
+    messages = mock_acompletion.call_args.kwargs["messages"]
+    assert "cache_control" in messages[0]["content"][0]
+    assert context_cache_registry.is_live((document_hash(LONG_CONTEXT), "gemini/gemini-1.5-pro"))
+
+@pytest.mark.asyncio
+@patch("matrixcurator.integrations.context_cache.acompletion", new_callable=AsyncMock)
+async def test_acompletion_with_context_skips_unsupported_models(mock_acompletion):
+    await acompletion_with_context(LONG_CONTEXT, "Extract", "gpt-4o")
+
+    messages = mock_acompletion.call_args.kwargs["messages"]
+    assert messages[0]["content"] == f"Text:\n{LONG_CONTEXT}"
+
+@pytest.mark.asyncio
+@patch("matrixcurator.integrations.context_cache.acompletion", new_callable=AsyncMock)
+async def test_acompletion_with_context_falls_back_when_cache_rejected(mock_acompletion):
+    fallback_response = MagicMock()
+    mock_acompletion.side_effect = [
+        BadRequestError("cached content is too small", model="gemini/gemini-1.5-pro", llm_provider="gemini"),
+        fallback_response,
+    ]
+
+    response = await acompletion_with_context(LONG_CONTEXT, "Extract", "gemini/gemini-1.5-pro")
+
+    assert response is fallback_response
+    assert mock_acompletion.await_count == 2
+    assert isinstance(mock_acompletion.call_args.kwargs["messages"][0]["content"], str)
+    assert not context_cache_registry.is_enabled((document_hash(LONG_CONTEXT), "gemini/gemini-1.5-pro"))
+
+@pytest.mark.asyncio
+@patch("matrixcurator.integrations.context_cache.acompletion", new_callable=AsyncMock)
+async def test_acompletion_with_context_recreates_expired_cache(mock_acompletion):
+    key = (document_hash(LONG_CONTEXT), "gemini/gemini-1.5-pro")
+    context_cache_registry.mark_created(key, 60)
+    response = MagicMock()
+    mock_acompletion.side_effect = [
+        NotFoundError("CachedContent not found (or permission denied)", model="gemini/gemini-1.5-pro", llm_provider="gemini"),
+        response,
+    ]
+
+    assert await acompletion_with_context(LONG_CONTEXT, "Extract", "gemini/gemini-1.5-pro") is response
+
+    # Both attempts asked for caching and the document stays cacheable
+    for call in mock_acompletion.call_args_list:
+        assert "cache_control" in call.kwargs["messages"][0]["content"][0]
+    assert context_cache_registry.is_enabled(key)
+    assert context_cache_registry.is_live(key)
+
+@pytest.mark.asyncio
+@patch("matrixcurator.integrations.context_cache.acompletion", new_callable=AsyncMock)
+async def test_acompletion_with_context_raises_unrelated_errors(mock_acompletion):
+    mock_acompletion.side_effect = BadRequestError(
+        "Invalid response_format schema", model="gemini/gemini-1.5-pro", llm_provider="gemini"
+    )
+
+    with pytest.raises(BadRequestError):
+        await acompletion_with_context(LONG_CONTEXT, "Extract", "gemini/gemini-1.5-pro")
+
+    assert mock_acompletion.await_count == 1
+    assert context_cache_registry.is_enabled((document_hash(LONG_CONTEXT), "gemini/gemini-1.5-pro"))
+
+@pytest.mark.asyncio
+@patch("matrixcurator.integrations.context_cache.acompletion", new_callable=AsyncMock)
+async def test_acompletion_with_context_raises_cache_control_validation_errors(mock_acompletion):
+    # Mentions cache_control, but the request is malformed rather than uncacheable
+    mock_acompletion.side_effect = BadRequestError(
+        "messages.0.content.0.text.cache_control.ttl: Input should be '5m' or '1h'",
+        model="anthropic/claude-sonnet-4-5",
+        llm_provider="anthropic",
+    )
+
+    with pytest.raises(BadRequestError):
+        await acompletion_with_context(LONG_CONTEXT, "Extract", "anthropic/claude-sonnet-4-5")
+
+    assert mock_acompletion.await_count == 1
+    assert context_cache_registry.is_enabled((document_hash(LONG_CONTEXT), "anthropic/claude-sonnet-4-5"))
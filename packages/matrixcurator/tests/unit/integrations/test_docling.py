@@ -5,8 +5,16 @@ from docling.datamodel.pipeline_options_vlm_model import ApiVlmOptions, InlineVl
 from docling.models.inference_engines.vlm.base import VlmEngineInput
 
 from matrixcurator.integrations.docling import McpVlmEngine, McpVlmConvertModel
-from matrixcurator.integrations.mcp import mcp_session_var
+from matrixcurator.integrations.mcp import mcp_loop_var, mcp_session_var
 from matrixcurator.config.main import settings
+import matrixcurator.integrations.docling as docling_integration
+from matrixcurator.integrations.docling import encode_page_image
+
+@pytest.fixture(autouse=True)
+def reset_vlm_throttle():
+    docling_integration._throttle = None
+    yield
+    docling_integration._throttle = None
 
 @pytest.fixture
 def mock_mcp_session():
@@ -60,18 +68,23 @@ def test_mcp_vlm_convert_model_forces_api_options():
         assert isinstance(mock_options.engine_options, ApiVlmEngineOptions)
         mock_super_init.assert_called_once()
 
-@patch("matrixcurator.integrations.docling.completion")
-def test_mcp_vlm_engine_litellm_fallback(mock_completion, mock_vlm_input):
+@pytest.mark.parametrize("engine_mode", ["async", "threads"])
+def test_mcp_vlm_engine_litellm_fallback(engine_mode, mock_vlm_input, monkeypatch):
     # Arrange
+    monkeypatch.setattr(settings, "vlm_engine_mode", engine_mode)
     options = ApiVlmOptions(url="http://localhost:8000", prompt="test", response_format=ResponseFormat.MARKDOWN)
     engine = McpVlmEngine(enable_remote_services=True, options=options)
     
     mock_response = MagicMock()
     mock_response.choices[0].message.content = "LiteLLM fallback text"
-    mock_completion.return_value = mock_response
+    if engine_mode == "async":
+        patcher = patch("matrixcurator.integrations.docling.acompletion", new=AsyncMock(return_value=mock_response))
+    else:
+        patcher = patch("matrixcurator.integrations.docling.completion", return_value=mock_response)
     
     # Act
-    result = engine.predict_batch([mock_vlm_input])
+    with patcher as mock_completion:
+        result = engine.predict_batch([mock_vlm_input])
     
     # Assert
     mock_completion.assert_called_once()
@@ -82,7 +95,7 @@ def test_mcp_vlm_engine_litellm_fallback(mock_completion, mock_vlm_input):
     assert kwargs["messages"][0]["role"] == "user"
     assert len(kwargs["messages"][0]["content"]) == 2
     assert kwargs["messages"][0]["content"][0]["type"] == "image_url"
-    assert "data:image/png;base64," in kwargs["messages"][0]["content"][0]["image_url"]["url"]
+    assert "data:image/jpeg;base64," in kwargs["messages"][0]["content"][0]["image_url"]["url"]
     assert kwargs["messages"][0]["content"][1]["type"] == "text"
     assert kwargs["messages"][0]["content"][1]["text"] == "Describe this image"
     
@@ -92,15 +105,20 @@ def test_mcp_vlm_engine_litellm_fallback(mock_completion, mock_vlm_input):
 @pytest.mark.asyncio
 async def test_parse_with_docling_concurrency_and_cache():
     import asyncio
+    import threading
     import time
+    from matrixcurator.utils.concurrency import RateLimitConfig
     from matrixcurator.modules.tools.docling import parse_with_docling
     import matrixcurator.modules.tools.docling
     
     # Reset globals
-    matrixcurator.modules.tools.docling._converter = None
+    matrixcurator.modules.tools.docling._pool = None
     matrixcurator.modules.tools.docling._manager = None
     
     call_count = 0
+    in_flight = 0
+    max_in_flight = 0
+    lock = threading.Lock()
     
     class MockConverter:
         def __init__(self, *args, **kwargs):
@@ -108,34 +126,40 @@ async def test_parse_with_docling_concurrency_and_cache():
             call_count += 1
             
         def convert(self, stream, **kwargs):
+            nonlocal in_flight, max_in_flight
+            with lock:
+                in_flight += 1
+                max_in_flight = max(max_in_flight, in_flight)
             time.sleep(0.1)  # Simulate slow work
+            with lock:
+                in_flight -= 1
             mock_res = MagicMock()
+            mock_res.document.pages = {}
             mock_res.document.export_to_markdown.return_value = "parsed"
             return mock_res
             
-    with patch("matrixcurator.modules.tools.docling.DocumentConverter", new=MockConverter):
-        # We need to mock get_limiter so we can set an arbitrary max_concurrency
-        mock_limiter = MagicMock()
-        mock_limiter.max_concurrency = 3
-        mock_limiter.acquire = AsyncMock()
+    with patch("matrixcurator.modules.tools.docling.DocumentConverter", new=MockConverter), \
+         patch.object(settings, "docling_pool_size", 3), \
+         patch.object(settings, "docling_rate_limit", RateLimitConfig()):
+        # Fire 10 tasks concurrently
+        tasks = [parse_with_docling.ainvoke({"file_content": b"dummy", "filename": f"file_{i}.pdf"}) for i in range(10)]
         
-        with patch("matrixcurator.modules.tools.docling.get_limiter", return_value=mock_limiter):
-            # Fire 10 tasks concurrently
-            tasks = [parse_with_docling.ainvoke({"file_content": b"dummy", "filename": f"file_{i}.pdf"}) for i in range(10)]
-            
-            start_time = time.monotonic()
-            results = await asyncio.gather(*tasks)
-            end_time = time.monotonic()
-            
-            # Since sleep is 0.1 and concurrency is 3, 10 tasks should take ceil(10/3)*0.1 = 0.4 seconds
-            # Without concurrency manager, it would take 0.1 seconds because all would run in parallel
-            assert end_time - start_time >= 0.3
-            
-            # Converter should only be instantiated EXACTLY once
-            assert call_count == 1
-            
-            for res in results:
-                assert res == "parsed"
+        start_time = time.monotonic()
+        results = await asyncio.gather(*tasks)
+        end_time = time.monotonic()
+        
+        # Since sleep is 0.1 and the pool holds 3 converters, 10 tasks take ceil(10/3)*0.1 = 0.4 seconds
+        assert end_time - start_time >= 0.3
+        assert max_in_flight == 3
+        
+        # Converters are pooled: one per concurrent conversion, reused across tasks
+        assert call_count == 3
+        
+        for res in results:
+            assert res == "parsed"
+
+    matrixcurator.modules.tools.docling._pool = None
+    matrixcurator.modules.tools.docling._manager = None
 
 @patch("matrixcurator.integrations.docling.sample_message")
 def test_mcp_vlm_engine_predict_batch_mcp(mock_sample_message, mock_vlm_input, mock_mcp_session):
@@ -167,3 +191,105 @@ def test_mcp_vlm_engine_predict_batch_mcp(mock_sample_message, mock_vlm_input, m
         assert result[0].text == "MCP text"
     finally:
         mcp_session_var.reset(token)
+
+
+@patch("matrixcurator.integrations.docling.sample_message")
+def test_mcp_vlm_engine_samples_on_session_loop(mock_sample_message, mock_vlm_input, mock_mcp_session):
+    import asyncio
+
+    options = ApiVlmOptions(url="http://localhost:8000", prompt="test", response_format=ResponseFormat.MARKDOWN)
+    engine = McpVlmEngine(enable_remote_services=True, options=options)
+
+    sampling_loops = []
+    in_flight = 0
+    max_in_flight = 0
+
+    async def mock_sample(*args, **kwargs):
+        nonlocal in_flight, max_in_flight
+        sampling_loops.append(asyncio.get_running_loop())
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return MagicMock(content=[MagicMock(type="text", text="MCP text")])
+
+    mock_sample_message.side_effect = mock_sample
+
+    async def parse():
+        # Mirrors parse_with_docling: the session's loop runs the conversion in a thread
+        session_token = mcp_session_var.set(mock_mcp_session)
+        loop_token = mcp_loop_var.set(asyncio.get_running_loop())
+        try:
+            return asyncio.get_running_loop(), await asyncio.to_thread(engine.predict_batch, [mock_vlm_input] * 6)
+        finally:
+            mcp_loop_var.reset(loop_token)
+            mcp_session_var.reset(session_token)
+
+    with patch.object(settings, "vlm_max_concurrency", 2):
+        session_loop, result = asyncio.run(parse())
+
+    assert [output.text for output in result] == ["MCP text"] * 6
+    assert set(sampling_loops) == {session_loop}
+    assert max_in_flight == 2
+
+
+@patch("matrixcurator.integrations.docling.time.sleep")
+def test_mcp_vlm_engine_retries_rate_limited_requests(mock_sleep, mock_vlm_input, monkeypatch):
+    monkeypatch.setattr(settings, "vlm_engine_mode", "threads")
+    options = ApiVlmOptions(url="http://localhost:8000", prompt="test", response_format=ResponseFormat.MARKDOWN)
+    engine = McpVlmEngine(enable_remote_services=True, options=options)
+
+    class RateLimitError(Exception):
+        status_code = 429
+
+    mock_response = MagicMock()
+    mock_response.choices[0].message.content = "LiteLLM text"
+
+    with patch(
+        "matrixcurator.integrations.docling.completion",
+        side_effect=[RateLimitError("quota exceeded"), mock_response],
+    ) as mock_completion:
+        result = engine.predict_batch([mock_vlm_input])
+
+    assert mock_completion.call_count == 2
+    assert result[0].text == "LiteLLM text"
+    assert docling_integration.get_throttle().concurrency.limit == settings.vlm_max_concurrency // 2
+
+
+def test_encode_page_image_uses_configured_format(monkeypatch):
+    import base64
+    from io import BytesIO
+    from PIL import Image
+
+    page = Image.new("RGBA", (200, 300), "white")
+    monkeypatch.setattr(settings, "vlm_image_format", "WEBP")
+
+    mime_type, data = encode_page_image(page)
+
+    assert mime_type == "image/webp"
+    encoded = Image.open(BytesIO(base64.b64decode(data)))
+    assert encoded.format == "WEBP"
+    assert encoded.size == (200, 300)
+    # The caller's image is left untouched
+    assert page.mode == "RGBA"
+
+
+def test_encode_page_image_grayscale_only_for_colorless_pages(monkeypatch):
+    import base64
+    from io import BytesIO
+    from PIL import Image
+
+    monkeypatch.setattr(settings, "vlm_image_format", "PNG")
+    monkeypatch.setattr(settings, "vlm_image_grayscale", True)
+
+    def encoded_mode(image):
+        _, data = encode_page_image(image)
+        return Image.open(BytesIO(base64.b64decode(data))).mode
+
+    text_page = Image.new("RGB", (100, 100), "white")
+    text_page.paste((20, 20, 20), (10, 10, 90, 20))
+    figure_page = Image.new("RGB", (100, 100), "white")
+    figure_page.paste((200, 30, 30), (10, 10, 90, 90))
+
+    assert encoded_mode(text_page) == "L"
+    assert encoded_mode(figure_page) == "RGB"
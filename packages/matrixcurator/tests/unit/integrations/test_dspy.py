@@ -12,6 +12,7 @@ def mock_mcp_session():
     # Create a mock MCP result
     mock_result = MagicMock()
     mock_result.role = "assistant"
+    mock_result.model = "mcp-model"
     
     mock_content = MagicMock()
     mock_content.type = "text"
@@ -88,3 +89,37 @@ async def test_mcp_aware_lm_aforward_fallback(mock_super_aforward, mock_mcp_sess
         mock_super_aforward.assert_called_once()
     finally:
         mcp_session_var.reset(token)
+
+@pytest.mark.asyncio
+@patch("dspy.LM.aforward")
+async def test_mcp_aware_lm_does_not_cache_mcp_responses(mock_super_aforward, mock_mcp_session, tmp_path, monkeypatch):
+    # Arrange
+    import matrixcurator.integrations.litellm as litellm_integration
+    from litellm import ModelResponse
+    from matrixcurator.config.main import settings
+    from matrixcurator.integrations.dspy import MCPAwareLM
+
+    monkeypatch.setattr(settings, "llm_cache_enabled", True)
+    monkeypatch.setattr(settings, "llm_cache_path", str(tmp_path / "llm_cache.sqlite"))
+    monkeypatch.setattr(litellm_integration, "_response_cache", None)
+    mock_super_aforward.return_value = ModelResponse(
+        choices=[{"message": {"role": "assistant", "content": "Native"}}]
+    )
+    lm = MCPAwareLM("gpt-4")
+
+    # Act
+    token = mcp_session_var.set(mock_mcp_session)
+    try:
+        sampled = await lm.aforward(prompt="Hello")
+    finally:
+        mcp_session_var.reset(token)
+    native = await lm.aforward(prompt="Hello")
+    cached = await lm.aforward(prompt="Hello")
+
+    # Assert
+    assert isinstance(sampled, ModelResponse)
+    assert sampled.choices[0].message.content == "MCP DSPy Response"
+    assert native.choices[0].message.content == "Native"
+    assert type(cached) is type(native)
+    assert cached.choices[0].message.content == "Native"
+    mock_super_aforward.assert_called_once()
@@ -80,3 +80,62 @@ def test_completion_without_mcp_session(mock_litellm_completion):
     
     # Assert
     mock_litellm_completion.assert_called_once()
+
+@pytest.mark.asyncio
+@patch("matrixcurator.integrations.litellm.litellm.acompletion")
+async def test_acompletion_response_cache_hit(mock_litellm_acompletion, tmp_path):
+    # Arrange
+    import matrixcurator.integrations.litellm as litellm_integration
+    from litellm import ModelResponse
+    from matrixcurator.config.main import settings
+
+    original = (settings.llm_cache_enabled, settings.llm_cache_path)
+    settings.llm_cache_enabled = True
+    settings.llm_cache_path = str(tmp_path / "llm_cache.sqlite")
+    litellm_integration._response_cache = None
+
+    mock_litellm_acompletion.return_value = ModelResponse(
+        choices=[{"message": {"role": "assistant", "content": "Cached answer"}}]
+    )
+
+    try:
+        # Act
+        first = await acompletion(model="gpt-4", messages=[{"role": "user", "content": "Hi"}])
+        second = await acompletion(model="gpt-4", messages=[{"role": "user", "content": "Hi"}])
+
+        # Assert
+        mock_litellm_acompletion.assert_called_once()
+        assert second.choices[0].message.content == first.choices[0].message.content
+        stats = litellm_integration.get_response_cache().stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+    finally:
+        settings.llm_cache_enabled, settings.llm_cache_path = original
+        litellm_integration._response_cache = None
+
+@pytest.mark.asyncio
+@patch("matrixcurator.integrations.litellm.litellm.acompletion")
+async def test_acompletion_does_not_cache_mcp_responses(mock_litellm_acompletion, mock_mcp_session, tmp_path):
+    # Arrange
+    import matrixcurator.integrations.litellm as litellm_integration
+    from matrixcurator.config.main import settings
+
+    original = (settings.llm_cache_enabled, settings.llm_cache_path)
+    settings.llm_cache_enabled = True
+    settings.llm_cache_path = str(tmp_path / "llm_cache.sqlite")
+    litellm_integration._response_cache = None
+    token = mcp_session_var.set(mock_mcp_session)
+
+    try:
+        # Act
+        await acompletion(model="gpt-4", messages=[{"role": "user", "content": "Hi"}])
+        await acompletion(model="gpt-4", messages=[{"role": "user", "content": "Hi"}])
+
+        # Assert
+        assert mock_mcp_session.create_message.await_count == 2
+        mock_litellm_acompletion.assert_not_called()
+        assert litellm_integration.get_response_cache().stats()["hits"] == 0
+    finally:
+        mcp_session_var.reset(token)
+        settings.llm_cache_enabled, settings.llm_cache_path = original
+        litellm_integration._response_cache = None
@@ -0,0 +1,82 @@
+import fitz
+import pytest
+from unittest.mock import MagicMock, patch
+
+from matrixcurator.modules.document.repositories.pdf import (
+    assess_text_layer,
+    read_pdf,
+    read_pdf_pages,
+)
+
+
+@pytest.fixture
+def pdf_bytes():
+    doc = fitz.open()
+    for i in range(1, 5):
+        doc.new_page().insert_text((72, 72), f"Page {i} text")
+    content = doc.tobytes()
+    doc.close()
+    return content
+
+
+def test_read_pdf_pages_returns_page_indexed_output(pdf_bytes):
+    pages = read_pdf_pages(pdf_bytes, pages=[3, 1, 9])
+
+    assert [page["page"] for page in pages] == [3, 1]
+    assert pages[0]["content"].strip() == "Page 3 text"
+
+
+def test_read_pdf_joins_all_pages(pdf_bytes):
+    text = read_pdf(pdf_bytes)
+
+    assert [line for line in text.splitlines()] == [f"Page {i} text" for i in range(1, 5)]
+
+
+@patch("matrixcurator.modules.document.repositories.pdf.settings.pdf_parallel_min_pages", 1)
+def test_read_pdf_pages_parallel_matches_serial(pdf_bytes):
+    serial = read_pdf_pages(pdf_bytes, workers=1)
+    parallel = read_pdf_pages(pdf_bytes, workers=2)
+
+    assert parallel == serial
+
+
+@pytest.fixture
+def mixed_pdf_bytes():
+    doc = fitz.open()
+    text_page = doc.new_page()
+    text_page.insert_textbox(text_page.rect + (72, 72, -72, -72), "Character description. " * 200)
+    scanned_page = doc.new_page()
+    scan = fitz.Pixmap(fitz.csRGB, fitz.IRect(0, 0, 60, 80), False)
+    scan.clear_with(200)
+    scanned_page.insert_image(scanned_page.rect, pixmap=scan)
+    garbled_page = doc.new_page()
+    garbled_page.insert_textbox(garbled_page.rect + (72, 72, -72, -72), "Character description. " * 200)
+    content = doc.tobytes()
+    doc.close()
+    return content
+
+
+@patch("matrixcurator.modules.document.repositories.pdf.settings.hybrid_detect_tables", False)
+def test_assess_text_layer_flags_hard_pages(mixed_pdf_bytes):
+    pages = read_pdf_pages(mixed_pdf_bytes)
+    pages[2]["content"] = "\ufffd\ue001" * 40 + pages[2]["content"][:100]
+
+    assessments = assess_text_layer(mixed_pdf_bytes, pages)
+
+    assert [a["needs_vlm"] for a in assessments] == [False, True, True]
+    assert assessments[1]["reasons"] == ["low_text"]
+    assert assessments[2]["reasons"] == ["garbled"]
+
+
+@patch("matrixcurator.modules.document.repositories.pdf.settings.hybrid_detect_tables", True)
+def test_assess_text_layer_detects_tables_only_on_unflagged_pages(mixed_pdf_bytes):
+    pages = read_pdf_pages(mixed_pdf_bytes)
+    pages[2]["content"] = "\ufffd\ue001" * 40 + pages[2]["content"][:100]
+    tables = MagicMock()
+    tables.return_value.tables = []
+
+    with patch.object(fitz.Page, "find_tables", tables):
+        assessments = assess_text_layer(mixed_pdf_bytes, pages)
+
+    assert [a["needs_vlm"] for a in assessments] == [False, True, True]
+    assert tables.call_count == 1
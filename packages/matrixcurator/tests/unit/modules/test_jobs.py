@@ -0,0 +1,148 @@
+import asyncio
+
+import pytest
+
+from matrixcurator.config.main import settings
+from matrixcurator.modules.schemas import ExtractRequest
+from matrixcurator.modules.jobs.schemas import JobStatus
+from matrixcurator.modules.jobs.services import (
+    JobWorkerPool,
+    get_job_results,
+    get_job_status,
+    submit_job,
+)
+from matrixcurator.modules.jobs.repositories.sqlite import (
+    claim_next_job,
+    finish_job,
+    release_jobs,
+    renew_lease,
+    save_result,
+)
+
+@pytest.fixture
+def temp_jobs_db(tmp_path):
+    original_path = settings.jobs_db_path
+    settings.jobs_db_path = str(tmp_path / "jobs.sqlite")
+
+    import matrixcurator.modules.jobs.repositories.sqlite as jobs_repository
+    jobs_repository._engine = None
+
+    yield
+
+    settings.jobs_db_path = original_path
+    jobs_repository._engine = None
+
+class FakeClient:
+    def __init__(self):
+        self.calls = []
+
+    async def stream_characters(self, context, character_indices, user_id=None, job_id=None):
+        self.calls.append(list(character_indices))
+        for idx in reversed(character_indices):
+            yield {
+                "character_index": idx,
+                "extracted_data": {"character_index": idx},
+                "evaluation_score": 10,
+                "errors": [],
+            }
+
+def test_submit_job_is_queued(temp_jobs_db):
+    job_id = submit_job(ExtractRequest(context="text", character_indices=[1, 2, 3]))
+
+    status = get_job_status(job_id)
+
+    assert status.status == JobStatus.QUEUED
+    assert status.completed == 0
+    assert status.total == 3
+
+@pytest.mark.asyncio
+async def test_run_job_records_results_in_index_order(temp_jobs_db):
+    job_id = submit_job(ExtractRequest(context="text", character_indices=[1, 2, 3]))
+    client = FakeClient()
+    pool = JobWorkerPool(client, workers=1)
+
+    await pool.run_job(claim_next_job("worker-a"))
+
+    status = get_job_status(job_id)
+    results = get_job_results(job_id)
+    assert status.status == JobStatus.COMPLETED
+    assert status.completed == 3
+    assert [s["character_index"] for s in results.extracted_states] == [1, 2, 3]
+
+@pytest.mark.asyncio
+async def test_run_job_resumes_remaining_characters(temp_jobs_db):
+    job_id = submit_job(ExtractRequest(context="text", character_indices=[1, 2, 3]))
+    job = claim_next_job("worker-a")
+    save_result(job_id, "worker-a", {"character_index": 2, "extracted_data": {"character_index": 2}, "errors": []})
+    client = FakeClient()
+
+    await JobWorkerPool(client, workers=1).run_job(job)
+
+    assert client.calls == [[1, 3]]
+    assert get_job_status(job_id).completed == 3
+
+def test_claim_next_job_returns_none_when_empty(temp_jobs_db):
+    assert claim_next_job("worker-a") is None
+
+def test_running_job_is_reclaimed_only_after_its_lease_expires(temp_jobs_db, monkeypatch):
+    job_id = submit_job(ExtractRequest(context="text", character_indices=[1]))
+    assert claim_next_job("worker-a")["worker_id"] == "worker-a"
+
+    # A live lease keeps other workers away, and only the owner can renew it
+    assert claim_next_job("worker-b") is None
+    assert not renew_lease(job_id, "worker-b")
+    assert renew_lease(job_id, "worker-a")
+
+    monkeypatch.setattr(settings, "job_lease_seconds", -1)
+    reclaimed = claim_next_job("worker-b")
+
+    assert reclaimed["id"] == job_id
+    assert reclaimed["worker_id"] == "worker-b"
+    assert not renew_lease(job_id, "worker-a")
+
+def test_release_jobs_requeues_only_the_given_workers(temp_jobs_db):
+    first = submit_job(ExtractRequest(context="text", character_indices=[1]))
+    second = submit_job(ExtractRequest(context="text", character_indices=[2]))
+    claim_next_job("worker-a")
+    claim_next_job("worker-b")
+
+    assert release_jobs(["worker-a"]) == 1
+
+    assert get_job_status(first).status == JobStatus.QUEUED
+    assert get_job_status(second).status == JobStatus.RUNNING
+
+
+def test_writes_require_the_lease(temp_jobs_db, monkeypatch):
+    job_id = submit_job(ExtractRequest(context="text", character_indices=[1]))
+    claim_next_job("worker-a")
+    monkeypatch.setattr(settings, "job_lease_seconds", -1)
+    claim_next_job("worker-b")
+
+    assert not save_result(job_id, "worker-a", {"character_index": 1, "errors": []})
+    assert not finish_job(job_id, "worker-a", JobStatus.COMPLETED)
+    assert get_job_status(job_id).completed == 0
+    assert get_job_status(job_id).status == JobStatus.RUNNING
+
+@pytest.mark.asyncio
+async def test_run_job_stops_when_the_lease_is_lost(temp_jobs_db, monkeypatch):
+    job_id = submit_job(ExtractRequest(context="text", character_indices=[1, 2]))
+    job = claim_next_job("worker-a")
+    monkeypatch.setattr(settings, "job_lease_seconds", 0.03)
+    cancelled = asyncio.Event()
+
+    class StalledClient(FakeClient):
+        async def stream_characters(self, context, character_indices, user_id=None, job_id=None):
+            # Another worker takes the job over while this one is still extracting
+            release_jobs(["worker-a"])
+            claim_next_job("worker-b")
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+            yield {}
+
+    await asyncio.wait_for(JobWorkerPool(StalledClient(), workers=1).run_job(job), timeout=2)
+
+    assert cancelled.is_set()
+    assert get_job_status(job_id).status == JobStatus.RUNNING
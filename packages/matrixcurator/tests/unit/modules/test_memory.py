@@ -0,0 +1,39 @@
+import sqlite3
+
+import pytest
+from langgraph.checkpoint.base import empty_checkpoint
+
+from matrixcurator.modules.agent.memory import SqliteCheckpointer
+
+
+@pytest.fixture
+def saver(tmp_path):
+    conn = sqlite3.connect(tmp_path / "checkpoints.sqlite", check_same_thread=False)
+    yield SqliteCheckpointer(conn, ttl_seconds=3600)
+    conn.close()
+
+
+def _config(thread_id):
+    return {"configurable": {"thread_id": thread_id, "checkpoint_ns": ""}}
+
+
+@pytest.mark.asyncio
+async def test_async_put_and_get_roundtrip(saver):
+    checkpoint = empty_checkpoint()
+
+    await saver.aput(_config("t1"), checkpoint, {"source": "input", "step": -1}, {})
+    saved = await saver.aget_tuple(_config("t1"))
+
+    assert saved is not None
+    assert saved.checkpoint["id"] == checkpoint["id"]
+
+
+def test_prune_removes_idle_threads_only(saver):
+    saver.put(_config("old"), empty_checkpoint(), {}, {})
+    saver.put(_config("new"), empty_checkpoint(), {}, {})
+    with saver.cursor() as cur:
+        cur.execute("UPDATE thread_activity SET updated_at = 0 WHERE thread_id = 'old'")
+
+    assert saver.prune() == 1
+    assert saver.get_tuple(_config("old")) is None
+    assert saver.get_tuple(_config("new")) is not None
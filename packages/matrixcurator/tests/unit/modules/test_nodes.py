@@ -0,0 +1,49 @@
+import json
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from matrixcurator.modules.agent.nodes import batch_evaluator_agent, extractor_agent
+from matrixcurator.modules.document.registry import document_registry
+
+
+@pytest.mark.asyncio
+@patch("matrixcurator.integrations.context_cache.acompletion", new_callable=AsyncMock)
+async def test_extractor_agent_awaits_acompletion(mock_acompletion):
+    mock_response = MagicMock()
+    mock_response.choices[0].message.content = json.dumps(
+        {"character_index": 1, "character_name": "Tail", "states": {"0": "short"}}
+    )
+    mock_acompletion.return_value = mock_response
+
+    document_id = await document_registry.register("Some text")
+    result = await extractor_agent({"document_id": document_id, "character_index": 1, "attempts": 0})
+
+    assert result["extracted_data"]["character_name"] == "Tail"
+    assert result["attempts"] == 1
+    mock_acompletion.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+@patch("matrixcurator.integrations.context_cache.acompletion", new_callable=AsyncMock)
+async def test_extractor_agent_empty_context(mock_acompletion):
+    result = await extractor_agent({"document_id": "", "character_index": 1})
+
+    assert result["extracted_data"] is None
+    mock_acompletion.assert_not_called()
+
+
+def test_batch_evaluator_agent_flags_missing_and_low_scoring():
+    state = {
+        "character_indices": [1, 2, 3, 4],
+        "extracted_batch": [
+            {"character_index": 1, "character_name": "Tail", "states": {"0": "short"}},
+            {"character_index": 3, "character_name": "", "states": {"0": "absent"}},
+            {"character_index": 4, "character_name": "Skull", "states": {"0": "flat"}},
+            {"character_index": 9, "character_name": "Unrequested", "states": {"0": "x"}},
+        ],
+    }
+
+    result = batch_evaluator_agent(state)
+
+    assert [d["character_index"] for d in result["accepted"]] == [1, 4]
+    assert result["pending_indices"] == [2, 3]
@@ -0,0 +1,84 @@
+import fitz
+import pytest
+from unittest.mock import AsyncMock, patch
+
+import matrixcurator.modules.document.cache as parse_cache
+from matrixcurator.config.main import settings
+from matrixcurator.modules.document.cache import cached_parse
+from matrixcurator.modules.document.services import parse_document
+from matrixcurator.modules.tools.pymupdf import parse_with_pymupdf
+
+
+@pytest.fixture(autouse=True)
+def enable_parse_cache(monkeypatch, tmp_path):
+    monkeypatch.setattr(settings, "parse_cache_enabled", True)
+    monkeypatch.setattr(settings, "parse_cache_path", str(tmp_path / "parses.sqlite"))
+    parse_cache._parse_cache = None
+    yield
+    parse_cache._parse_cache.close()
+    parse_cache._parse_cache = None
+
+
+def pages_of(*numbers):
+    return [{"page": p, "content": f"page {p}"} for p in numbers]
+
+
+@pytest.mark.asyncio
+async def test_cached_parse_only_parses_missing_pages():
+    parse = AsyncMock(side_effect=lambda pages: pages_of(*pages))
+
+    first = await cached_parse("pymupdf", b"pdf", [1, 2], parse)
+    second = await cached_parse("pymupdf", b"pdf", [3, 2, 1], parse)
+
+    assert first == pages_of(1, 2)
+    assert second == pages_of(3, 2, 1)
+    assert [call.args[0] for call in parse.await_args_list] == [[1, 2], [3]]
+
+
+@pytest.mark.asyncio
+async def test_cached_parse_reuses_whole_document_parses():
+    parse = AsyncMock(return_value=pages_of(1, 2, 3))
+
+    await cached_parse("docling", b"pdf", None, parse)
+    whole = await cached_parse("docling", b"pdf", None, parse)
+    subset = await cached_parse("docling", b"pdf", [2], parse)
+
+    assert whole == pages_of(1, 2, 3)
+    assert subset == pages_of(2)
+    parse.assert_awaited_once_with(None)
+
+
+@pytest.mark.asyncio
+async def test_cached_parse_keys_on_bytes_parser_and_options():
+    parse = AsyncMock(side_effect=lambda pages: pages_of(*pages))
+
+    await cached_parse("docling", b"pdf", [1], parse, options={"vlm_model": "a"})
+    await cached_parse("docling", b"pdf", [1], parse, options={"vlm_model": "b"})
+    await cached_parse("pymupdf", b"pdf", [1], parse)
+    await cached_parse("pymupdf", b"other pdf", [1], parse)
+
+    assert parse.await_count == 4
+
+
+@pytest.mark.asyncio
+async def test_pymupdf_tool_is_served_from_cache():
+    doc = fitz.open()
+    doc.new_page().insert_text((72, 72), "Cached page")
+    content = doc.tobytes()
+    doc.close()
+
+    first = await parse_with_pymupdf.ainvoke({"file_content": content, "filename": "test.pdf"})
+    with patch("matrixcurator.modules.document.repositories.pdf.fitz.open") as mock_fitz_open:
+        second = await parse_with_pymupdf.ainvoke({"file_content": content, "filename": "test.pdf"})
+
+    assert second == first
+    assert first.strip() == "Cached page"
+    mock_fitz_open.assert_not_called()
+
+
+def test_parse_document_is_served_from_cache():
+    with patch("matrixcurator.modules.document.services.read_docx", return_value="text") as mock_read:
+        assert parse_document(b"hello", "notes.docx") == "text"
+        assert parse_document(b"hello", "notes.docx") == "text"
+
+    mock_read.assert_called_once()
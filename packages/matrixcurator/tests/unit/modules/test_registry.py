@@ -0,0 +1,46 @@
+import pytest
+
+from matrixcurator.exceptions import DocumentNotFoundError
+from matrixcurator.integrations.context_cache import document_hash
+from matrixcurator.modules.agent.memory import get_store
+from matrixcurator.modules.document.registry import DOCUMENTS_NAMESPACE, DocumentRegistry
+
+
+@pytest.mark.asyncio
+async def test_register_stores_document_once_under_its_hash():
+    registry = DocumentRegistry()
+
+    first = await registry.register("Full article text")
+    second = await registry.register("Full article text")
+
+    assert first == second == document_hash("Full article text")
+    assert await registry.resolve(first) == "Full article text"
+
+
+@pytest.mark.asyncio
+async def test_resolve_reloads_evicted_documents_from_the_store():
+    registry = DocumentRegistry(max_cached=1)
+
+    first = await registry.register("First article")
+    await registry.register("Second article")
+
+    assert first not in registry._cache
+    assert await registry.resolve(first) == "First article"
+
+
+@pytest.mark.asyncio
+async def test_resolve_unknown_document_raises():
+    with pytest.raises(DocumentNotFoundError):
+        await DocumentRegistry().resolve("missing")
+
+
+@pytest.mark.asyncio
+async def test_register_restores_documents_expired_from_the_store():
+    registry = DocumentRegistry()
+
+    document_id = await registry.register("Expiring article")
+    await get_store().adelete(DOCUMENTS_NAMESPACE, document_id)
+    await registry.register("Expiring article")
+
+    item = await get_store().aget(DOCUMENTS_NAMESPACE, document_id)
+    assert item.value["text"] == "Expiring article"
@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 from unittest.mock import patch, MagicMock, AsyncMock
 from matrixcurator.modules.retrieval.services import chunk_text, embed_and_store_chunks, retrieve_context, vectorize_document
@@ -26,7 +27,8 @@ async def test_embed_and_store_chunks(mock_get_insert, mock_fetch):
     await embed_and_store_chunks(chunks)
     
     mock_fetch.assert_called_once()
-    assert chunks[0]["embedding"] == [0.1, 0.2, 0.3]
+    assert chunks[0]["embedding"].dtype == np.float32
+    np.testing.assert_allclose(chunks[0]["embedding"], [0.1, 0.2, 0.3], rtol=1e-6)
     mock_insert.assert_called_once_with(chunks)
 
 @pytest.mark.asyncio
@@ -47,7 +49,10 @@ async def test_retrieve_context(mock_get_query, mock_fetch):
     context = await retrieve_context("query")
     
     mock_fetch.assert_called_once()
-    mock_query.assert_called_once_with(embedding=[0.1, 0.2, 0.3], match_count=5, document_id=None)
+    mock_query.assert_called_once()
+    kwargs = mock_query.call_args.kwargs
+    assert kwargs.pop("embedding").dtype == np.float32
+    assert kwargs == {"match_count": 5, "document_id": None}
     assert context == "Result 1\n\nResult 2"
 
 @pytest.mark.asyncio
@@ -63,7 +68,7 @@ async def test_embed_and_store_chunks_batching(mock_sleep, mock_get_insert, mock
     
     def side_effect(texts):
         mock_response = MagicMock()
-        mock_response.data = [{"embedding": [0.1] * len(text)} for text in texts]
+        mock_response.data = [{"embedding": [0.1] * 3} for _ in texts]
         return mock_response
         
     mock_fetch.side_effect = side_effect
@@ -104,7 +109,8 @@ async def test_embed_and_store_chunks_rate_limit_retry(mock_get_insert, mock_aem
     await embed_and_store_chunks(chunks)
     
     assert mock_aembedding.call_count == 2
-    assert chunks[0]["embedding"] == [0.1, 0.2, 0.3]
+    assert chunks[0]["embedding"].dtype == np.float32
+    np.testing.assert_allclose(chunks[0]["embedding"], [0.1, 0.2, 0.3], rtol=1e-6)
     mock_insert.assert_called_once()
 
 @patch('matrixcurator.modules.retrieval.repositories.supabase.get_client')
@@ -112,11 +118,13 @@ def test_insert_chunks_repository(mock_get_client):
     mock_client = MagicMock()
     mock_get_client.return_value = mock_client
     
-    chunks = [{"id": "1", "document_id": "doc1", "content": "hello", "metadata": {}, "embedding": [0.1]}]
+    chunks = [{"id": "1", "document_id": "doc1", "content": "hello", "metadata": {}, "embedding": np.array([0.5], dtype=np.float32)}]
     insert_chunks(chunks)
     
     mock_client.table.assert_called_once_with("document_chunks")
     mock_client.table().upsert.assert_called_once()
+    # float32 rows are sent as JSON arrays
+    assert mock_client.table().upsert.call_args.args[0][0]["embedding"] == [0.5]
 
 @patch('matrixcurator.modules.retrieval.repositories.supabase.get_client')
 def test_query_similar_chunks_repository(mock_get_client):
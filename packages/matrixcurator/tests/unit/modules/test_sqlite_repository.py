@@ -14,7 +14,7 @@ def temp_sqlite_db(tmp_path):
     import matrixcurator.modules.retrieval.repositories.sqlite as sqlite_repository
     sqlite_repository._engine = None
     
-    with patch("matrixcurator.modules.retrieval.repositories.sqlite._get_embedding_dimension", return_value=3072):
+    with patch.object(settings, "embedding_dimension", 3072):
         yield
     
     settings.sqlite_db_path = original_path
@@ -85,3 +85,243 @@ def test_delete_chunks_by_document(temp_sqlite_db):
     results_after = query_similar_chunks(embedding=dummy_embedding, match_threshold=0.5, match_count=5)
     assert len(results_after) == 1
     assert results_after[0]["document_id"] == "doc_2"
+
+
+def test_embedding_dimension_registry(monkeypatch):
+    from matrixcurator.modules.retrieval.embeddings import embedding_dimension
+
+    monkeypatch.setattr(settings, "embedding_dimension", None)
+    assert embedding_dimension("text-embedding-3-small") == 1536
+    assert embedding_dimension("openai/text-embedding-3-large") == 3072
+    with pytest.raises(ValueError, match="EMBEDDING_DIMENSION"):
+        embedding_dimension("custom/unknown-embedder")
+
+    # The override applies to the configured model only
+    monkeypatch.setattr(settings, "embedding_model", "custom/unknown-embedder")
+    monkeypatch.setattr(settings, "embedding_dimension", 256)
+    assert embedding_dimension() == 256
+    assert embedding_dimension("text-embedding-3-small") == 1536
+
+
+def test_engine_startup_makes_no_embedding_calls(temp_sqlite_db):
+    from matrixcurator.modules.retrieval.repositories.sqlite import get_vec_table
+
+    with patch("litellm.embedding") as mock_embedding:
+        table = get_vec_table()
+
+    mock_embedding.assert_not_called()
+    assert table.endswith("_3072")
+
+
+def test_switching_embedding_model_uses_separate_table(temp_sqlite_db, monkeypatch):
+    from matrixcurator.modules.retrieval.repositories.sqlite import (
+        delete_chunks_by_document,
+        get_vec_table,
+        insert_chunks,
+        query_similar_chunks,
+    )
+
+    def chunk(chunk_id, dim):
+        return {
+            "id": chunk_id,
+            "document_id": "doc_1",
+            "content": chunk_id,
+            "metadata": {},
+            "embedding": [0.1] * dim,
+        }
+
+    insert_chunks([chunk("chunk_large", 3072)])
+    large_table = get_vec_table()
+
+    monkeypatch.setattr(settings, "embedding_model", "text-embedding-3-small")
+    monkeypatch.setattr(settings, "embedding_dimension", None)
+    insert_chunks([chunk("chunk_small", 1536)])
+    assert get_vec_table() != large_table
+
+    # Each model only sees the vectors it produced
+    results = query_similar_chunks(embedding=[0.1] * 1536, match_threshold=0.5)
+    assert [result["id"] for result in results] == ["chunk_small"]
+
+    # Deleting a document clears its vectors from every model's table
+    delete_chunks_by_document(["doc_1"])
+    monkeypatch.setattr(settings, "embedding_model", "gemini/gemini-embedding-2")
+    assert query_similar_chunks(embedding=[0.1] * 3072, match_threshold=0.5) == []
+
+
+def test_bulk_insert_upserts_across_batches(temp_sqlite_db):
+    from sqlalchemy import text
+    from matrixcurator.modules.retrieval.repositories.sqlite import (
+        get_engine,
+        get_vec_table,
+        insert_chunks,
+        query_similar_chunks,
+    )
+
+    chunks = [
+        {
+            "id": f"chunk_{i}",
+            "document_id": "doc_1",
+            "content": f"version 1 of chunk {i}",
+            "metadata": {"parser_name": "docling"},
+            "embedding": [0.1] * 3072,
+        }
+        for i in range(5)
+    ]
+    insert_chunks(chunks, batch_size=2)
+
+    # Re-ingesting replaces rows instead of tripping the vec0 primary key
+    chunks[0]["content"] = "version 2 of chunk 0"
+    insert_chunks(chunks[:1])
+
+    with get_engine().connect() as conn:
+        assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+        assert conn.execute(text(f"SELECT COUNT(*) FROM {get_vec_table()}")).scalar() == 5
+
+    results = query_similar_chunks(embedding=[0.1] * 3072, match_threshold=0.5, match_count=10)
+    assert len(results) == 5
+    assert "version 2 of chunk 0" in {result["content"] for result in results}
+
+
+def test_float32_embeddings_round_trip(temp_sqlite_db):
+    import numpy as np
+    from matrixcurator.modules.retrieval.repositories.sqlite import (
+        float32_blob,
+        insert_chunks,
+        query_similar_chunks,
+    )
+
+    rng = np.random.default_rng(0)
+    embeddings = rng.standard_normal((3, 3072)).astype(np.float32)
+    chunks = [
+        {
+            "id": f"chunk_{i}",
+            "document_id": "doc_1",
+            "content": f"chunk {i}",
+            "metadata": {},
+            "embedding": embeddings[i],
+        }
+        for i in range(3)
+    ]
+    insert_chunks(chunks)
+
+    assert float32_blob(embeddings[1]) == float32_blob(embeddings[1].tolist())
+    results = query_similar_chunks(embedding=embeddings[1], match_threshold=0.99, match_count=3)
+    assert [result["id"] for result in results] == ["chunk_1"]
+
+
+def test_knn_filters_apply_inside_the_search(temp_sqlite_db):
+    import numpy as np
+    from matrixcurator.modules.retrieval.repositories.sqlite import insert_chunks, query_similar_chunks
+
+    query = np.zeros(3072, dtype=np.float32)
+    query[0] = 1.0
+    near = query.copy()
+    far = query.copy()
+    far[1] = 0.5
+
+    # Ten closer chunks from another document must not crowd out doc_target's chunk
+    chunks = [
+        {"id": f"other_{i}", "document_id": "doc_other", "content": "other",
+         "metadata": {"parser_name": "docling"}, "embedding": near}
+        for i in range(10)
+    ]
+    chunks += [
+        {"id": "target_docling", "document_id": "doc_target", "content": "target docling",
+         "metadata": {"parser_name": "docling"}, "embedding": far},
+        {"id": "target_plain", "document_id": "doc_target", "content": "target plain",
+         "metadata": {}, "embedding": far},
+    ]
+    insert_chunks(chunks)
+
+    results = query_similar_chunks(query, match_threshold=0.5, match_count=2, document_id="doc_target")
+    assert sorted(result["id"] for result in results) == ["target_docling", "target_plain"]
+
+    results = query_similar_chunks(
+        query, match_threshold=0.5, match_count=5, document_id="doc_target", parser_name="docling"
+    )
+    assert [result["id"] for result in results] == ["target_docling"]
+
+    results = query_similar_chunks(query, match_threshold=0.5, match_count=3)
+    assert {result["document_id"] for result in results} == {"doc_other"}
+
+
+def test_vectors_are_copied_from_older_schema_versions(temp_sqlite_db):
+    import numpy as np
+    from sqlalchemy import text
+    from sqlalchemy.orm import Session
+    import matrixcurator.modules.retrieval.repositories.sqlite as sqlite_repository
+
+    # A table written by schema version 1: vectors keyed by id only
+    engine = sqlite_repository.get_engine()
+    old_table = "document_chunks_vec_v1_gemini_gemini_embedding_2_3072"
+    embedding = np.full(3072, 0.1, dtype=np.float32)
+    with Session(engine) as session:
+        session.execute(text(f"CREATE VIRTUAL TABLE {old_table} USING vec0(id TEXT PRIMARY KEY, embedding FLOAT[3072])"))
+        session.execute(text(f"INSERT INTO {old_table} (id, embedding) VALUES ('chunk_1', :emb)"), {"emb": embedding.tobytes()})
+        session.execute(text(
+            "INSERT INTO document_chunks_meta (id, document_id, parser_name, content, metadata_json) "
+            "VALUES ('chunk_1', 'doc_1', NULL, 'migrated', '{}')"
+        ))
+        session.execute(text(
+            "INSERT INTO vector_indexes (table_name, embedding_model, dimension, schema_version) "
+            f"VALUES ('{old_table}', 'gemini/gemini-embedding-2', 3072, 1)"
+        ))
+        session.commit()
+
+    results = sqlite_repository.query_similar_chunks(embedding, match_threshold=0.5, document_id="doc_1")
+    assert sqlite_repository.get_vec_table() != old_table
+    assert [result["content"] for result in results] == ["migrated"]
+
+
+def test_legacy_vector_table_is_migrated_and_deletable(temp_sqlite_db):
+    import numpy as np
+    from sqlalchemy import text
+    from sqlalchemy.orm import Session
+    import matrixcurator.modules.retrieval.repositories.sqlite as sqlite_repository
+
+    # The table created by releases before vector_indexes existed
+    engine = sqlite_repository.get_engine()
+    embedding = np.full(3072, 0.1, dtype=np.float32)
+    with Session(engine) as session:
+        session.execute(text("CREATE VIRTUAL TABLE document_chunks_vec USING vec0(id TEXT PRIMARY KEY, embedding FLOAT[3072])"))
+        session.execute(text("INSERT INTO document_chunks_vec (id, embedding) VALUES ('chunk_1', :emb)"), {"emb": embedding.tobytes()})
+        session.execute(text(
+            "INSERT INTO document_chunks_meta (id, document_id, parser_name, content, metadata_json) "
+            "VALUES ('chunk_1', 'doc_1', NULL, 'legacy', '{}')"
+        ))
+        session.commit()
+
+    results = sqlite_repository.query_similar_chunks(embedding, match_threshold=0.5, document_id="doc_1")
+    assert [result["content"] for result in results] == ["legacy"]
+
+    sqlite_repository.delete_chunks_by_document(["doc_1"])
+    with Session(engine) as session:
+        assert session.execute(text("SELECT COUNT(*) FROM document_chunks_vec")).scalar() == 0
+
+
+def test_legacy_vector_table_with_other_dimension_is_left_alone(temp_sqlite_db, caplog):
+    from sqlalchemy import text
+    from sqlalchemy.orm import Session
+    import matrixcurator.modules.retrieval.repositories.sqlite as sqlite_repository
+
+    engine = sqlite_repository.get_engine()
+    with Session(engine) as session:
+        session.execute(text("CREATE VIRTUAL TABLE document_chunks_vec USING vec0(id TEXT PRIMARY KEY, embedding FLOAT[768])"))
+        session.commit()
+
+    sqlite_repository.get_vec_table()
+
+    assert "Not migrating document_chunks_vec" in caplog.text
+    with Session(engine) as session:
+        assert session.get(sqlite_repository.VectorIndex, "document_chunks_vec") is None
+
+
+def test_match_count_is_clamped_to_the_knn_limit(temp_sqlite_db):
+    from matrixcurator.modules.retrieval.repositories.sqlite import insert_chunks, query_similar_chunks
+
+    embedding = [0.1] * 3072
+    insert_chunks([{"id": "chunk_1", "document_id": "doc_1", "content": "text", "metadata": {}, "embedding": embedding}])
+
+    results = query_similar_chunks(embedding, match_threshold=0.5, match_count=10000)
+
+    assert [result["id"] for result in results] == ["chunk_1"]
@@ -1,13 +1,17 @@
+import fitz
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import AsyncMock, patch, MagicMock
+from docling.exceptions import ConversionError
 from matrixcurator.modules.tools.pymupdf import parse_with_pymupdf
 from matrixcurator.modules.tools.txt import parse_with_txt
+from matrixcurator.modules.tools.hybrid import parse_with_hybrid
 from matrixcurator.modules.tools.re import generate_with_re
-from matrixcurator.modules.tools.docling import parse_with_docling
+from matrixcurator.modules.tools.docling import ConverterPool, contiguous_page_ranges, parse_with_docling
+import matrixcurator.modules.tools.docling as docling_tool
 from matrixcurator.exceptions import DocumentParseError
 
 @pytest.mark.asyncio
-@patch("matrixcurator.modules.tools.pymupdf.fitz.open")
+@patch("matrixcurator.modules.document.repositories.pdf.fitz.open")
 async def test_pymupdf_tool_success(mock_fitz_open):
     mock_doc = MagicMock()
     mock_page1 = MagicMock()
@@ -15,7 +19,8 @@ async def test_pymupdf_tool_success(mock_fitz_open):
     mock_page2 = MagicMock()
     mock_page2.get_text.return_value = "Page 2 text."
     
-    mock_doc.__iter__.return_value = [mock_page1, mock_page2]
+    mock_doc.page_count = 2
+    mock_doc.__getitem__.side_effect = lambda i: [mock_page1, mock_page2][i]
     mock_fitz_open.return_value = mock_doc
     
     content = b"fake pdf content"
@@ -24,12 +29,13 @@ async def test_pymupdf_tool_success(mock_fitz_open):
     
     assert result == "Page 1 text. Page 2 text."
     mock_fitz_open.assert_called_once_with(stream=content, filetype="pdf")
+    mock_doc.close.assert_called_once()
 
 @pytest.mark.asyncio
-@patch("matrixcurator.modules.tools.pymupdf.fitz.open")
+@patch("matrixcurator.modules.document.repositories.pdf.fitz.open")
 async def test_pymupdf_tool_page_filtering(mock_fitz_open):
     mock_doc = MagicMock()
-    mock_doc.__len__.return_value = 3
+    mock_doc.page_count = 3
     
     mock_page1 = MagicMock()
     mock_page1.get_text.return_value = "Page 1 text. "
@@ -48,7 +54,7 @@ async def test_pymupdf_tool_page_filtering(mock_fitz_open):
     assert result == "Page 1 text. Page 3 text."
 
 @pytest.mark.asyncio
-@patch("matrixcurator.modules.tools.pymupdf.fitz.open")
+@patch("matrixcurator.modules.document.repositories.pdf.fitz.open")
 async def test_pymupdf_tool_failure(mock_fitz_open):
     mock_fitz_open.side_effect = Exception("Corrupted PDF")
     content = b"corrupted pdf content"
@@ -58,6 +64,40 @@ async def test_pymupdf_tool_failure(mock_fitz_open):
     
     assert "Failed to parse PDF with PyMuPDF: Corrupted PDF" in str(exc_info.value)
 
+@pytest.mark.asyncio
+@patch("matrixcurator.modules.document.repositories.pdf.fitz.open")
+async def test_pymupdf_tool_by_page(mock_fitz_open):
+    mock_doc = MagicMock()
+    mock_doc.page_count = 3
+    mock_pages = [MagicMock() for _ in range(3)]
+    for i, page in enumerate(mock_pages, start=1):
+        page.get_text.return_value = f"Page {i} text."
+    mock_doc.__getitem__.side_effect = lambda i: mock_pages[i]
+    mock_fitz_open.return_value = mock_doc
+
+    result = await parse_with_pymupdf.ainvoke(
+        {"file_content": b"fake pdf content", "filename": "test.pdf", "pages": [1, 3], "by_page": True}
+    )
+
+    assert result == {
+        "parser": "pymupdf",
+        "pages": [{"page": 1, "content": "Page 1 text."}, {"page": 3, "content": "Page 3 text."}],
+    }
+    mock_fitz_open.assert_called_once()
+
+@pytest.mark.asyncio
+async def test_txt_tool_by_page():
+    result = await parse_with_txt.ainvoke({"file_content": b"Hello world", "filename": "test.txt", "by_page": True})
+    assert result == {"parser": "txt", "pages": [{"page": 1, "content": "Hello world"}]}
+
+@pytest.fixture(autouse=True)
+def reset_docling_pool():
+    docling_tool._pool = None
+    docling_tool._manager = None
+    yield
+    docling_tool._pool = None
+    docling_tool._manager = None
+
 @pytest.mark.asyncio
 async def test_txt_tool_success():
     content = b"Hello world"
@@ -87,6 +127,7 @@ async def test_docling_tool_success(mock_converter_class):
     mock_converter = MagicMock()
     mock_result = MagicMock()
     mock_result.document.export_to_markdown.return_value = "Docling parsed text"
+    mock_result.document.pages = {}
     mock_converter.convert.return_value = mock_result
     mock_converter_class.return_value = mock_converter
     
@@ -116,13 +157,98 @@ async def test_docling_tool_page_filtering(mock_converter_class):
     mock_converter = MagicMock()
     mock_result = MagicMock()
     mock_result.document.export_to_markdown.return_value = "Docling parsed text"
+    mock_result.document.pages = {}
     mock_converter.convert.return_value = mock_result
     mock_converter_class.return_value = mock_converter
     
     content = b"fake doc content"
-    result = await parse_with_docling.ainvoke({"file_content": content, "filename": "test.pdf", "pages": [2, 4]})
+    result = await parse_with_docling.ainvoke({"file_content": content, "filename": "test.pdf", "pages": [2, 4, 3, 9]})
     
-    assert result == "Docling parsed text"
-    mock_converter.convert.assert_called_once()
-    kwargs = mock_converter.convert.call_args.kwargs
-    assert kwargs.get("page_range") == (2, 4)
+    assert result == "Docling parsed text\n\nDocling parsed text"
+    page_ranges = [call.kwargs.get("page_range") for call in mock_converter.convert.call_args_list]
+    assert page_ranges == [(2, 4), (9, 9)]
+    # Both runs share one pooled converter
+    mock_converter_class.assert_called_once()
+
+def test_contiguous_page_ranges():
+    assert contiguous_page_ranges([9, 3, 4, 5, 4]) == [(3, 5), (9, 9)]
+    assert contiguous_page_ranges([1]) == [(1, 1)]
+    assert contiguous_page_ranges([]) == []
+
+def test_converter_pool_reuses_returned_converters():
+    pool = ConverterPool(size=2, factory=MagicMock)
+
+    first = pool.checkout()
+    second = pool.checkout()
+    pool.checkin(first)
+
+    assert first is not second
+    assert pool.checkout() is first
+
+def test_converter_pool_recycles_failed_converters():
+    pool = ConverterPool(size=1, factory=MagicMock)
+
+    with pytest.raises(RuntimeError):
+        with pool.converter() as converter:
+            raise RuntimeError("pipeline crashed")
+
+    assert pool.checkout() is not converter
+
+def test_converter_pool_keeps_converters_on_input_errors():
+    pool = ConverterPool(size=1, factory=MagicMock)
+
+    with pytest.raises(ConversionError):
+        with pool.converter() as converter:
+            raise ConversionError("File format not allowed")
+
+    assert pool.checkout() is converter
+
+def test_converter_pool_recycles_after_max_uses():
+    pool = ConverterPool(size=1, factory=MagicMock, max_uses=2)
+
+    first = pool.checkout()
+    pool.checkin(first)
+    assert pool.checkout() is first
+    pool.checkin(first)
+
+    assert pool.checkout() is not first
+
+def test_converter_pool_warm_failure_frees_the_slot():
+    broken = MagicMock()
+    broken.initialize_pipeline.side_effect = RuntimeError("model download failed")
+    pool = ConverterPool(size=1, factory=MagicMock(side_effect=[broken, MagicMock()]))
+
+    with pytest.raises(RuntimeError):
+        pool.warm()
+
+    assert pool.checkout() is not broken
+
+
+@pytest.mark.asyncio
+async def test_hybrid_tool_sends_only_hard_pages_to_docling():
+    doc = fitz.open()
+    for i in range(1, 4):
+        doc.new_page().insert_text((72, 72), f"Text layer page {i}")
+    content = doc.tobytes()
+    doc.close()
+
+    assessments = [
+        {"page": 1, "needs_vlm": False, "reasons": []},
+        {"page": 2, "needs_vlm": True, "reasons": ["tables"]},
+        {"page": 3, "needs_vlm": False, "reasons": []},
+    ]
+    docling_result = {"parser": "docling", "pages": [{"page": 2, "content": "| VLM table |"}]}
+
+    with patch("matrixcurator.modules.tools.hybrid.assess_text_layer", return_value=assessments), \
+            patch("matrixcurator.modules.tools.hybrid.parse_with_docling") as mock_docling:
+        mock_docling.ainvoke = AsyncMock(return_value=docling_result)
+        result = await parse_with_hybrid.ainvoke({"file_content": content, "filename": "test.pdf", "by_page": True})
+
+    mock_docling.ainvoke.assert_awaited_once()
+    assert mock_docling.ainvoke.call_args.args[0]["pages"] == [2]
+    assert result["parser"] == "hybrid"
+    assert [page["content"].strip() for page in result["pages"]] == [
+        "Text layer page 1",
+        "| VLM table |",
+        "Text layer page 3",
+    ]
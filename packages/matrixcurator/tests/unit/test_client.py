@@ -1,6 +1,8 @@
+import asyncio
 import pytest
 from unittest.mock import patch, AsyncMock
 from matrixcurator.client import MatrixCuratorClient
+from matrixcurator.integrations.context_cache import document_hash
 
 @pytest.fixture
 def client():
@@ -18,7 +20,7 @@ def test_parse_document(mock_capture, mock_parse, client):
     mock_capture.assert_called_once_with("anonymous_user", "document_parsed", properties={"filename": "test.pdf"})
 
 @pytest.mark.asyncio
-@patch("matrixcurator.client.agent_graph.ainvoke", new_callable=AsyncMock)
+@patch("matrixcurator.modules.agent.graph.agent_graph.ainvoke", new_callable=AsyncMock)
 @patch("matrixcurator.client.posthog.capture")
 async def test_extract_characters_success(mock_capture, mock_ainvoke, client):
     mock_ainvoke.return_value = {
@@ -33,6 +35,107 @@ async def test_extract_characters_success(mock_capture, mock_ainvoke, client):
     assert len(result["errors"]) == 0
     mock_capture.assert_called_once()
 
+    initial_state = mock_ainvoke.call_args.args[0]
+    assert "context" not in initial_state
+    assert initial_state["document_id"] == document_hash("context")
+
+@pytest.mark.asyncio
+@patch("matrixcurator.modules.agent.graph.agent_graph.ainvoke", new_callable=AsyncMock)
+@patch("matrixcurator.client.posthog.capture")
+async def test_extract_characters_preserves_order(mock_capture, mock_ainvoke, client):
+    async def fake_ainvoke(state, config):
+        idx = state["character_index"]
+        # Later indices finish first
+        await asyncio.sleep(0.01 * (4 - idx))
+        return {"extracted_data": {"character_index": idx}, "errors": [f"warn {idx}"]}
+
+    mock_ainvoke.side_effect = fake_ainvoke
+
+    result = await client.extract_characters("context", [1, 2, 3], max_concurrency=3)
+
+    assert [s["character_index"] for s in result["extracted_states"]] == [1, 2, 3]
+    assert result["errors"] == ["warn 1", "warn 2", "warn 3"]
+
+@pytest.mark.asyncio
+@patch("matrixcurator.modules.agent.graph.agent_graph.ainvoke", new_callable=AsyncMock)
+@patch("matrixcurator.client.posthog.capture")
+async def test_extract_characters_bounded_concurrency(mock_capture, mock_ainvoke, client):
+    in_flight = 0
+    peak = 0
+
+    async def fake_ainvoke(state, config):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return {"extracted_data": {"character_index": state["character_index"]}, "errors": []}
+
+    mock_ainvoke.side_effect = fake_ainvoke
+
+    result = await client.extract_characters("context", list(range(1, 11)), max_concurrency=2)
+
+    assert len(result["extracted_states"]) == 10
+    assert peak == 2
+
+@pytest.mark.asyncio
+@patch("matrixcurator.modules.agent.graph.agent_graph.ainvoke", new_callable=AsyncMock)
+@patch("matrixcurator.client.posthog.capture")
+async def test_extract_characters_gathers_failures(mock_capture, mock_ainvoke, client):
+    async def fake_ainvoke(state, config):
+        if state["character_index"] == 2:
+            raise RuntimeError("LLM down")
+        return {"extracted_data": {"character_index": state["character_index"]}, "errors": []}
+
+    mock_ainvoke.side_effect = fake_ainvoke
+
+    result = await client.extract_characters("context", [1, 2, 3])
+
+    assert [s["character_index"] for s in result["extracted_states"]] == [1, 3]
+    assert result["errors"] == ["Failed to extract character 2: LLM down"]
+
+@pytest.mark.asyncio
+@patch("matrixcurator.modules.agent.graph.batch_agent_graph.ainvoke", new_callable=AsyncMock)
+@patch("matrixcurator.modules.agent.graph.agent_graph.ainvoke", new_callable=AsyncMock)
+@patch("matrixcurator.client.posthog.capture")
+async def test_extract_characters_batch_mode_retries_missing(mock_capture, mock_ainvoke, mock_batch_ainvoke, client):
+    async def fake_batch_ainvoke(state, config):
+        # Index 2 comes back missing from each block
+        accepted = [{"character_index": idx} for idx in state["character_indices"] if idx != 2]
+        return {"accepted": accepted}
+
+    mock_batch_ainvoke.side_effect = fake_batch_ainvoke
+    mock_ainvoke.return_value = {"extracted_data": {"character_index": 2}, "errors": []}
+
+    result = await client.extract_characters("context", [1, 2, 3, 4], batch_size=2)
+
+    assert [s["character_index"] for s in result["extracted_states"]] == [1, 2, 3, 4]
+    assert mock_batch_ainvoke.await_count == 2
+    mock_ainvoke.assert_awaited_once()
+    assert mock_ainvoke.call_args.args[0]["character_index"] == 2
+
+@pytest.mark.asyncio
+@patch("matrixcurator.modules.agent.graph.agent_graph.astream")
+@patch("matrixcurator.client.posthog.capture")
+async def test_stream_characters_yields_as_completed(mock_capture, mock_astream, client):
+    def fake_astream(state, config, stream_mode):
+        idx = state["character_index"]
+
+        async def _gen():
+            await asyncio.sleep(0.01 * (3 - idx))
+            yield {"character_index": idx, "attempts": 0}
+            yield {"character_index": idx, "extracted_data": {"character_index": idx}, "evaluation_score": 10, "errors": []}
+
+        return _gen()
+
+    mock_astream.side_effect = fake_astream
+
+    events = [event async for event in client.stream_characters("context", [1, 2])]
+
+    assert [e["character_index"] for e in events] == [2, 1]
+    assert events[0]["extracted_data"] == {"character_index": 2}
+    assert events[0]["evaluation_score"] == 10
+
 @patch("matrixcurator.client.generate_document")
 @patch("matrixcurator.client.posthog.capture")
 def test_generate_nexus(mock_capture, mock_generate, client):
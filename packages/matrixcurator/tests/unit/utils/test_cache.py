@@ -0,0 +1,53 @@
+from matrixcurator.utils.cache import SQLiteCache
+
+
+def test_sqlite_cache_hit_and_miss(tmp_path) -> None:
+    cache = SQLiteCache(str(tmp_path / "cache.sqlite"))
+
+    assert cache.get("missing") is None
+    cache.set("key", b"value")
+    assert cache.get("key") == b"value"
+
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["entries"] == 1
+
+
+def test_sqlite_cache_persists_across_instances(tmp_path) -> None:
+    path = str(tmp_path / "cache.sqlite")
+    cache = SQLiteCache(path)
+    cache.set("key", b"value")
+    cache.close()
+
+    assert SQLiteCache(path).get("key") == b"value"
+
+
+def test_sqlite_cache_evicts_least_recently_used(tmp_path) -> None:
+    cache = SQLiteCache(str(tmp_path / "cache.sqlite"), max_bytes=20)
+
+    cache.set("a", b"0" * 8)
+    cache.set("b", b"1" * 8)
+    # Touch "a" so that "b" becomes the least recently used entry
+    assert cache.get("a") is not None
+    cache.set("c", b"2" * 8)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == b"0" * 8
+    assert cache.get("c") == b"2" * 8
+    assert cache.stats()["size_bytes"] <= 20
+
+
+def test_sqlite_cache_batch_get_and_set(tmp_path) -> None:
+    cache = SQLiteCache(str(tmp_path / "cache.sqlite"), max_bytes=20)
+
+    cache.set_many({"a": b"0" * 8, "b": b"1" * 8, "too big": b"2" * 40})
+    assert cache.get_many(["a", "b", "missing"]) == {"a": b"0" * 8, "b": b"1" * 8}
+
+    # One eviction pass after the whole batch keeps the store within budget
+    cache.set_many({"c": b"3" * 8, "d": b"4" * 8})
+    assert cache.get_many(["a", "b", "c", "d"]) == {"c": b"3" * 8, "d": b"4" * 8}
+
+    stats = cache.stats()
+    assert stats["hits"] == 4
+    assert stats["misses"] == 3
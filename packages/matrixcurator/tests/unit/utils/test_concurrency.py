@@ -3,7 +3,14 @@ import time
 from unittest.mock import patch
 
 import pytest
-from matrixcurator.utils.concurrency import AsyncConcurrencyManager, AsyncRateLimiter, RateLimitConfig
+from matrixcurator.utils.concurrency import (
+    AdaptiveConcurrencyLimiter,
+    AsyncConcurrencyManager,
+    AsyncRateLimiter,
+    RateLimitConfig,
+    SharedRateLimiter,
+    TokenBucket,
+)
 
 
 def test_async_rate_limiter_max_concurrency() -> None:
@@ -99,6 +106,64 @@ async def test_async_rate_limiter_multi_tier() -> None:
             assert sum(sleeps) == 60.0
 
 
+@pytest.mark.asyncio
+async def test_async_rate_limiter_wakes_waiters_in_fifo_order() -> None:
+    limiter = AsyncRateLimiter(max_calls=1, time_period=0.01)
+    order = []
+
+    async def worker(i: int) -> None:
+        await limiter.acquire()
+        order.append(i)
+
+    await asyncio.gather(*(worker(i) for i in range(10)))
+
+    assert order == list(range(10))
+
+
+def test_async_rate_limiter_keeps_one_slot_per_allowed_call() -> None:
+    limiter = AsyncRateLimiter(settings=RateLimitConfig(per_second=1000, per_hour=5000))
+
+    for _ in range(20000):
+        limiter.reserve()
+
+    # History is bounded by each limit, not by the number of calls made
+    assert [len(slots) for slots in limiter._slots] == [1000, 5000]
+
+
+def test_shared_rate_limiter_budget_spans_instances(tmp_path) -> None:
+    # Separate instances on one file stand in for separate worker processes
+    path = str(tmp_path / "rate_limits.sqlite")
+    first = SharedRateLimiter("docling", path, max_calls=2, time_period=10.0)
+    second = SharedRateLimiter("docling", path, max_calls=2, time_period=10.0)
+    other = SharedRateLimiter("pymupdf", path, max_calls=2, time_period=10.0)
+
+    assert first.reserve() == 0.0
+    assert second.reserve() == 0.0
+    # The shared budget of 2 per 10s is used up
+    assert first.reserve() == pytest.approx(10.0, abs=0.5)
+    # Budgets are per name
+    assert other.reserve() == 0.0
+
+    for limiter in (first, second, other):
+        limiter.close()
+
+
+@pytest.mark.asyncio
+async def test_shared_rate_limiter_plugs_into_concurrency_manager(tmp_path) -> None:
+    limiter = SharedRateLimiter("txt", str(tmp_path / "rate_limits.sqlite"), max_calls=1, time_period=0.1)
+    manager = AsyncConcurrencyManager(max_concurrent=2, rate_limiter=limiter)
+
+    async def worker() -> None:
+        async with manager:
+            pass
+
+    start_time = time.monotonic()
+    await asyncio.gather(worker(), worker())
+
+    assert time.monotonic() - start_time >= 0.09
+    limiter.close()
+
+
 @pytest.mark.asyncio
 async def test_async_concurrency_manager_auto_infer_concurrency() -> None:
     config = RateLimitConfig(per_minute=120)
@@ -145,3 +210,53 @@ async def test_async_concurrency_manager_with_rate_limiter() -> None:
     
     elapsed = time.monotonic() - start_time
     assert elapsed >= 0.1
+
+
+def test_token_bucket_reserve_returns_wait_time() -> None:
+    bucket = TokenBucket(rate=10, capacity=2)
+
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == 0.0
+    # The bucket is empty: the next token refills in 1/10s, the one after in 2/10s
+    assert bucket.reserve() == pytest.approx(0.1, abs=0.01)
+    assert bucket.reserve() == pytest.approx(0.2, abs=0.01)
+
+
+def test_token_bucket_from_config_uses_strictest_rate() -> None:
+    assert TokenBucket.from_config(RateLimitConfig()) is None
+
+    bucket = TokenBucket.from_config(RateLimitConfig(per_second=50, per_minute=120))
+    assert bucket.rate == 2
+
+
+def test_adaptive_concurrency_limiter_halves_and_recovers() -> None:
+    limiter = AdaptiveConcurrencyLimiter(maximum=8, cooldown=60)
+
+    limiter.record_throttle()
+    assert limiter.limit == 4
+    # A second 429 from the same burst does not shrink the limit again
+    limiter.record_throttle()
+    assert limiter.limit == 4
+
+    for _ in range(4):
+        limiter.record_success()
+    assert limiter.limit == 5
+
+
+@pytest.mark.asyncio
+async def test_adaptive_concurrency_limiter_bounds_in_flight() -> None:
+    limiter = AdaptiveConcurrencyLimiter(maximum=2)
+    in_flight = 0
+    max_in_flight = 0
+
+    async def task() -> None:
+        nonlocal in_flight, max_in_flight
+        async with limiter.aslot():
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+
+    await asyncio.gather(*(task() for _ in range(6)))
+
+    assert max_in_flight == 2